@@ -0,0 +1,66 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Awaitable variants of the Watcher API wrappers, for async views.
+
+Every public classmethod of the :mod:`watcher_dashboard.api.watcher`
+resources has an awaitable counterpart here, taking the same arguments,
+so that an async view can wait on several Watcher calls at once::
+
+    audit, action_plans = await asyncio.gather(
+        aio.Audit.get(request, audit_uuid),
+        aio.ActionPlan.list(request, audit=audit_uuid),
+    )
+
+The calls go through the blocking wrappers, and so share their Watcher
+client pool, microversion negotiation, caches and instrumentation. They
+run on the pool of :mod:`watcher_dashboard.common.concurrency`, see
+:func:`~watcher_dashboard.common.concurrency.run_async`: the event loop
+is never blocked, and the number of threads waiting on Watcher stays
+bounded by ``WATCHER_FAN_OUT_MAX_WORKERS``.
+"""
+
+import functools
+
+from watcher_dashboard.api import watcher
+from watcher_dashboard.common import concurrency
+
+
+class _AsyncResource:
+    """Awaitable proxy of the classmethods of an API resource."""
+
+    def __init__(self, resource):
+        self._resource = resource
+
+    def __getattr__(self, name):
+        func = getattr(self._resource, name)
+        if name.startswith('_') or not callable(func):
+            raise AttributeError(name)
+
+        @functools.wraps(func)
+        async def call(request, *args, **kwargs):
+            return await concurrency.run_async(
+                request, functools.partial(func, request, *args, **kwargs)
+            )
+
+        return call
+
+    def __repr__(self):
+        return f'<async {self._resource.__name__}>'
+
+
+Audit = _AsyncResource(watcher.Audit)
+AuditTemplate = _AsyncResource(watcher.AuditTemplate)
+ActionPlan = _AsyncResource(watcher.ActionPlan)
+Action = _AsyncResource(watcher.Action)
+Goal = _AsyncResource(watcher.Goal)
+Strategy = _AsyncResource(watcher.Strategy)
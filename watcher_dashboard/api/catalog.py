@@ -0,0 +1,287 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Cache of the Watcher goals and strategies, the "catalog".
+
+Goals and strategies are loaded by Watcher when its services start and
+almost never change, so the full lists are kept in the Django cache
+framework, which lets every worker process share them. Entries are
+partitioned by Watcher endpoint.
+
+An entry is fresh for ``WATCHER_CATALOG_CACHE_TTL`` seconds. A stale entry
+is still served for as long again while a single background refresh
+replaces it, so that users don't wait on the Watcher API; the catalog is
+also warmed up in the background when a user logs in. Calling
+:func:`invalidate` drops every entry of an endpoint at once.
+"""
+
+import hashlib
+import logging
+import time
+
+from django import dispatch
+from django.contrib.auth import signals as auth_signals
+from django.core import cache as django_cache
+from openstack_dashboard.api import base
+
+from watcher_dashboard import config
+from watcher_dashboard.common import client as common_client
+from watcher_dashboard.common import concurrency
+from watcher_dashboard.common import metrics
+
+
+LOG = logging.getLogger(__name__)
+
+CACHE_PREFIX = 'watcher-dashboard:catalog'
+
+# How long, in seconds, a background refresh may take before another one
+# is allowed to start.
+REFRESH_LOCK_TIMEOUT = 60
+
+GOALS = 'goals'
+STRATEGIES = 'strategies'
+TEMPLATE_PARAMETERS = 'template-parameters'
+AUDIT_TEMPLATES = 'audit-templates'
+LATEST_ACTION_PLANS = 'latest-action-plan'
+ACTION_PLAN_AUDITS = 'action-plan-audit'
+ACTION_PLAN_GRAPHS = 'action-plan-graph'
+
+
+def _get_cache():
+    return django_cache.caches[config.get_catalog_cache_alias()]
+
+
+def _get_partition(request):
+    endpoint = base.url_for(request, common_client.WATCHER_SERVICE)
+    return hashlib.sha256(endpoint.encode('utf-8')).hexdigest()[:32]
+
+
+def _get_generation(cache, partition):
+    key = f'{CACHE_PREFIX}:{partition}:generation'
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, 1, timeout=None)
+        generation = cache.get(key, 1)
+    return generation
+
+
+def get_version(request, name, item_id=None):
+    """Return a string identifying a cached collection or item.
+
+    It changes whenever the entry is refreshed, forgotten or invalidated,
+    which makes it suitable for HTTP validators such as ETags.
+
+    :returns: The version, or ``None`` if the entry is not cached.
+    """
+    if not config.get_catalog_cache_ttl():
+        return None
+    cache = _get_cache()
+    parts = (name,) if item_id is None else (name, item_id)
+    key = _get_key(cache, request, *parts)
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    return hashlib.sha256(f'{key}:{entry[1]}'.encode()).hexdigest()
+
+
+def invalidate(request):
+    """Drop every cached goal and strategy of the request's endpoint."""
+    cache = _get_cache()
+    partition = _get_partition(request)
+    key = f'{CACHE_PREFIX}:{partition}:generation'
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _get_generation(cache, partition) + 1, timeout=None)
+
+
+def _get_key(cache, request, *parts):
+    partition = _get_partition(request)
+    generation = _get_generation(cache, partition)
+    return ':'.join((CACHE_PREFIX, partition, str(generation)) + parts)
+
+
+def to_dict(resource):
+    """Return the attributes of a watcherclient ``resource``."""
+    if hasattr(resource, 'to_dict'):
+        return resource.to_dict()
+    return dict(resource)
+
+
+def _fetch(fetch):
+    return [to_dict(resource) for resource in fetch()]
+
+
+def get(request, name, fetch, ttl=None):
+    """Return the cached ``name`` collection as a list of dicts.
+
+    :param request: The Django request the collection is needed for.
+    :param name: The collection, :data:`GOALS` or :data:`STRATEGIES`.
+    :param fetch: Called without argument to list the collection from the
+        Watcher API on a cache miss or refresh.
+    :param ttl: How long the collection is fresh, in seconds, defaults to
+        ``WATCHER_CATALOG_CACHE_TTL``; ``0`` disables the cache.
+    """
+    if ttl is None:
+        ttl = config.get_catalog_cache_ttl()
+    if not ttl:
+        return _fetch(fetch)
+
+    cache = _get_cache()
+    key = _get_key(cache, request, name)
+
+    entry = cache.get(key)
+    if entry is None:
+        LOG.debug("Watcher catalog miss for %s", name)
+        metrics.CACHE_LOOKUPS.inc(cache='catalog', result='miss')
+        items = _fetch(fetch)
+        cache.set(key, (items, time.time()), timeout=2 * ttl)
+        return items
+
+    items, fetched_at = entry
+    if time.time() - fetched_at <= ttl:
+        metrics.CACHE_LOOKUPS.inc(cache='catalog', result='hit')
+    else:
+        metrics.CACHE_LOOKUPS.inc(cache='catalog', result='stale')
+        if cache.add(f'{key}:refresh', True, timeout=REFRESH_LOCK_TIMEOUT):
+            concurrency.submit(lambda: _refresh(cache, key, fetch, ttl))
+    return items
+
+
+def forget(request, name):
+    """Drop the cached ``name`` collection of the request's endpoint."""
+    cache = _get_cache()
+    cache.delete(_get_key(cache, request, name))
+
+
+def _refresh(cache, key, fetch, ttl):
+    try:
+        cache.set(key, (_fetch(fetch), time.time()), timeout=2 * ttl)
+    except Exception:
+        LOG.exception("Unable to refresh the Watcher catalog")
+    finally:
+        cache.delete(f'{key}:refresh')
+
+
+def get_item(request, name, item_id, compute):
+    """Return the value cached for ``item_id`` in the ``name`` namespace.
+
+    Unlike the collections returned by :func:`get`, these values are
+    derived by the dashboard itself and are simply recomputed once expired.
+
+    :param compute: Called without argument on a cache miss; it must return
+        a picklable value.
+    """
+    ttl = config.get_catalog_cache_ttl()
+    if not ttl:
+        return compute()
+
+    cache = _get_cache()
+    key = _get_key(cache, request, name, item_id)
+    entry = cache.get(key)
+    if entry is None:
+        metrics.CACHE_LOOKUPS.inc(cache='catalog-items', result='miss')
+        entry = (compute(), time.time())
+        cache.set(key, entry, timeout=ttl)
+    else:
+        metrics.CACHE_LOOKUPS.inc(cache='catalog-items', result='hit')
+    return entry[0]
+
+
+def forget_item(request, name, item_id):
+    """Drop the value cached for ``item_id`` in the ``name`` namespace."""
+    if config.get_catalog_cache_ttl():
+        cache = _get_cache()
+        cache.delete(_get_key(cache, request, name, item_id))
+
+
+def get_items(request, name, item_ids):
+    """Return the values cached for ``item_ids`` in the ``name`` namespace.
+
+    :returns: A ``{item_id: value}`` dict of the cached items only.
+    """
+    if not config.get_catalog_cache_ttl():
+        return {}
+    cache = _get_cache()
+    prefix = _get_key(cache, request, name)
+    keys = {f'{prefix}:{item_id}': item_id for item_id in item_ids}
+    return {keys[key]: entry[0] for key, entry in cache.get_many(keys).items()}
+
+
+def set_items(request, name, values):
+    """Cache the ``{item_id: value}`` ``values`` in the ``name`` namespace.
+
+    Unlike :func:`get_item`, the values are not computed by the catalog:
+    they are recorded from data the dashboard fetched anyway.
+    """
+    ttl = config.get_catalog_cache_ttl()
+    if not ttl or not values:
+        return
+    cache = _get_cache()
+    prefix = _get_key(cache, request, name)
+    now = time.time()
+    cache.set_many(
+        {
+            f'{prefix}:{item_id}': (value, now)
+            for item_id, value in values.items()
+        },
+        timeout=ttl,
+    )
+
+
+def select(
+    items, goal=None, marker=None, limit=None, sort_key=None, sort_dir=None
+):
+    """Apply the Watcher API list filters to cached ``items``.
+
+    :param goal: Keep the strategies of this goal, given by UUID or name.
+    :param marker: UUID of the item preceding the returned ones.
+    :param limit: Maximum number of items to return, ``0`` for all.
+    :param sort_key: Attribute to sort on; the API order is kept if unset.
+    :param sort_dir: ``'asc'`` (default) or ``'desc'``.
+    """
+    if goal is not None:
+        items = [
+            item
+            for item in items
+            if goal in (item.get('goal_uuid'), item.get('goal_name'))
+        ]
+    if sort_key:
+        items = sorted(
+            items,
+            key=lambda item: (item.get(sort_key) is None, item.get(sort_key)),
+            reverse=sort_dir == 'desc',
+        )
+    if marker is not None:
+        uuids = [item.get('uuid') for item in items]
+        if marker in uuids:
+            items = items[uuids.index(marker) + 1 :]
+    if limit:
+        items = items[:limit]
+    return list(items)
+
+
+@dispatch.receiver(auth_signals.user_logged_in)
+def _warm_up(sender, request, user, **kwargs):
+    """Fill the catalog of the new user's endpoint in the background."""
+    # Imported here as the API module depends on this one.
+    from watcher_dashboard.api import watcher
+
+    def warm_up():
+        try:
+            watcher.Goal.list(request)
+            watcher.Strategy.list(request)
+        except Exception:
+            LOG.debug("Unable to warm up the Watcher catalog", exc_info=True)
+
+    if config.get_catalog_cache_ttl():
+        concurrency.submit(warm_up)
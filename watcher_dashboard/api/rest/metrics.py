@@ -0,0 +1,39 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Metrics of the Watcher panels, for Prometheus to scrape."""
+
+from django import http
+from django.views import generic
+from openstack_dashboard.api.rest import urls
+
+from watcher_dashboard import config
+from watcher_dashboard.common import metrics
+
+
+@urls.register
+class Metrics(generic.View):
+    """Serve :mod:`watcher_dashboard.common.metrics` in text format.
+
+    Scrapers have no Horizon session, so the endpoint does not require a
+    login; it is only served when ``WATCHER_METRICS_ENABLED`` is set and
+    should be restricted to the scrapers by the web server.
+    """
+
+    url_regex = r'watcher/metrics/$'
+
+    def get(self, request):
+        if not config.get_metrics_enabled():
+            raise http.Http404()
+        return http.HttpResponse(
+            metrics.render(), content_type=metrics.CONTENT_TYPE
+        )
@@ -10,20 +10,31 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import functools
 import logging
 
 from django.utils.translation import gettext_lazy as _
+from horizon.utils import functions as utils
 from openstack_dashboard.api import base
 from watcherclient.common.apiclient import exceptions as wc_exc
 
 from watcher_dashboard import config
+from watcher_dashboard.api import catalog
 from watcher_dashboard.common import client as common_client
+from watcher_dashboard.common import concurrency
 from watcher_dashboard.common import exceptions as watcher_exc
+from watcher_dashboard.common import instrumentation
+from watcher_dashboard.common import metrics
+from watcher_dashboard.common import rows
 from watcher_dashboard.utils import errors as errors_utils
 
 
 LOG = logging.getLogger(__name__)
 
+# Request attributes holding the per-request memo and its counters
+_MEMO_ATTR = '_watcher_api_memo'
+_MEMO_STATS_ATTR = '_watcher_api_memo_stats'
+
 
 def watcherclient(request, api_version=None):
     insert_watcher_policy_file()
@@ -41,7 +52,246 @@ def watcherclient(request, api_version=None):
 
     # Prefer centralized client helper
     client = common_client.get_client(request, required=microversion)
-    return client
+    return instrumentation.InstrumentedClient(client, request, api_version)
+
+
+def _refresh_version_on_error(func):
+    """Forget the cached max microversion when the server rejects it.
+
+    Wraps API methods taking a ``request`` argument right after ``cls``;
+    the exception is re-raised unchanged.
+    """
+
+    @functools.wraps(func)
+    def wrapper(cls, request, *args, **kwargs):
+        try:
+            return func(cls, request, *args, **kwargs)
+        except common_client.VERSION_ERRORS:
+            common_client.invalidate_max_version(request)
+            raise
+
+    return wrapper
+
+
+def _memoize_per_request(func):
+    """Reuse the result of identical read calls made within one request.
+
+    Views often need the same resource several times, e.g. for their
+    context and for their tabs; with this memo the later calls are
+    answered from the request instead of hitting the Watcher API again.
+    Failed calls are not memoized, and :func:`_invalidate_request_memo`
+    clears the memo after any write.
+    """
+
+    @functools.wraps(func)
+    def wrapper(cls, request, *args, **kwargs):
+        key = (
+            cls.__name__,
+            func.__name__,
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        try:
+            hash(key)
+            memo = request.__dict__.setdefault(_MEMO_ATTR, {})
+        except (TypeError, AttributeError):
+            return func(cls, request, *args, **kwargs)
+        if key in memo:
+            metrics.CACHE_LOOKUPS.inc(cache='request-memo', result='hit')
+            stats = request.__dict__.setdefault(_MEMO_STATS_ATTR, {})
+            stats['avoided'] = stats.get('avoided', 0) + 1
+            LOG.debug(
+                'Reused %s.%s result within the request (%d duplicate '
+                'calls avoided so far)',
+                cls.__name__,
+                func.__name__,
+                stats['avoided'],
+            )
+            return memo[key]
+        metrics.CACHE_LOOKUPS.inc(cache='request-memo', result='miss')
+        result = memo[key] = func(cls, request, *args, **kwargs)
+        return result
+
+    return wrapper
+
+
+def _invalidate_request_memo(func):
+    """Clear the request memo once a write call returns or fails."""
+
+    @functools.wraps(func)
+    def wrapper(cls, request, *args, **kwargs):
+        try:
+            return func(cls, request, *args, **kwargs)
+        finally:
+            getattr(request, '__dict__', {}).pop(_MEMO_ATTR, None)
+
+    return wrapper
+
+
+def get_request_memo_stats(request):
+    """Return how many duplicate Watcher calls the request memo avoided."""
+    stats = getattr(request, _MEMO_STATS_ATTR, {})
+    return {'avoided': stats.get('avoided', 0)}
+
+
+def update_pagination(entities, page_size, marker, sort_dir):
+    """Trim a page fetched with ``limit=page_size + 1``.
+
+    :returns: a ``(entities, has_more_data, has_prev_data)`` tuple where
+        ``entities`` is in display order.
+    """
+    has_more_data, has_prev_data = False, False
+    if len(entities) > page_size:
+        has_more_data = True
+        entities.pop()
+        if marker is not None:
+            has_prev_data = True
+    # first page condition when reached via prev back
+    elif sort_dir == 'asc' and marker is not None:
+        has_more_data = True
+    # last page condition
+    elif marker is not None:
+        has_prev_data = True
+
+    if sort_dir == 'asc':
+        entities.reverse()
+
+    return entities, has_more_data, has_prev_data
+
+
+def _list_paged(
+    list_func, request, marker, paginate, sort_dir, select=None, **filters
+):
+    if not paginate:
+        entities = list_func(request, **filters)
+        if select is not None:
+            entities = select(entities)
+        return entities, False, False
+
+    page_size = utils.get_page_size(request)
+    entities = []
+    next_marker = marker
+    while True:
+        # Copy the result: it may be shared through the request memo.
+        page = list(
+            list_func(
+                request,
+                limit=page_size + 1,
+                marker=next_marker,
+                sort_key='created_at',
+                sort_dir=sort_dir,
+                **filters,
+            )
+        )
+        entities.extend(page if select is None else select(page))
+        if (
+            select is None
+            or len(entities) > page_size
+            or len(page) <= page_size
+        ):
+            break
+        # Some resources were filtered out: fill the page with the next
+        # ones.
+        next_marker = page[-1].uuid
+    return update_pagination(
+        entities[: page_size + 1], page_size, marker, sort_dir
+    )
+
+
+def _iter_pages(request, manager, page_size, api_version=None, **filters):
+    """Yield every resource of a collection, fetching one page at a time.
+
+    Unlike ``list``, the pages are not memoized per request, so at most one
+    page of resources is held at once however large the collection.
+    """
+    marker = None
+    while True:
+        client = watcherclient(request, api_version=api_version)
+        page = getattr(client, manager).list(
+            detail=True,
+            limit=page_size,
+            marker=marker,
+            sort_key='created_at',
+            sort_dir='asc',
+            **filters,
+        )
+        yield from page
+        if len(page) < page_size:
+            return
+        marker = page[-1].uuid
+
+
+def _get_many(cls, request, uuids, groups=()):
+    """Return the resources matching ``uuids``, keyed by UUID.
+
+    The Watcher API cannot filter a collection on UUIDs: each of the
+    ``(filters, group_uuids)`` ``groups`` is listed with a single call
+    narrowed down by ``filters``, typically the parent of ``group_uuids``.
+    The other UUIDs, and those the listings did not return, are fetched
+    one by one.  Calls run concurrently, at most
+    ``WATCHER_FAN_OUT_MAX_WORKERS`` at once.
+
+    UUIDs matching no resource are left out of the result; any other error
+    is raised.
+    """
+    uuids = list(dict.fromkeys(uuids))
+    max_workers = config.get_fan_out_max_workers()
+    grouped = dict.fromkeys(
+        uuid for _filters, group in groups for uuid in group
+    )
+
+    def get_calls(missing):
+        return [
+            functools.partial(cls.get, request, uuid, _error_handle=False)
+            for uuid in missing
+        ]
+
+    singles = [uuid for uuid in uuids if uuid not in grouped]
+    wanted = set(uuids)
+    results = concurrency.run_bounded(
+        request,
+        [
+            functools.partial(cls.list, request, limit=0, **filters)
+            for filters, _group in groups
+        ]
+        + get_calls(singles),
+        max_workers,
+    )
+    found = {}
+    for result in results[: len(groups)]:
+        for resource in result.result():
+            if resource.uuid in wanted:
+                found[resource.uuid] = resource
+
+    stragglers = [uuid for uuid in grouped if uuid not in found]
+    if stragglers:
+        LOG.debug(
+            "Fetching %d %s resources missing from their listing",
+            len(stragglers),
+            cls.__name__,
+        )
+    for uuid, result in zip(
+        singles + stragglers,
+        results[len(groups) :]
+        + concurrency.run_bounded(request, get_calls(stragglers), max_workers),
+    ):
+        try:
+            found[uuid] = result.result()
+        except wc_exc.NotFound:
+            LOG.debug("No %s matches %s", cls.__name__, uuid)
+    return found
+
+
+def _project(cls, request, resources, fields):
+    """Return ``resources`` as compact rows when ``fields`` is given.
+
+    Large tables only need a few attributes of each resource; the others
+    are loaded with ``cls.get`` on first access, see
+    :mod:`watcher_dashboard.common.rows`.
+    """
+    if fields is None:
+        return resources
+    return rows.project(resources, fields, functools.partial(cls.get, request))
 
 
 def insert_watcher_policy_file() -> None:
@@ -75,6 +325,8 @@ class Audit(base.APIDictWrapper):
         self._request = request
 
     @classmethod
+    @_invalidate_request_memo
+    @_refresh_version_on_error
     def create(
         cls,
         request,
@@ -134,6 +386,8 @@ class Audit(base.APIDictWrapper):
         return client.audit.create(**payload)
 
     @classmethod
+    @_memoize_per_request
+    @_refresh_version_on_error
     def list(cls, request, api_version=None, **filters):
         """Return a list of audits in Watcher.
 
@@ -151,8 +405,85 @@ class Audit(base.APIDictWrapper):
             detail=True, **filters
         )
 
+    @classmethod
+    def list_paged(
+        cls,
+        request,
+        marker=None,
+        paginate=False,
+        sort_dir='desc',
+        select=None,
+        **filters,
+    ):
+        """Return one page of audits in Watcher.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param marker: UUID of the last audit of the previous page
+        :type  marker: str or None
+        :param paginate: whether to return a single page of
+                         ``API_RESULT_PAGE_SIZE`` audits
+        :type  paginate: bool
+        :param sort_dir: ``'desc'`` to page forward, ``'asc'`` to page back
+        :type  sort_dir: str
+        :param select: called with each list of fetched audits to return
+                       those to show, in which case audits are fetched
+                       until the page is full
+        :type  select: callable or None
+        :param filters: key/value kwargs used as filters
+        :type  filters: dict
+
+        :return: a ``(audits, has_more_data, has_prev_data)`` tuple
+        :rtype:  tuple
+        """
+        return _list_paged(
+            cls.list, request, marker, paginate, sort_dir, select, **filters
+        )
+
+    @classmethod
+    def iter_all(cls, request, page_size, api_version=None, **filters):
+        """Yield every audit in Watcher, oldest first.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param page_size: number of audits fetched per API call
+        :type  page_size: int
+        :param api_version: Microversion to use for the requests.
+        :type  api_version: str or None
+        :param filters: key/value kwargs used as filters
+        :type  filters: dict
+
+        :return: generator of audits
+        :rtype:  generator
+        """
+        yield from _iter_pages(
+            request, 'audit', page_size, api_version=api_version, **filters
+        )
+
+    @classmethod
+    def get_many(cls, request, uuids, **filters):
+        """Return the audits matching ``uuids``, with few API calls.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param uuids: UUIDs of the audits
+        :type  uuids: list of str
+        :param filters: key/value kwargs narrowing down a single list call
+                        expected to return the audits, e.g. ``goal``;
+                        the audits are fetched one by one otherwise
+        :type  filters: dict
+
+        :return: the audits found, keyed by UUID
+        :rtype:  dict
+        """
+        return _get_many(
+            cls, request, uuids, [(filters, uuids)] if filters else ()
+        )
+
     @classmethod
     @errors_utils.handle_errors(_("Unable to retrieve audit"))
+    @_memoize_per_request
+    @_refresh_version_on_error
     def get(cls, request, audit_id, api_version=None):
         """Return the audit that matches the ID.
 
@@ -172,6 +503,7 @@ class Audit(base.APIDictWrapper):
         )
 
     @classmethod
+    @_invalidate_request_memo
     def delete(cls, request, audit_id):
         """Delete an audit
 
@@ -184,6 +516,7 @@ class Audit(base.APIDictWrapper):
         return watcherclient(request).audit.delete(audit=audit_id)
 
     @classmethod
+    @_invalidate_request_memo
     def cancel(cls, request, audit_id):
         """Cancel an audit
 
@@ -225,6 +558,7 @@ class AuditTemplate(base.APIDictWrapper):
         self._request = request
 
     @classmethod
+    @_invalidate_request_memo
     def create(cls, request, name, goal, strategy, description, scope):
         """Create an audit template in Watcher
 
@@ -260,10 +594,12 @@ class AuditTemplate(base.APIDictWrapper):
             description=description,
             scope=scope,
         )
+        catalog.forget(request, catalog.AUDIT_TEMPLATES)
 
         return audit_template
 
     @classmethod
+    @_invalidate_request_memo
     def patch(cls, request, audit_template_id, parameters):
         """Update an audit in Watcher
 
@@ -286,9 +622,13 @@ class AuditTemplate(base.APIDictWrapper):
         audit_template = watcherclient(request).audit_template.patch(
             audit_template_id, parameter_list
         )
+        catalog.forget_item(
+            request, catalog.TEMPLATE_PARAMETERS, audit_template_id
+        )
         return audit_template
 
     @classmethod
+    @_memoize_per_request
     def list(cls, request, **filters):
         """Return a list of audit templates in Watcher
 
@@ -305,8 +645,101 @@ class AuditTemplate(base.APIDictWrapper):
             detail=True, **filters
         )
 
+    @classmethod
+    def list_paged(
+        cls,
+        request,
+        marker=None,
+        paginate=False,
+        sort_dir='desc',
+        select=None,
+        **filters,
+    ):
+        """Return one page of audit templates in Watcher.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param marker: UUID of the last audit template of the previous page
+        :type  marker: str or None
+        :param paginate: whether to return a single page of
+                         ``API_RESULT_PAGE_SIZE`` audit templates
+        :type  paginate: bool
+        :param sort_dir: ``'desc'`` to page forward, ``'asc'`` to page back
+        :type  sort_dir: str
+        :param select: called with each list of fetched audit templates to
+                       return those to show, in which case audit templates
+                       are fetched until the page is full
+        :type  select: callable or None
+        :param filters: key/value kwargs used as filters
+        :type  filters: dict
+
+        :return: a ``(audit templates, has_more_data, has_prev_data)`` tuple
+        :rtype:  tuple
+        """
+        return _list_paged(
+            cls.list, request, marker, paginate, sort_dir, select, **filters
+        )
+
+    @classmethod
+    def list_names(cls, request):
+        """Return the UUID and name of every audit template in Watcher
+
+        The list is kept in the catalog cache for
+        ``WATCHER_AUDIT_TEMPLATE_NAMES_CACHE_TTL`` seconds, and dropped when
+        an audit template is created or archived from the dashboard.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+
+        :return: ``{'uuid': ..., 'name': ...}`` dicts, in the API order
+        :rtype:  list of dict
+        """
+        return catalog.get(
+            request,
+            catalog.AUDIT_TEMPLATES,
+            lambda: [
+                {'uuid': audit_template.uuid, 'name': audit_template.name}
+                for audit_template in watcherclient(
+                    request
+                ).audit_template.list(limit=0)
+            ],
+            ttl=config.get_audit_template_names_cache_ttl(),
+        )
+
+    @classmethod
+    def search(cls, request, query, limit=None):
+        """Return the audit templates whose name or UUID starts with query
+
+        The match is case-insensitive and made on the cached
+        :meth:`list_names`, so no Watcher API call is needed.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param query: prefix of the names or UUIDs to look for
+        :type  query: str
+        :param limit: maximum number of audit templates to return
+        :type  limit: int or None
+
+        :return: ``{'uuid': ..., 'name': ...}`` dicts, sorted by name
+        :rtype:  list of dict
+        """
+        query = query.strip().lower()
+        matches = sorted(
+            (
+                audit_template
+                for audit_template in cls.list_names(request)
+                if (audit_template['name'] or '').lower().startswith(query)
+                or audit_template['uuid'].startswith(query)
+            ),
+            key=lambda audit_template: (
+                audit_template['name'] or audit_template['uuid']
+            ).lower(),
+        )
+        return matches[:limit] if limit else matches
+
     @classmethod
     @errors_utils.handle_errors(_("Unable to retrieve audit template"))
+    @_memoize_per_request
     def get(cls, request, audit_template_id):
         """Return the audit template that matches the ID
 
@@ -325,6 +758,7 @@ class AuditTemplate(base.APIDictWrapper):
         )
 
     @classmethod
+    @_invalidate_request_memo
     def delete(cls, request, audit_template_id):
         """Delete an audit_template
 
@@ -337,6 +771,10 @@ class AuditTemplate(base.APIDictWrapper):
         watcherclient(request).audit_template.delete(
             audit_template_id=audit_template_id
         )
+        catalog.forget_item(
+            request, catalog.TEMPLATE_PARAMETERS, audit_template_id
+        )
+        catalog.forget(request, catalog.AUDIT_TEMPLATES)
 
     @property
     def id(self):
@@ -359,22 +797,193 @@ class ActionPlan(base.APIDictWrapper):
         self._request = request
 
     @classmethod
-    def list(cls, request, **filters):
+    @_memoize_per_request
+    def list(cls, request, fields=None, index=False, **filters):
         """Return a list of action plans in Watcher
 
         :param request: request object
         :type  request: django.http.HttpRequest
 
+        :param fields: attributes to keep, see :func:`_project`
+        :type  fields: tuple or None
+
+        :param index: whether to record the listed action plans for
+                      :meth:`latest_by_audit` and :meth:`get_many`, which
+                      costs cache round-trips
+        :type  index: bool
+
         :param filters: key/value kwargs used as filters
         :type  filters: dict
 
         :return: list of action plans, or an empty list if there are none
         :rtype:  list of :py:class:`~.ActionPlan`
         """
-        return watcherclient(request).action_plan.list(detail=True, **filters)
+        action_plans = watcherclient(request).action_plan.list(
+            detail=True, **filters
+        )
+        if index:
+            cls._index_by_audit(request, action_plans)
+        return _project(cls, request, action_plans, fields)
+
+    @classmethod
+    def _index_by_audit(cls, request, action_plans):
+        """Record the latest of ``action_plans`` for each of their audits.
+
+        The audit of each action plan is recorded as well.  The index only
+        holds what listings happened to return: an audit may have a more
+        recent action plan the dashboard has not seen yet.
+        """
+        latest = {}
+        audits = {}
+        for action_plan in action_plans:
+            audit_uuid = getattr(action_plan, 'audit_uuid', None)
+            if not audit_uuid:
+                continue
+            audits[action_plan.uuid] = audit_uuid
+            entry = (action_plan.uuid, action_plan.created_at or '')
+            if entry[1] >= latest.get(audit_uuid, (None, ''))[1]:
+                latest[audit_uuid] = entry
+        if not latest:
+            return
+        try:
+            known = catalog.get_items(
+                request, catalog.LATEST_ACTION_PLANS, latest
+            )
+            latest = {
+                audit_uuid: entry
+                for audit_uuid, entry in latest.items()
+                if audit_uuid not in known or entry[1] > known[audit_uuid][1]
+            }
+            catalog.set_items(request, catalog.LATEST_ACTION_PLANS, latest)
+            catalog.set_items(request, catalog.ACTION_PLAN_AUDITS, audits)
+        except Exception:
+            LOG.debug("Unable to index the action plans", exc_info=True)
+
+    @classmethod
+    def latest_by_audit(cls, request, audit_ids):
+        """Return the latest known action plan of each audit.
+
+        No Watcher API call is made: only the action plans returned by
+        earlier listings are known.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param audit_ids: UUIDs of the audits
+        :type  audit_ids: list of str
+
+        :return: the action plan UUIDs, keyed by audit UUID, for the
+                 audits with a known action plan
+        :rtype:  dict
+        """
+        try:
+            latest = catalog.get_items(
+                request, catalog.LATEST_ACTION_PLANS, audit_ids
+            )
+        except Exception:
+            LOG.debug("Unable to read the action plan index", exc_info=True)
+            return {}
+        return {
+            audit_uuid: action_plan_uuid
+            for audit_uuid, (action_plan_uuid, _created_at) in latest.items()
+        }
+
+    @classmethod
+    def list_paged(
+        cls,
+        request,
+        marker=None,
+        paginate=False,
+        sort_dir='desc',
+        select=None,
+        **filters,
+    ):
+        """Return one page of action plans in Watcher.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param marker: UUID of the last action plan of the previous page
+        :type  marker: str or None
+        :param paginate: whether to return a single page of
+                         ``API_RESULT_PAGE_SIZE`` action plans
+        :type  paginate: bool
+        :param sort_dir: ``'desc'`` to page forward, ``'asc'`` to page back
+        :type  sort_dir: str
+        :param select: called with each list of fetched action plans to
+                       return those to show, in which case action plans are
+                       fetched until the page is full
+        :type  select: callable or None
+        :param filters: key/value kwargs used as filters
+        :type  filters: dict
+
+        :return: a ``(action plans, has_more_data, has_prev_data)`` tuple
+        :rtype:  tuple
+        """
+        return _list_paged(
+            cls.list, request, marker, paginate, sort_dir, select, **filters
+        )
+
+    @classmethod
+    def iter_all(cls, request, page_size, **filters):
+        """Yield every action plan in Watcher, oldest first.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param page_size: number of action plans fetched per API call
+        :type  page_size: int
+        :param filters: key/value kwargs used as filters
+        :type  filters: dict
+
+        :return: generator of action plans
+        :rtype:  generator
+        """
+        yield from _iter_pages(request, 'action_plan', page_size, **filters)
+
+    @classmethod
+    def get_many(cls, request, uuids, **filters):
+        """Return the action plans matching ``uuids``, with few API calls.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param uuids: UUIDs of the action plans
+        :type  uuids: list of str
+        :param filters: key/value kwargs narrowing down a single list call
+                        expected to return the action plans, e.g.
+                        ``audit``; without them, the action plans of
+                        the same audit are listed together
+        :type  filters: dict
+
+        :return: the action plans found, keyed by UUID
+        :rtype:  dict
+        """
+        if filters:
+            return _get_many(cls, request, uuids, [(filters, uuids)])
+        try:
+            audits = catalog.get_items(
+                request, catalog.ACTION_PLAN_AUDITS, uuids
+            )
+        except Exception:
+            LOG.debug("Unable to read the action plan index", exc_info=True)
+            audits = {}
+        by_audit = {}
+        for uuid, audit_uuid in audits.items():
+            by_audit.setdefault(audit_uuid, []).append(uuid)
+        # Listing the action plans of an audit only pays off for several
+        # of them.
+        return _get_many(
+            cls,
+            request,
+            uuids,
+            [
+                ({'audit': audit_uuid}, group)
+                for audit_uuid, group in by_audit.items()
+                if len(group) > 1
+            ],
+        )
 
     @classmethod
     @errors_utils.handle_errors(_("Unable to retrieve action plan"))
+    @_memoize_per_request
+    @_refresh_version_on_error
     def get(cls, request, action_plan_id, api_version=None):
         """Return the action plan that matches the ID.
 
@@ -393,6 +1002,7 @@ class ActionPlan(base.APIDictWrapper):
         )
 
     @classmethod
+    @_invalidate_request_memo
     def delete(cls, request, action_plan_id):
         """Delete an action plan
 
@@ -405,8 +1015,26 @@ class ActionPlan(base.APIDictWrapper):
         watcherclient(request).action_plan.delete(
             action_plan_id=action_plan_id
         )
+        try:
+            audit_uuid = catalog.get_items(
+                request, catalog.ACTION_PLAN_AUDITS, [action_plan_id]
+            ).get(action_plan_id)
+            if audit_uuid:
+                catalog.forget_item(
+                    request, catalog.ACTION_PLAN_AUDITS, action_plan_id
+                )
+                if (
+                    cls.latest_by_audit(request, [audit_uuid]).get(audit_uuid)
+                    == action_plan_id
+                ):
+                    catalog.forget_item(
+                        request, catalog.LATEST_ACTION_PLANS, audit_uuid
+                    )
+        except Exception:
+            LOG.debug("Unable to update the action plan index", exc_info=True)
 
     @classmethod
+    @_invalidate_request_memo
     def start(cls, request, action_plan_id):
         """Start an Action Plan
 
@@ -446,22 +1074,101 @@ class Action(base.APIDictWrapper):
         self._request = request
 
     @classmethod
-    def list(cls, request, **filters):
+    @_memoize_per_request
+    def list(cls, request, fields=None, **filters):
         """Return a list of actions in Watcher
 
         :param request: request object
         :type  request: django.http.HttpRequest
 
+        :param fields: attributes to keep, see :func:`_project`
+        :type  fields: tuple or None
+
         :param filters: key/value kwargs used as filters
         :type  filters: dict
 
         :return: list of actions, or an empty list if there are none
         :rtype:  list of :py:class:`~.Action`
         """
-        return watcherclient(request).action.list(detail=True, **filters)
+        actions = watcherclient(request).action.list(detail=True, **filters)
+        return _project(cls, request, actions, fields)
+
+    @classmethod
+    def list_paged(
+        cls,
+        request,
+        marker=None,
+        paginate=False,
+        sort_dir='desc',
+        select=None,
+        **filters,
+    ):
+        """Return one page of actions in Watcher.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param marker: UUID of the last action of the previous page
+        :type  marker: str or None
+        :param paginate: whether to return a single page of
+                         ``API_RESULT_PAGE_SIZE`` actions
+        :type  paginate: bool
+        :param sort_dir: ``'desc'`` to page forward, ``'asc'`` to page back
+        :type  sort_dir: str
+        :param select: called with each list of fetched actions to return
+                       those to show, in which case actions are fetched
+                       until the page is full
+        :type  select: callable or None
+        :param filters: key/value kwargs used as filters
+        :type  filters: dict
+
+        :return: a ``(actions, has_more_data, has_prev_data)`` tuple
+        :rtype:  tuple
+        """
+        return _list_paged(
+            cls.list, request, marker, paginate, sort_dir, select, **filters
+        )
+
+    @classmethod
+    def iter_all(cls, request, page_size, **filters):
+        """Yield every action in Watcher, oldest first.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param page_size: number of actions fetched per API call
+        :type  page_size: int
+        :param filters: key/value kwargs used as filters
+        :type  filters: dict
+
+        :return: generator of actions
+        :rtype:  generator
+        """
+        yield from _iter_pages(request, 'action', page_size, **filters)
+
+    @classmethod
+    def get_many(cls, request, uuids, **filters):
+        """Return the actions matching ``uuids``, with few API calls.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param uuids: UUIDs of the actions
+        :type  uuids: list of str
+        :param filters: key/value kwargs narrowing down a single list call
+                        expected to return the actions, e.g.
+                        ``action_plan``; the actions are fetched one
+                        by one otherwise
+        :type  filters: dict
+
+        :return: the actions found, keyed by UUID
+        :rtype:  dict
+        """
+        return _get_many(
+            cls, request, uuids, [(filters, uuids)] if filters else ()
+        )
 
     @classmethod
     @errors_utils.handle_errors(_("Unable to retrieve action"))
+    @_memoize_per_request
+    @_refresh_version_on_error
     def get(cls, request, action_id, api_version=None):
         """Return the action that matches the ID.
 
@@ -480,6 +1187,8 @@ class Action(base.APIDictWrapper):
         )
 
     @classmethod
+    @_invalidate_request_memo
+    @_refresh_version_on_error
     def update(
         cls, request, action_id, state=None, reason=None, api_version=None
     ):
@@ -525,6 +1234,7 @@ class Action(base.APIDictWrapper):
             return None
 
     @classmethod
+    @_invalidate_request_memo
     def delete(cls, request, action_id):
         """Delete an action
 
@@ -559,9 +1269,13 @@ class Goal(base.APIDictWrapper):
         self._request = request
 
     @classmethod
+    @_memoize_per_request
     def list(cls, request, **filters):
         """Return a list of goals in Watcher
 
+        Goals are served from the catalog cache, see
+        :py:mod:`watcher_dashboard.api.catalog`.
+
         :param request: request object
         :type  request: django.http.HttpRequest
 
@@ -571,10 +1285,51 @@ class Goal(base.APIDictWrapper):
         :return: list of goals, or an empty list if there are none
         :rtype:  list of :py:class:`~.Goal` instance
         """
-        return watcherclient(request).goal.list(detail=True, **filters)
+        goals = catalog.get(
+            request,
+            catalog.GOALS,
+            lambda: watcherclient(request).goal.list(detail=True, limit=0),
+        )
+        return [cls(goal) for goal in catalog.select(goals, **filters)]
+
+    @classmethod
+    def list_paged(
+        cls,
+        request,
+        marker=None,
+        paginate=False,
+        sort_dir='desc',
+        select=None,
+        **filters,
+    ):
+        """Return one page of goals in Watcher.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param marker: UUID of the last goal of the previous page
+        :type  marker: str or None
+        :param paginate: whether to return a single page of
+                         ``API_RESULT_PAGE_SIZE`` goals
+        :type  paginate: bool
+        :param sort_dir: ``'desc'`` to page forward, ``'asc'`` to page back
+        :type  sort_dir: str
+        :param select: called with each list of fetched goals to return
+                       those to show, in which case goals are fetched
+                       until the page is full
+        :type  select: callable or None
+        :param filters: key/value kwargs used as filters
+        :type  filters: dict
+
+        :return: a ``(goals, has_more_data, has_prev_data)`` tuple
+        :rtype:  tuple
+        """
+        return _list_paged(
+            cls.list, request, marker, paginate, sort_dir, select, **filters
+        )
 
     @classmethod
     @errors_utils.handle_errors(_("Unable to retrieve goal"))
+    @_memoize_per_request
     def get(cls, request, goal):
         """Return the goal that matches the ID
 
@@ -587,7 +1342,10 @@ class Goal(base.APIDictWrapper):
         :return: matching goal, or None if no goal matches the UUID
         :rtype:  :py:class:`~.Goal` instance
         """
-        return watcherclient(request).goal.get(goal)
+        for item in cls.list(request):
+            if goal in (item.uuid, item.name):
+                return item
+        return cls(catalog.to_dict(watcherclient(request).goal.get(goal)))
 
     @property
     def id(self):
@@ -614,9 +1372,13 @@ class Strategy(base.APIDictWrapper):
         self._request = request
 
     @classmethod
+    @_memoize_per_request
     def list(cls, request, **filters):
         """Return a list of strategies in Watcher
 
+        Strategies are served from the catalog cache, see
+        :py:mod:`watcher_dashboard.api.catalog`.
+
         :param request: request object
         :type  request: django.http.HttpRequest
 
@@ -626,10 +1388,53 @@ class Strategy(base.APIDictWrapper):
         :return: list of strategies, or an empty list if there are none
         :rtype:  list of :py:class:`~.Strategy` instances
         """
-        return watcherclient(request).strategy.list(detail=True, **filters)
+        strategies = catalog.get(
+            request,
+            catalog.STRATEGIES,
+            lambda: watcherclient(request).strategy.list(detail=True, limit=0),
+        )
+        return [
+            cls(strategy) for strategy in catalog.select(strategies, **filters)
+        ]
+
+    @classmethod
+    def list_paged(
+        cls,
+        request,
+        marker=None,
+        paginate=False,
+        sort_dir='desc',
+        select=None,
+        **filters,
+    ):
+        """Return one page of strategies in Watcher.
+
+        :param request: request object
+        :type  request: django.http.HttpRequest
+        :param marker: UUID of the last strategy of the previous page
+        :type  marker: str or None
+        :param paginate: whether to return a single page of
+                         ``API_RESULT_PAGE_SIZE`` strategies
+        :type  paginate: bool
+        :param sort_dir: ``'desc'`` to page forward, ``'asc'`` to page back
+        :type  sort_dir: str
+        :param select: called with each list of fetched strategies to
+                       return those to show, in which case strategies are
+                       fetched until the page is full
+        :type  select: callable or None
+        :param filters: key/value kwargs used as filters
+        :type  filters: dict
+
+        :return: a ``(strategies, has_more_data, has_prev_data)`` tuple
+        :rtype:  tuple
+        """
+        return _list_paged(
+            cls.list, request, marker, paginate, sort_dir, select, **filters
+        )
 
     @classmethod
     @errors_utils.handle_errors(_("Unable to retrieve strategy"))
+    @_memoize_per_request
     def get(cls, request, strategy):
         """Return the strategy that matches the UUID
 
@@ -642,7 +1447,12 @@ class Strategy(base.APIDictWrapper):
         :return: matching strategy, or None if no strategy matches the UUID
         :rtype:  :py:class:`~.Strategy` instance
         """
-        return watcherclient(request).strategy.get(strategy)
+        for item in cls.list(request):
+            if strategy in (item.uuid, item.name):
+                return item
+        return cls(
+            catalog.to_dict(watcherclient(request).strategy.get(strategy))
+        )
 
     @property
     def id(self):
@@ -0,0 +1,143 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Process-local caches shared by all requests served by a worker.
+
+These caches live for the lifetime of the WSGI worker process and are
+safe to use from multiple threads.  They are meant for small, cheap to
+recompute values (discovered microversions, rendered fragments, ...);
+anything that must be shared between worker processes belongs in the
+Django cache framework instead.
+"""
+
+import collections
+import threading
+import time
+import weakref
+
+from typing import Any
+
+
+MISSING = object()
+
+_named_caches: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def get_named_caches() -> dict:
+    """Return the caches created with a ``name``, keyed by name."""
+    return dict(_named_caches)
+
+
+class TTLCache:
+    """A thread-safe mapping whose entries expire after a time-to-live.
+
+    When ``maxsize`` is set, the least recently used entry is evicted once
+    the cache is full.  Hit and miss counters are kept so the cache
+    efficiency can be reported; see :meth:`stats`.  Unlike these counters,
+    the ``total_hits`` and ``total_misses`` of the process are never
+    reset, so they can be exported as monotonic counters.
+
+    :param ttl: Default time-to-live of an entry, in seconds. ``None``
+        means entries never expire.
+    :param maxsize: Maximum number of entries, or ``None`` for unbounded.
+    :param name: Name under which the cache efficiency is reported, see
+        :func:`get_named_caches`.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        maxsize: int | None = None,
+        name: str | None = None,
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.name = name
+        if name is not None:
+            _named_caches[name] = self
+        self._data: collections.OrderedDict = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.total_hits = 0
+        self.total_misses = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the live value stored under ``key``, or ``default``."""
+        with self._lock:
+            entry = self._data.get(key, MISSING)
+            if entry is not MISSING:
+                value, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    self.total_hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            self.total_misses += 1
+            return default
+
+    def set(self, key: Any, value: Any, ttl: Any = MISSING) -> None:
+        """Store ``value`` under ``key``.
+
+        :param ttl: Overrides the cache-wide time-to-live for this entry.
+        """
+        if ttl is MISSING:
+            ttl = self.ttl
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Remove ``key`` and return its value, expired or not."""
+        with self._lock:
+            entry = self._data.pop(key, MISSING)
+        return default if entry is MISSING else entry[0]
+
+    def evict(self, predicate) -> int:
+        """Remove every entry whose key satisfies ``predicate``.
+
+        :returns: The number of evicted entries.
+        """
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return the hit/miss counters and the current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'size': len(self._data),
+                'total_hits': self.total_hits,
+                'total_misses': self.total_misses,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -10,16 +10,26 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import datetime
 import logging
+import threading
 
 from typing import Any
 
+import requests
+
+from django import dispatch
+from django.contrib.auth import signals as auth_signals
+from django.utils import timezone
 from openstack_dashboard.api import base
 from watcherclient import client as wc
 from watcherclient import exceptions as wc_exc
 from watcherclient.common import api_versioning
+from watcherclient.common.apiclient import exceptions as wc_apiexc
 
 from watcher_dashboard import config
+from watcher_dashboard.common import cache
+from watcher_dashboard.common import instrumentation
 
 
 LOG = logging.getLogger(__name__)
@@ -36,10 +46,33 @@ MV_START_END = '1.1'
 # Microversion enabling skip action support
 MV_SKIP_ACTION = '1.5'
 
+# Errors raised when the server rejects the requested microversion
+VERSION_ERRORS = (wc_exc.UnsupportedVersion, wc_apiexc.NotAcceptable)
+
+# Discovered max microversions, keyed by Watcher endpoint. Shared by all
+# requests served by this worker process.
+_max_version_cache = cache.TTLCache(name='max-version')
+
+# Upper bound, in seconds, for keeping a client in the pool. Clients are
+# evicted earlier when their token expires.
+CLIENT_POOL_TTL = 3600
+
+# Watcher clients keyed by endpoint, token, microversion and TLS settings.
+_client_pool = cache.TTLCache(name='client-pool')
+
+# HTTP sessions shared by all the clients of an endpoint.
+_sessions = {}
+_sessions_lock = threading.Lock()
+
 
 def get_client(request: Any, required: str = MIN_DEFAULT) -> Any:
     """Return a watcher client pinned to the given microversion.
 
+    Clients are pooled per endpoint, token and microversion, and every
+    client of an endpoint shares one HTTP session, so that the API calls
+    of a page reuse warm keep-alive (and TLS) connections.  Pooled clients
+    are evicted when their token expires or its user logs out.
+
     :param request: The current Django HTTP request.
     :param required: Microversion string (e.g. ``'1.0'``,
         ``'1.1'``).
@@ -47,30 +80,120 @@ def get_client(request: Any, required: str = MIN_DEFAULT) -> Any:
     endpoint = base.url_for(request, WATCHER_SERVICE)
     insecure = config.get_ssl_no_verify()
     ca_file = config.get_ssl_cacert()
+    token = request.user.token
+
+    key = (endpoint, token.id, required, insecure, ca_file)
+    client = _client_pool.get(key)
+    if client is not None:
+        return client
 
-    return wc.get_client(
+    client = wc.get_client(
         '1',
         watcher_url=endpoint,
         insecure=insecure,
         ca_file=ca_file,
         username=request.user.username,
-        os_auth_token=request.user.token.id,
+        os_auth_token=token.id,
         os_infra_optim_api_version=required,
     )
+    _share_session(client, (endpoint, insecure, ca_file))
+
+    ttl = _get_token_ttl(token)
+    if ttl > 0:
+        _client_pool.maxsize = config.get_client_pool_size()
+        _client_pool.set(key, client, ttl=ttl)
+    return client
 
 
-def get_max_version(request):
-    """Discover the server's maximum supported microversion.
+def _share_session(client, session_key):
+    """Make ``client`` use the HTTP session shared by its endpoint.
 
-    Queries the Watcher API root endpoint and extracts the
-    ``max_version`` field from the response body.
+    The first client built for an endpoint donates its session, which
+    already carries the TLS settings, to the pool.
+    """
+    http_client = getattr(client, 'http_client', None)
+    session = getattr(http_client, 'session', None)
+    if not isinstance(session, requests.Session):
+        return
+    with _sessions_lock:
+        shared = _sessions.get(session_key)
+        if shared is None:
+            adapter = requests.adapters.HTTPAdapter(
+                pool_maxsize=config.get_connection_pool_maxsize()
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            shared = _sessions[session_key] = session
+    http_client.session = shared
+
+
+def _get_token_ttl(token):
+    """Return how long a client built for ``token`` may be pooled."""
+    expires = getattr(token, 'expires', None)
+    if expires is None:
+        return CLIENT_POOL_TTL
+    if timezone.is_naive(expires):
+        expires = timezone.make_aware(expires, datetime.timezone.utc)
+    remaining = (expires - timezone.now()).total_seconds()
+    return min(max(remaining, 0), CLIENT_POOL_TTL)
+
+
+@dispatch.receiver(auth_signals.user_logged_out)
+def _evict_user_clients(sender, request=None, user=None, **kwargs):
+    """Drop the pooled clients of a user who logged out."""
+    token = getattr(user, 'token', None)
+    if token is None:
+        return
+    evicted = _client_pool.evict(lambda key: key[1] == token.id)
+    if evicted:
+        LOG.debug('Evicted %d pooled watcher clients on logout', evicted)
+
+
+def get_max_version(request, refresh=False):
+    """Return the server's maximum supported microversion.
+
+    The value is discovered once per Watcher endpoint and cached for
+    ``WATCHER_MAX_VERSION_CACHE_TTL`` seconds, so that page loads do not
+    each pay a round trip to the API root.  Failed discoveries are not
+    cached.
 
     :param request: The current Django HTTP request.
+    :param refresh: Bypass the cache and query the API again.
     :returns: The max version string, or ``None`` on failure.
     """
+    endpoint = base.url_for(request, WATCHER_SERVICE)
+    if not refresh:
+        max_ver = _max_version_cache.get(endpoint, cache.MISSING)
+        if max_ver is not cache.MISSING:
+            return max_ver
+
+    max_ver = _discover_max_version(request)
+    ttl = config.get_max_version_cache_ttl()
+    if max_ver is not None and ttl:
+        _max_version_cache.set(endpoint, max_ver, ttl=ttl)
+    return max_ver
+
+
+def invalidate_max_version(request):
+    """Forget the cached max microversion of the request's endpoint.
+
+    Called when the server rejects a microversion, so that the next
+    :func:`get_max_version` call queries the API again.
+    """
+    endpoint = base.url_for(request, WATCHER_SERVICE)
+    if _max_version_cache.pop(endpoint) is not None:
+        LOG.debug('Dropped cached max microversion for %s', endpoint)
+
+
+def get_max_version_cache_stats():
+    """Return hit/miss counters of the max microversion cache."""
+    return _max_version_cache.stats()
+
+
+def _discover_max_version(request):
+    """Query the Watcher API root for the ``max_version`` field."""
     try:
-        client = get_client(request)
-        _resp, body = client.http_client.json_request('GET', '/')
+        body = _get_root(request)
         version_info = (
             body.get('versions')
             or body.get('version')
@@ -81,11 +204,18 @@ def get_max_version(request):
             version_info = version_info[0]
         if isinstance(version_info, dict):
             return version_info.get('max_version')
-    except wc_exc.ClientException:
+    except wc_apiexc.ClientException:
         LOG.debug('Microversion discovery failed', exc_info=True)
     return None
 
 
+@instrumentation.instrument('get_max_version')
+def _get_root(request):
+    """Return the body of the Watcher API root."""
+    _resp, body = get_client(request).http_client.json_request('GET', '/')
+    return body
+
+
 def is_microversion_supported(max_ver, required):
     """Check whether the server supports the required microversion.
 
@@ -0,0 +1,190 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Run independent Watcher API calls of a view concurrently.
+
+Views that need several unrelated resources (the object being shown and
+its related collections) can hand the calls to :func:`fan_out` so the page
+waits for the slowest call instead of the sum of all of them.  The calls
+run on a single process-wide, bounded thread pool.
+
+Exceptions are never handled in the worker threads: they are stored in
+the returned futures and raised again by ``Future.result()`` in the thread
+serving the request, so the usual ``horizon.exceptions.handle`` calls keep
+working unchanged.
+
+Async views can await calls run on the same pool with :func:`run_async`,
+which leaves the event loop free while the calls wait on the Watcher API;
+see :mod:`watcher_dashboard.api.aio`.
+
+The pool is discarded in forked children (mod_wsgi and uWSGI fork their
+workers after the application is imported), since threads do not survive
+a fork and a copied pool would never run anything.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+
+from concurrent import futures
+
+from asgiref import sync
+
+from watcher_dashboard import config
+from watcher_dashboard.common import instrumentation
+
+
+LOG = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+_local = threading.local()
+
+
+def _reset_after_fork():
+    global _executor, _executor_lock, _local
+    _executor = None
+    _executor_lock = threading.Lock()
+    _local = threading.local()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = futures.ThreadPoolExecutor(
+                max_workers=config.get_fan_out_max_workers(),
+                thread_name_prefix='watcher-fan-out',
+                initializer=_mark_worker,
+            )
+        return _executor
+
+
+def _mark_worker():
+    _local.worker = True
+
+
+def _run_inline(func):
+    future = futures.Future()
+    try:
+        future.set_result(func())
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def fan_out(request, *calls):
+    """Start ``calls`` concurrently and return one future per call.
+
+    Each call is a callable taking no argument, typically a
+    ``functools.partial`` of a ``watcher_dashboard.api.watcher`` method.
+    Use ``future.result()`` to get the value of a call or raise, in the
+    calling thread, the exception it failed with.
+
+    The calls run inline, one after another, when the pool is disabled
+    (``WATCHER_FAN_OUT_MAX_WORKERS = 0``) or when ``fan_out`` is used from
+    a pool thread, which would otherwise risk exhausting the pool.
+
+    :param request: The Django request the calls are made for.
+    :param calls: The callables to run.
+    :returns: A list of :class:`concurrent.futures.Future`, in the same
+        order as ``calls``.
+    """
+    _prepare(request)
+    if len(calls) < 2 or not _pool_usable():
+        return [_run_inline(call) for call in calls]
+
+    executor = _get_executor()
+    LOG.debug("Running %d Watcher API calls concurrently", len(calls))
+    return [executor.submit(call) for call in calls]
+
+
+def submit(func):
+    """Run ``func`` in the background and return its future.
+
+    Unlike :func:`fan_out`, the caller is not expected to wait for the
+    result. ``func`` still runs inline when the pool is disabled or when
+    called from a pool thread.
+    """
+    if not _pool_usable():
+        return _run_inline(func)
+    return _get_executor().submit(func)
+
+
+def run_bounded(request, calls, max_workers):
+    """Run ``calls`` with at most ``max_workers`` of them at once.
+
+    Meant for the large, user-triggered batches of a table action, which
+    would otherwise starve the shared pool used by :func:`fan_out`: the
+    calls run on a pool dedicated to this batch, torn down once every call
+    is done.  As with :func:`fan_out`, the calls run inline when
+    ``max_workers`` is 0, when there is a single call or when used from a
+    pool thread.
+
+    :param request: The Django request the calls are made for.
+    :param calls: The callables to run, taking no argument.
+    :param max_workers: Maximum number of concurrent calls.
+    :returns: A list of completed :class:`concurrent.futures.Future`, in
+        the same order as ``calls``.
+    """
+    _prepare(request)
+    calls = list(calls)
+    if len(calls) < 2 or not max_workers or getattr(_local, 'worker', False):
+        return [_run_inline(call) for call in calls]
+
+    LOG.debug(
+        "Running %d Watcher API calls, %d at a time",
+        len(calls),
+        min(max_workers, len(calls)),
+    )
+    with futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(calls)),
+        thread_name_prefix='watcher-batch',
+        initializer=_mark_worker,
+    ) as executor:
+        return [executor.submit(call) for call in calls]
+
+
+def _prepare(request):
+    # Resolve the lazily loaded user in the thread serving the request, so
+    # that the workers don't each load the session.
+    getattr(request, 'user', None)
+    instrumentation.track(request)
+
+
+async def run_async(request, func):
+    """Run ``func`` on the pool and return its result, from an async view.
+
+    Several calls are awaited concurrently with ``asyncio.gather``. When
+    the pool is disabled, ``func`` runs in the thread serving the request
+    rather than in the event loop.
+
+    :param request: The Django request the call is made for.
+    :param func: The callable to run, taking no argument.
+    """
+    # The request is tracked, and its user loaded, by the thread serving
+    # it, as with fan_out.
+    await sync.sync_to_async(_prepare, thread_sensitive=True)(request)
+    if not _pool_usable():
+        return await sync.sync_to_async(func, thread_sensitive=True)()
+    return await asyncio.wrap_future(_get_executor().submit(func))
+
+
+def _pool_usable():
+    return bool(config.get_fan_out_max_workers()) and not getattr(
+        _local, 'worker', False
+    )
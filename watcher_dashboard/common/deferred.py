@@ -0,0 +1,109 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Deferred loading of the related tables of the detail pages.
+
+A detail page first renders the object it shows, leaving an empty
+placeholder for each of its deferred tables (see
+``infra_optim/_deferred_table.html``). The browser then fetches every
+table, when it is first shown, from the page URL with the
+``deferred=<table name>`` query parameter, which only loads and renders
+that table. Table actions are still posted to the page URL, where every
+table is loaded as usual.
+"""
+
+from django import http
+
+from watcher_dashboard.common import http as common_http
+
+
+# Query parameter naming the deferred table to render
+PARAM = 'deferred'
+
+
+class DeferredTablesMixin:
+    """Mixin of a ``MultiTableView`` deferring some of its tables.
+
+    :ivar deferred_tables: The ``{table name: max age}`` of the deferred
+        tables, where the max age is how long, in seconds, browsers may
+        reuse a rendered table without revalidating it.
+    """
+
+    deferred_tables = {}
+
+    def get_requested_table(self):
+        """Return the name of the deferred table to render, or ``None``."""
+        if self.request.method not in ('GET', 'HEAD'):
+            return None
+        return self.request.GET.get(PARAM)
+
+    def is_deferred(self, name):
+        """Return whether this request doesn't load the ``name`` table."""
+        requested = self.get_requested_table()
+        if requested is not None:
+            return name != requested
+        if self.request.method not in ('GET', 'HEAD'):
+            return False
+        return name in self.deferred_tables
+
+    def _get_data_dict(self):
+        if not self._data:
+            for table in self.table_classes:
+                name = table._meta.name
+                data = []
+                if not self.is_deferred(name):
+                    for func in self._data_methods.get(name, []):
+                        data.extend(func())
+                self._data[name] = data
+        return self._data
+
+    def get(self, request, *args, **kwargs):
+        name = self.get_requested_table()
+        if name is None:
+            return super().get(request, *args, **kwargs)
+        if name not in self.deferred_tables:
+            raise http.Http404(f"Unknown deferred table {name}")
+        handled = self.construct_tables()
+        if handled:
+            return handled
+        table = self.get_tables().get(name)
+        if table is None:
+            raise http.Http404(f"Unknown deferred table {name}")
+        # Post the actions of the table, and come back after them, to the
+        # page rather than to this fragment.
+        page_url = request.path
+        table.get_full_url = lambda: page_url
+        if getattr(request, 'horizon', {}).get('async_messages'):
+            # The table failed to load: don't let the browser keep it.
+            return common_http.never_cache(http.HttpResponse(table.render()))
+        return common_http.versioned_response(
+            request,
+            self.get_table_version(table),
+            lambda: http.HttpResponse(table.render()),
+            self.deferred_tables[name],
+        )
+
+    def get_table_version(self, table):
+        """Return the version of the data the deferred ``table`` shows.
+
+        It changes whenever a row is added, removed or updated. Views whose
+        rows also depend on other data, e.g. the state of the object the
+        page shows, extend it.
+        """
+        return sorted(
+            (
+                table.get_object_id(datum),
+                getattr(datum, 'state', None) or '',
+                getattr(datum, 'updated_at', None) or '',
+            )
+            for datum in table.data
+        )
@@ -0,0 +1,184 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Streamed exports of the audit, action plan and action tables.
+
+The export endpoints answer with every resource matching the server-side
+filter of their table, as CSV or as NDJSON (one JSON object per line),
+chosen with the ``format`` query parameter. The resources are fetched from
+the Watcher API ``WATCHER_EXPORT_PAGE_SIZE`` at a time, following
+``marker``, and each page is written out before the next one is fetched,
+so the memory used does not depend on the number of exported resources.
+
+The filter is the one last applied to the table by the user, queries
+included, unless the query string names filter fields of the table
+itself, e.g. ``?format=ndjson&action_plan=<uuid>``.
+"""
+
+import csv
+import itertools
+import json
+import logging
+
+import horizon.exceptions
+import horizon.messages
+import horizon.tables
+
+from django import http
+from django.utils.translation import gettext_lazy as _
+
+from watcher_dashboard import config
+from watcher_dashboard.common import query
+from watcher_dashboard.common import tables as common_tables
+
+
+LOG = logging.getLogger(__name__)
+
+CSV = 'csv'
+NDJSON = 'ndjson'
+
+CONTENT_TYPES = {
+    CSV: 'text/csv; charset=utf-8',
+    NDJSON: 'application/x-ndjson; charset=utf-8',
+}
+
+
+class ExportAction(horizon.tables.LinkAction):
+    """Table action downloading the filtered table as CSV.
+
+    Subclasses set ``url`` to the export endpoint of the panel.
+    """
+
+    name = 'export'
+    verbose_name = _("Export CSV")
+    icon = 'download'
+    format = CSV
+
+    def get_link_url(self, datum=None):
+        return f'{super().get_link_url(datum)}?format={self.format}'
+
+
+class _Echo:
+    """File-like object handing back what ``csv.writer`` writes to it."""
+
+    def write(self, value):
+        return value
+
+
+def _to_text(value):
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, sort_keys=True)
+    return str(value)
+
+
+def _render_csv(resources, fields):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(fields)
+    for resource in resources:
+        yield writer.writerow(
+            [_to_text(getattr(resource, field, None)) for field in fields]
+        )
+
+
+def _render_ndjson(resources, fields):
+    for resource in resources:
+        values = {field: getattr(resource, field, None) for field in fields}
+        yield json.dumps(values, default=str) + '\n'
+
+
+_RENDERERS = {CSV: _render_csv, NDJSON: _render_ndjson}
+
+
+def get_filters(request, table_class):
+    """Return the filters of an export of ``table_class``'s table.
+
+    :returns: A ``(filters, query)`` tuple of the API filters and of the
+        compiled query of the table, ``None`` if it has none.
+    :raises watcher_dashboard.common.query.QueryError: if the query of the
+        table is invalid.
+    """
+    table = table_class(request)
+    filter_action = table._meta._filter_action
+    explicit = {
+        choice[0]: request.GET[choice[0]]
+        for choice in getattr(filter_action, 'filter_choices', ())
+        if filter_action.is_api_filter(choice[0])
+        and request.GET.get(choice[0])
+    }
+    if explicit:
+        return explicit, None
+    return (
+        common_tables.get_api_filters(table),
+        common_tables.get_query(table),
+    )
+
+
+def _stream(chunks, filename):
+    try:
+        yield from chunks
+    except Exception:
+        # The status line is long gone: abort the transfer so that the
+        # client does not take the truncated file for a complete one.
+        LOG.exception("Unable to export %s", filename)
+        raise
+
+
+def export(
+    request, table_class, iter_func, fields, filename, redirect, **kwargs
+):
+    """Stream the resources of ``table_class``'s table as an attachment.
+
+    :param request: The export request.
+    :param table_class: The ``DataTable`` whose filter applies.
+    :param iter_func: Called as ``iter_func(request, page_size, **filters)``
+        to iterate over the resources, e.g. ``watcher.Audit.iter_all``.
+    :param fields: The exported attributes, in column order.
+    :param filename: Name of the downloaded file, without extension.
+    :param redirect: Where to send the user when the first page cannot be
+        fetched.
+    :param kwargs: Extra keyword arguments for ``iter_func``.
+    """
+    fmt = request.GET.get('format', CSV)
+    if fmt not in _RENDERERS:
+        return http.HttpResponseBadRequest(
+            f"Unsupported format {fmt!r}, use one of: {', '.join(_RENDERERS)}"
+        )
+    try:
+        filters, compiled = get_filters(request, table_class)
+    except query.QueryError as exc:
+        horizon.messages.error(request, str(exc))
+        return http.HttpResponseRedirect(redirect)
+    # Fetch the first page before answering, so that the user gets an
+    # error message rather than an empty file when Watcher is unavailable.
+    try:
+        resources = iter(
+            iter_func(
+                request, config.get_export_page_size(), **kwargs, **filters
+            )
+        )
+        if compiled is not None:
+            resources = compiled.filter(resources)
+        first = list(itertools.islice(resources, 1))
+    except Exception:
+        horizon.exceptions.handle(
+            request, _("Unable to export the table."), redirect=redirect
+        )
+    rendered = _RENDERERS[fmt](itertools.chain(first, resources), fields)
+    response = http.StreamingHttpResponse(
+        _stream(rendered, filename), content_type=CONTENT_TYPES[fmt]
+    )
+    response['Content-Disposition'] = (
+        f'attachment; filename="{filename}.{fmt}"'
+    )
+    return response
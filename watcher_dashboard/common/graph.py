@@ -0,0 +1,118 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Layout of the dependency graph of the actions of an action plan.
+
+Watcher runs the actions of a plan in the order given by their
+``parents`` (or, with the older planners, by the ``next_uuid`` of the
+previous action). :func:`layout` computes, in time linear in the number of
+actions and dependencies, everything a client-side renderer needs to draw
+that graph: a topological order, the level of each action (the length of
+the longest chain of actions leading to it), its row within that level and
+the critical path, the longest chain of the plan.
+
+The result is meant to be serialized as JSON as is, so it refers to the
+actions by their position in ``nodes`` rather than by UUID::
+
+    {
+        "nodes": [["<uuid>", "<action_type>", <level>, <row>], ...],
+        "edges": [[<parent index>, <child index>], ...],
+        "levels": <number of levels>,
+        "critical_path": [<index>, ...]
+    }
+
+Actions caught in a dependency cycle, which Watcher never plans, come last
+with a ``null`` level and row.
+"""
+
+import collections
+
+
+def _get_edges(actions, index):
+    edges = set()
+    for child, action in enumerate(actions):
+        for parent_uuid in getattr(action, 'parents', None) or ():
+            parent = index.get(parent_uuid)
+            if parent is not None and parent != child:
+                edges.add((parent, child))
+        next_index = index.get(getattr(action, 'next_uuid', None))
+        if next_index is not None and next_index != child:
+            edges.add((child, next_index))
+    return sorted(edges)
+
+
+def layout(actions):
+    """Return the layout of the dependency graph of ``actions``.
+
+    :param actions: The actions of a plan, with at least their ``uuid``,
+        ``action_type``, ``parents`` and ``next_uuid`` attributes.
+    :returns: A dict of ``nodes``, ``edges``, ``levels`` and
+        ``critical_path``, see the module documentation.
+    """
+    actions = list(actions)
+    index = {action.uuid: i for i, action in enumerate(actions)}
+    edges = _get_edges(actions, index)
+
+    children = [[] for _ in actions]
+    indegree = [0] * len(actions)
+    for parent, child in edges:
+        children[parent].append(child)
+        indegree[child] += 1
+
+    # Kahn's algorithm, keeping the longest chain leading to each action
+    level = [0] * len(actions)
+    previous = [None] * len(actions)
+    queue = collections.deque(
+        i for i, count in enumerate(indegree) if not count
+    )
+    order = []
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        for child in children[current]:
+            if level[current] + 1 > level[child]:
+                level[child] = level[current] + 1
+                previous[child] = current
+            indegree[child] -= 1
+            if not indegree[child]:
+                queue.append(child)
+
+    critical_path = []
+    if order:
+        current = max(order, key=lambda i: level[i])
+        while current is not None:
+            critical_path.append(current)
+            current = previous[current]
+        critical_path.reverse()
+
+    placed = set(order)
+    cyclic = [i for i in range(len(actions)) if i not in placed]
+    position = {i: pos for pos, i in enumerate(order + cyclic)}
+
+    rows = collections.Counter()
+    nodes = []
+    for i in order:
+        nodes.append(
+            [actions[i].uuid, actions[i].action_type, level[i], rows[level[i]]]
+        )
+        rows[level[i]] += 1
+    for i in cyclic:
+        nodes.append([actions[i].uuid, actions[i].action_type, None, None])
+
+    return {
+        'nodes': nodes,
+        'edges': sorted(
+            [position[parent], position[child]] for parent, child in edges
+        ),
+        'levels': len(rows),
+        'critical_path': [position[i] for i in critical_path],
+    }
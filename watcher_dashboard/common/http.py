@@ -0,0 +1,142 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""HTTP caching helpers for the dashboard's AJAX endpoints."""
+
+import functools
+import hashlib
+import logging
+
+from asgiref import sync
+from django.utils import cache as cache_utils
+from django.views.decorators import http as http_decorators
+
+from watcher_dashboard.common import concurrency
+
+
+LOG = logging.getLogger(__name__)
+
+# How long, in seconds, browsers may reuse an answer without revalidating it
+JSON_MAX_AGE = 60
+
+
+def conditional(version_func, max_age=JSON_MAX_AGE):
+    """Decorator adding ETag and Cache-Control headers to a GET view.
+
+    The ETag is derived from ``version_func(request, *args, **kwargs)``,
+    typically the version of the cached data the view answers with (see
+    :func:`watcher_dashboard.api.catalog.get_version`), and from the
+    requested URL. Requests carrying a matching ``If-None-Match`` header
+    get a 304 answer without running the view.
+
+    Answers are marked private, so only the user's browser keeps them,
+    for ``max_age`` seconds, after which it revalidates them.
+
+    Async views are supported, in which case ``version_func`` runs on the
+    pool of :mod:`watcher_dashboard.common.concurrency`.
+
+    :param version_func: Returns the version of the data the view would
+        answer with, or ``None`` if unknown, in which case no ETag is set.
+    """
+
+    def decorator(view):
+        def get_etag(request, *args, **kwargs):
+            try:
+                version = version_func(request, *args, **kwargs)
+            except Exception:
+                LOG.debug("Unable to compute an ETag", exc_info=True)
+                return None
+            if version is None:
+                return None
+            return _get_etag(request, version)
+
+        if sync.iscoroutinefunction(view):
+            return _conditional_async(view, get_etag, max_age)
+
+        conditional_view = http_decorators.condition(etag_func=get_etag)(view)
+
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            return _patch_headers(response, max_age)
+
+        return wrapper
+
+    return decorator
+
+
+def versioned_response(request, version, render, max_age=JSON_MAX_AGE):
+    """Answer a GET with the response returned by ``render()``.
+
+    Unlike :func:`conditional`, the version of the data is passed in, for
+    views that can't tell it without loading the data: requests carrying a
+    matching ``If-None-Match`` header still get a 304 answer, without
+    rendering the response.
+
+    :param version: The version of the data ``render`` shows.
+    """
+    etag = cache_utils.quote_etag(_get_etag(request, version))
+    response = cache_utils.get_conditional_response(request, etag=etag)
+    if response is None:
+        response = render()
+        response.headers['ETag'] = etag
+    return _patch_headers(response, max_age)
+
+
+def never_cache(response):
+    """Mark ``response`` as not to be kept by browsers."""
+    cache_utils.add_never_cache_headers(response)
+    response.headers.pop('ETag', None)
+    return response
+
+
+def _get_etag(request, version):
+    return hashlib.sha256(
+        f'{version}:{request.get_full_path()}'.encode()
+    ).hexdigest()
+
+
+def _patch_headers(response, max_age):
+    if response.status_code in (200, 304):
+        cache_utils.patch_cache_control(
+            response, private=True, max_age=max_age
+        )
+    else:
+        never_cache(response)
+    return response
+
+
+def _conditional_async(view, get_etag, max_age):
+    """Async variant of :func:`conditional`.
+
+    ``get_etag`` may call the Watcher API, so it runs on the pool rather
+    than in the event loop.
+    """
+
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        etag = await concurrency.run_async(
+            request, functools.partial(get_etag, request, *args, **kwargs)
+        )
+        response = None
+        if etag is not None:
+            etag = cache_utils.quote_etag(etag)
+            response = cache_utils.get_conditional_response(request, etag=etag)
+        if response is None:
+            response = await view(request, *args, **kwargs)
+        if etag is not None and request.method in ('GET', 'HEAD'):
+            response.headers.setdefault('ETag', etag)
+        return _patch_headers(response, max_age)
+
+    # Horizon wraps the views of its panels in plain functions: mark the
+    # wrapper so that they, and Django, still see a coroutine function.
+    return sync.markcoroutinefunction(wrapper)
@@ -0,0 +1,272 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Record the Watcher API calls made while serving a request.
+
+The calls are recorded where they leave the dashboard: the clients
+returned by :func:`watcher_dashboard.api.watcher.watcherclient` are
+wrapped in an :class:`InstrumentedClient`, and the microversion discovery
+of :mod:`watcher_dashboard.common.client` is wrapped by
+:func:`instrument`. Answers served from the per-request memo or the
+catalog caches are thus not recorded, and failures the dashboard handles
+are recorded with the exception the client raised.  Each call records a
+:class:`Call` on the request and is handed to the hooks listed in the
+``WATCHER_API_CALL_HOOKS`` setting, e.g. to forward it to statsd or
+OpenTelemetry::
+
+    def send_to_statsd(request, call):
+        statsd.timing(f'watcher.{call.name}', call.duration * 1000)
+
+Calls made in other threads for the request, e.g. by ``get_many``, are
+recorded on it as well.
+
+Once the response is sent, a summary of the request's calls is logged.
+The calls and the duration of the requests making them are also reported
+to :mod:`watcher_dashboard.common.metrics`.
+"""
+
+import collections
+import functools
+import logging
+import threading
+import time
+import weakref
+
+from django import dispatch
+from django.core import signals
+from watcherclient.common import base as wc_base
+
+from watcher_dashboard import config
+from watcher_dashboard.common import metrics
+
+
+LOG = logging.getLogger(__name__)
+
+_CALLS_ATTR = '_watcher_api_calls'
+
+Call = collections.namedtuple(
+    'Call', ('name', 'microversion', 'duration', 'size', 'outcome')
+)
+Call.__doc__ = """A Watcher API call.
+
+:param name: The called client method, e.g. ``'Audit.list'``.
+:param microversion: The requested ``api_version``, ``None`` for the
+    default one.
+:param duration: Wall-clock time of the call, in seconds.
+:param size: Number of resources returned.
+:param outcome: ``'ok'``, or the name of the exception raised.
+"""
+
+_local = threading.local()
+_calls_lock = threading.Lock()
+
+
+def _get_tracked():
+    tracked = getattr(_local, 'requests', None)
+    if tracked is None:
+        tracked = _local.requests = weakref.WeakSet()
+    return tracked
+
+
+def track(request):
+    """Log a summary of ``request`` once the current thread answers it.
+
+    Calls made for the request in other threads are recorded on the
+    request, but the thread serving it must be the one tracking it: see
+    :func:`watcher_dashboard.common.concurrency.fan_out`.
+    """
+    try:
+        _get_tracked().add(request)
+    except TypeError:
+        # Not weakly referenceable, e.g. None in unit tests.
+        pass
+
+
+def get_calls(request):
+    """Return the :class:`Call` recorded for ``request`` so far."""
+    return list(getattr(request, '__dict__', {}).get(_CALLS_ATTR, ()))
+
+
+def _get_size(result):
+    if result is None:
+        return 0
+    if isinstance(result, (list, dict)):
+        return len(result)
+    return 1
+
+
+def _record(request, call):
+    try:
+        with _calls_lock:
+            request.__dict__.setdefault(_CALLS_ATTR, []).append(call)
+    except AttributeError:
+        return
+    track(request)
+    metrics.API_CALL_DURATION.observe(
+        call.duration, method=call.name, outcome=call.outcome
+    )
+    for hook in config.get_api_call_hooks():
+        try:
+            hook(request, call)
+        except Exception:
+            LOG.warning("Watcher API call hook %r failed", hook, exc_info=True)
+
+
+def _call(request, name, microversion, func, *args, **kwargs):
+    """Call ``func(*args, **kwargs)``, recording it on ``request``."""
+    outcome = 'ok'
+    result = None
+    start = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+        return result
+    except Exception as exc:
+        outcome = type(exc).__name__
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        if request is not None:
+            _record(
+                request,
+                Call(name, microversion, duration, _get_size(result), outcome),
+            )
+
+
+def instrument(name):
+    """Decorator recording the calls of ``func(request, ...)`` as ``name``.
+
+    For the HTTP calls made outside of the client managers, see
+    :class:`InstrumentedClient`.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(request, *args, **kwargs):
+            return _call(request, name, None, func, request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class _InstrumentedManager:
+    """Proxy of a client manager recording the calls of its methods."""
+
+    def __init__(self, manager, name, request, microversion):
+        self._manager = manager
+        self._name = name
+        self._request = request
+        self._microversion = microversion
+
+    def __getattr__(self, attr):
+        value = getattr(self._manager, attr)
+        if attr.startswith('_') or not callable(value):
+            return value
+
+        @functools.wraps(value)
+        def call(*args, **kwargs):
+            return _call(
+                self._request,
+                f'{self._name}.{attr}',
+                self._microversion,
+                value,
+                *args,
+                **kwargs,
+            )
+
+        return call
+
+    def __repr__(self):
+        return f'<instrumented {self._manager!r}>'
+
+
+class InstrumentedClient:
+    """Proxy of a Watcher client recording the calls of its managers.
+
+    ``client.action_plan.list(...)`` is recorded as ``ActionPlan.list``
+    with the ``microversion`` the client was requested for.  The other
+    attributes, e.g. ``http_client``, are those of the wrapped client.
+
+    :param client: The ``watcherclient`` client, which may be pooled and
+        is left untouched.
+    :param request: The Django request the calls are recorded on.
+    :param microversion: The requested ``api_version``, ``None`` for the
+        default one.
+    """
+
+    def __init__(self, client, request, microversion=None):
+        self._client = client
+        self._request = request
+        self._microversion = microversion
+
+    def __getattr__(self, name):
+        value = getattr(self._client, name)
+        if name.startswith('_') or not isinstance(value, wc_base.Manager):
+            return value
+        return _InstrumentedManager(
+            value,
+            ''.join(part.title() for part in name.split('_')),
+            self._request,
+            self._microversion,
+        )
+
+    def __repr__(self):
+        return f'<instrumented {self._client!r}>'
+
+
+def summarize(calls):
+    """Return the number, failures and total duration of ``calls``."""
+    return {
+        'count': len(calls),
+        'failed': sum(1 for call in calls if call.outcome != 'ok'),
+        'duration': sum(call.duration for call in calls),
+    }
+
+
+@dispatch.receiver(signals.request_started)
+def _start_timer(sender, **kwargs):
+    _local.started = time.perf_counter()
+
+
+@dispatch.receiver(signals.request_finished)
+def _log_summary(sender, **kwargs):
+    tracked = getattr(_local, 'requests', None)
+    if not tracked:
+        return
+    requests = list(tracked)
+    tracked.clear()
+    started = getattr(_local, 'started', None)
+    for request in requests:
+        calls = get_calls(request)
+        if not calls:
+            continue
+        if started is not None:
+            match = getattr(request, 'resolver_match', None)
+            metrics.VIEW_DURATION.observe(
+                time.perf_counter() - started,
+                view=match.view_name if match else 'unknown',
+            )
+        summary = summarize(calls)
+        LOG.info(
+            '%(method)s %(path)s: %(count)d Watcher API calls, %(failed)d '
+            'failed, %(duration).3fs: %(calls)s',
+            dict(
+                summary,
+                method=request.method,
+                path=request.get_full_path(),
+                calls=', '.join(
+                    f'{call.name}={call.duration:.3f}s'
+                    + ('' if call.outcome == 'ok' else f'[{call.outcome}]')
+                    for call in calls
+                ),
+            ),
+        )
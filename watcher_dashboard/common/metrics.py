@@ -0,0 +1,370 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Aggregate metrics of the Watcher panels, in Prometheus text format.
+
+Metrics are only collected when ``WATCHER_METRICS_ENABLED`` is set, and
+are then served at ``/api/watcher/metrics/``. They are kept in memory by
+each process, behind a single lock, so they can be updated from any
+thread.
+
+WSGI servers usually run several worker processes. When the
+``WATCHER_METRICS_DIR`` setting names a directory shared by these workers,
+each of them regularly writes its metrics to a file of that directory and
+the process answering a scrape adds up the files of all workers. The files
+of the workers that exited are folded into a single file, including when
+a new worker gets the PID of an exited one, so that counters never go
+backwards.
+"""
+
+import atexit
+import fcntl
+import glob
+import json
+import logging
+import os
+import threading
+import time
+
+from django import dispatch
+from django.core import signals
+
+from watcher_dashboard import config
+from watcher_dashboard.common import cache
+
+
+LOG = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Upper bounds, in seconds, of the histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Minimum time, in seconds, between two writes of the metrics file of a
+# worker process
+FLUSH_INTERVAL = 5
+
+_FILE_PREFIX = 'watcher-dashboard-'
+
+# Metrics of the workers that exited, and lock serializing its updates
+_EXITED_FILE = f'{_FILE_PREFIX}exited.json'
+_LOCK_FILE = f'{_FILE_PREFIX}lock'
+
+_lock = threading.Lock()
+_metrics = {}
+_last_flush = 0.0
+# Whether this process already wrote its metrics file
+_file_owned = False
+
+
+class Counter:
+    """A monotonically increasing value, per set of label values."""
+
+    type = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        _metrics[name] = self
+
+    def _key(self, labels):
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def inc(self, amount=1, **labels):
+        """Add ``amount`` to the value of ``labels``."""
+        if not config.get_metrics_enabled():
+            return
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, value, **labels):
+        """Replace the value of ``labels``, for counters kept elsewhere."""
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = value
+
+    def _samples(self, key, value):
+        yield self.name, (), value
+
+
+class Histogram(Counter):
+    """Counts of observed values per bucket, per set of label values."""
+
+    type = 'histogram'
+
+    def __init__(
+        self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        """Count ``value`` in the buckets of ``labels``."""
+        if not config.get_metrics_enabled():
+            return
+        key = self._key(labels)
+        with _lock:
+            # The cumulative count of each bucket, then the sum and count
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[i] += 1
+            entry[-2] += value
+            entry[-1] += 1
+
+    def _samples(self, key, value):
+        for bound, count in zip(self.buckets, value):
+            yield f'{self.name}_bucket', (('le', repr(float(bound))),), count
+        yield f'{self.name}_bucket', (('le', '+Inf'),), value[-1]
+        yield f'{self.name}_sum', (), value[-2]
+        yield f'{self.name}_count', (), value[-1]
+
+
+API_CALL_DURATION = Histogram(
+    'watcher_dashboard_api_call_duration_seconds',
+    'Duration of the Watcher API calls made by the dashboard.',
+    ('method', 'outcome'),
+)
+VIEW_DURATION = Histogram(
+    'watcher_dashboard_view_duration_seconds',
+    'Duration of the requests that called the Watcher API.',
+    ('view',),
+)
+CACHE_LOOKUPS = Counter(
+    'watcher_dashboard_cache_lookups_total',
+    'Lookups in the dashboard caches.',
+    ('cache', 'result'),
+)
+BATCH_ACTION_OBJECTS = Counter(
+    'watcher_dashboard_batch_action_objects_total',
+    'Objects processed by the table batch actions.',
+    ('action', 'outcome'),
+)
+BATCH_ACTION_DURATION = Histogram(
+    'watcher_dashboard_batch_action_duration_seconds',
+    'Duration of the table batch actions.',
+    ('action',),
+)
+
+
+def _collect_caches():
+    for name, ttl_cache in cache.get_named_caches().items():
+        stats = ttl_cache.stats()
+        CACHE_LOOKUPS.set(stats['total_hits'], cache=name, result='hit')
+        CACHE_LOOKUPS.set(stats['total_misses'], cache=name, result='miss')
+
+
+def _snapshot():
+    if config.get_metrics_enabled():
+        _collect_caches()
+    with _lock:
+        return {
+            name: [[list(key), value] for key, value in metric._values.items()]
+            for name, metric in _metrics.items()
+        }
+
+
+def _merge(snapshots):
+    merged = {name: {} for name in _metrics}
+    for snapshot in snapshots:
+        for name, values in snapshot.items():
+            if name not in merged:
+                continue
+            for key, value in values:
+                key = tuple(key)
+                known = merged[name].get(key)
+                if known is None:
+                    merged[name][key] = value
+                elif isinstance(value, list):
+                    merged[name][key] = [a + b for a, b in zip(known, value)]
+                else:
+                    merged[name][key] = known + value
+    return merged
+
+
+def _get_path(directory):
+    return os.path.join(directory, f'{_FILE_PREFIX}{os.getpid()}.json')
+
+
+def _read(path):
+    try:
+        with open(path) as metrics_file:
+            return json.load(metrics_file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        LOG.debug("Unable to read the metrics of %s", path)
+        return None
+
+
+def _write(path, snapshot):
+    with open(f'{path}.tmp', 'w') as metrics_file:
+        json.dump(snapshot, metrics_file)
+    os.replace(f'{path}.tmp', path)
+
+
+def _has_exited(path):
+    pid = os.path.basename(path)[len(_FILE_PREFIX) : -len('.json')]
+    if not pid.isdigit():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass
+    return False
+
+
+def _fold(directory, paths):
+    """Add the metrics files at ``paths`` to the exited workers' file.
+
+    The files are removed once added, so that a new worker given the PID
+    of an exited one does not overwrite its metrics.
+    """
+    exited_path = os.path.join(directory, _EXITED_FILE)
+    with open(os.path.join(directory, _LOCK_FILE), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            snapshots = [
+                snapshot
+                for snapshot in map(_read, paths)
+                if snapshot is not None
+            ]
+            if not snapshots:
+                # Another process already folded these files.
+                return
+            exited = _read(exited_path)
+            if exited is not None:
+                snapshots.append(exited)
+            _write(
+                exited_path,
+                {
+                    name: [[list(key), value] for key, value in values.items()]
+                    for name, values in _merge(snapshots).items()
+                },
+            )
+            for path in paths:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def flush(force=False):
+    """Write the metrics of this process to ``WATCHER_METRICS_DIR``.
+
+    Writes are skipped if the last one is less than :data:`FLUSH_INTERVAL`
+    seconds old, unless ``force`` is set.
+    """
+    global _last_flush, _file_owned
+    directory = config.get_metrics_dir()
+    if not directory or not config.get_metrics_enabled():
+        return
+    now = time.monotonic()
+    if not force and now - _last_flush < FLUSH_INTERVAL:
+        return
+    _last_flush = now
+
+    path = _get_path(directory)
+    try:
+        if not _file_owned and os.path.exists(path):
+            # Left by an exited worker that had the same PID.
+            _fold(directory, [path])
+        _write(path, _snapshot())
+        _file_owned = True
+    except OSError:
+        LOG.warning("Unable to write the metrics to %s", path, exc_info=True)
+
+
+def collect():
+    """Return the metrics of every worker process, added up."""
+    snapshots = [_snapshot()]
+    directory = config.get_metrics_dir()
+    if directory:
+        own_path = _get_path(directory)
+        paths = [
+            path
+            for path in glob.glob(
+                os.path.join(directory, f'{_FILE_PREFIX}*.json')
+            )
+            if path != own_path
+        ]
+        exited = [path for path in paths if _has_exited(path)]
+        if exited:
+            try:
+                _fold(directory, exited)
+            except OSError:
+                LOG.warning("Unable to fold the metrics", exc_info=True)
+                exited = []
+        exited_path = os.path.join(directory, _EXITED_FILE)
+        for path in {exited_path, *paths} - set(exited):
+            snapshot = _read(path)
+            if snapshot is not None:
+                snapshots.append(snapshot)
+    return _merge(snapshots)
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return f'{{{pairs}}}'
+
+
+def render():
+    """Return the metrics of every worker process in Prometheus format."""
+    merged = collect()
+    lines = []
+    for name, metric in _metrics.items():
+        lines.append(f'# HELP {name} {metric.documentation}')
+        lines.append(f'# TYPE {name} {metric.type}')
+        for key, value in sorted(merged[name].items()):
+            labels = tuple(zip(metric.labelnames, key))
+            for sample, extra, sample_value in metric._samples(key, value):
+                lines.append(
+                    f'{sample}{_format_labels(labels + extra)} '
+                    f'{float(sample_value)!r}'
+                )
+    return '\n'.join(lines) + '\n'
+
+
+def _reset():
+    global _lock, _last_flush, _file_owned
+    _lock = threading.Lock()
+    _last_flush = 0.0
+    _file_owned = False
+    for metric in _metrics.values():
+        metric._values = {}
+
+
+if hasattr(os, 'register_at_fork'):
+    # The values of the parent belong to its own metrics file.
+    os.register_at_fork(after_in_child=_reset)
+
+atexit.register(flush, force=True)
+
+
+@dispatch.receiver(signals.request_finished)
+def _flush_on_request_finished(sender, **kwargs):
+    flush()
@@ -0,0 +1,243 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Filter queries of the Watcher tables.
+
+A query is a list of conditions joined by ``and``, e.g.::
+
+    state = FAILED and action_type in (migrate, resize)
+
+Conditions are ``field = value``, ``field != value``, ``field in (values)``
+and ``field not in (values)``; values containing spaces or operators are
+quoted. Comparisons ignore case.
+
+:func:`compile_query` turns a query into the filters of the Watcher API list
+call, for the ``field = value`` conditions on fields the API can filter
+on, and a predicate checking the other conditions on the listed
+resources. Compiled queries are cached, and the predicate checks one
+condition at a time over a whole batch of resources rather than
+interpreting the query for each of them.
+"""
+
+import functools
+import itertools
+import operator
+import re
+
+from django.utils.translation import gettext_lazy as _
+
+
+# Value of the table filter choice taking a query
+FIELD = 'query'
+
+# Number of resources the predicate checks at once
+CHUNK_SIZE = 1000
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<op>!=|=|\(|\)|,)
+        |"(?P<dquoted>[^"]*)"
+        |'(?P<squoted>[^']*)'
+        |(?P<word>[^\s=!(),"']+)
+    )""",
+    re.VERBOSE,
+)
+
+
+class QueryError(ValueError):
+    """An invalid query, with a message meant for the user."""
+
+
+def _tokenize(text):
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if match is None:
+            raise QueryError(
+                _("Unexpected character %(char)r in the query.")
+                % {'char': text[position:].lstrip()[:1]}
+            )
+        position = match.end()
+        if match.group('op') is not None:
+            tokens.append(('op', match.group('op')))
+        elif match.group('word') is not None:
+            tokens.append(('word', match.group('word')))
+        else:
+            value = match.group('dquoted')
+            if value is None:
+                value = match.group('squoted')
+            tokens.append(('value', value))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text):
+        self.tokens = _tokenize(text)
+        self.position = 0
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None)
+
+    def next(self, expected):
+        kind, symbol = self.peek()
+        if kind is None:
+            raise QueryError(
+                _("The query ends where %(expected)s was expected.")
+                % {'expected': expected}
+            )
+        self.position += 1
+        return kind, symbol
+
+    def keyword(self, word):
+        kind, symbol = self.peek()
+        if kind == 'word' and symbol.lower() == word:
+            self.position += 1
+            return True
+        return False
+
+    def value(self):
+        kind, symbol = self.next(_("a value"))
+        if kind == 'op':
+            raise QueryError(
+                _("Expected a value, got %(token)r.") % {'token': symbol}
+            )
+        return symbol
+
+    def values(self):
+        kind, symbol = self.next('(')
+        if symbol != '(' or kind != 'op':
+            raise QueryError(
+                _("Expected '(', got %(token)r.") % {'token': symbol}
+            )
+        values = [self.value()]
+        while True:
+            kind, symbol = self.next(')')
+            if kind == 'op' and symbol == ')':
+                return values
+            if kind != 'op' or symbol != ',':
+                raise QueryError(
+                    _("Expected ',' or ')', got %(token)r.")
+                    % {'token': symbol}
+                )
+            values.append(self.value())
+
+    def condition(self):
+        kind, field = self.next(_("a field"))
+        if kind != 'word':
+            raise QueryError(
+                _("Expected a field, got %(token)r.") % {'token': field}
+            )
+        if self.keyword('in'):
+            return field, False, self.values()
+        if self.keyword('not'):
+            if not self.keyword('in'):
+                raise QueryError(_("Expected 'in' after 'not'."))
+            return field, True, self.values()
+        kind, symbol = self.next(_("an operator"))
+        if kind != 'op' or symbol not in ('=', '!='):
+            raise QueryError(
+                _("Expected '=', '!=', 'in' or 'not in', got %(token)r.")
+                % {'token': symbol}
+            )
+        return field, symbol == '!=', [self.value()]
+
+    def parse(self):
+        conditions = [self.condition()]
+        while self.peek()[0] is not None:
+            if not self.keyword('and'):
+                raise QueryError(
+                    _("Expected 'and', got %(token)r.")
+                    % {'token': self.peek()[1]}
+                )
+            conditions.append(self.condition())
+        return conditions
+
+
+def _normalize(value):
+    return '' if value is None else str(value).casefold()
+
+
+class Query:
+    """A compiled query.
+
+    :ivar api_filters: The ``{field: value}`` filters of the API list call.
+    :ivar tests: The ``(field, values, negated)`` conditions left to check
+        on the listed resources.
+    """
+
+    def __init__(self, api_filters, tests):
+        self.api_filters = api_filters
+        self.tests = tests
+
+    def filter(self, resources):
+        """Yield the ``resources`` matching the local conditions."""
+        if not self.tests:
+            yield from resources
+            return
+        resources = iter(resources)
+        while True:
+            chunk = list(itertools.islice(resources, CHUNK_SIZE))
+            if not chunk:
+                return
+            keep = [True] * len(chunk)
+            for field, values, negated in self.tests:
+                column = map(
+                    _normalize, map(operator.attrgetter(field), chunk)
+                )
+                keep = [
+                    kept and ((value in values) is not negated)
+                    for kept, value in zip(keep, column)
+                ]
+            yield from itertools.compress(chunk, keep)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_query(text, api_fields, fields):
+    """Compile the ``text`` query.
+
+    :param text: The query typed by the user.
+    :param api_fields: The fields the Watcher API list call filters on.
+    :param fields: The other fields the query may test, which the listed
+        resources must hold.
+    :returns: A :class:`Query`.
+    :raises QueryError: if the query is invalid.
+    """
+    api_filters = {}
+    tests = []
+    for field, negated, values in _Parser(text).parse():
+        if (
+            field in api_fields
+            and not negated
+            and len(values) == 1
+            and field not in api_filters
+        ):
+            api_filters[field] = values[0]
+        elif field in fields:
+            tests.append((field, frozenset(map(_normalize, values)), negated))
+        elif field in api_fields:
+            raise QueryError(
+                _("%(field)s can only be tested once, with '='.")
+                % {'field': field}
+            )
+        else:
+            raise QueryError(
+                _("Unknown field %(field)s, use one of: %(fields)s.")
+                % {
+                    'field': field,
+                    'fields': ', '.join(sorted(set(api_fields) | set(fields))),
+                }
+            )
+    return Query(api_filters, tuple(tests))
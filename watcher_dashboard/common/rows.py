@@ -0,0 +1,127 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compact rows holding only the attributes a table displays.
+
+watcherclient resources keep every attribute the API returned, in a dict
+per resource, and large tables (thousands of actions in an action plan)
+only show a few of them. :func:`project` turns a list result into
+instances of a ``__slots__`` class holding just the attributes a table
+needs; see :func:`get_table_fields`.
+
+Any other attribute of the resource is still available: its first access
+loads the full resource, once per row, which is meant for the occasional
+detail link or row action rather than for every row of a table.
+"""
+
+import functools
+import logging
+
+
+LOG = logging.getLogger(__name__)
+
+
+class Row:
+    """A resource reduced to some of its attributes."""
+
+    __slots__ = ('_loader', '_resource')
+
+    # Attributes held by the row, and every attribute of the resource
+    _fields = ()
+    _known = frozenset()
+
+    def __init__(self, loader, *values):
+        self._loader = loader
+        self._resource = None
+        for name, value in zip(self._fields, values):
+            setattr(self, name, value)
+
+    def __getattr__(self, name):
+        # Only called for the attributes the row does not hold.
+        if name not in self._known:
+            raise AttributeError(name)
+        if self._resource is None:
+            LOG.debug(
+                "Loading %s %s for its %s attribute",
+                type(self).__name__,
+                self.uuid,
+                name,
+            )
+            self._resource = self._loader(self.uuid)
+        return getattr(self._resource, name)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {self.to_dict()!r}>'
+
+    def to_dict(self):
+        """Return the attributes held by the row."""
+        return {name: getattr(self, name) for name in self._fields}
+
+
+@functools.lru_cache(maxsize=64)
+def _get_row_class(name, fields, known):
+    return type(
+        f'{name}Row',
+        (Row,),
+        {'__slots__': fields, '_fields': fields, '_known': known},
+    )
+
+
+def _get_keys(resource):
+    if hasattr(resource, 'to_dict'):
+        return resource.to_dict().keys()
+    return vars(resource).keys()
+
+
+def project(resources, fields, loader):
+    """Return ``resources`` as rows holding only ``fields``.
+
+    The ``uuid`` attribute, and ``name`` when the resources have one
+    (Horizon shows it in the confirmation of row actions), are always
+    kept.
+
+    :param resources: watcherclient resources, or ``APIDictWrapper``
+        instances, all of the same kind.
+    :param fields: Names of the attributes to keep. The rows have these
+        attributes even when the resources lack them, so that views can
+        set them.
+    :param loader: Called with the UUID of a row to load the full
+        resource the first time one of its other attributes is accessed.
+    :returns: A list of :class:`Row`, in the order of ``resources``.
+    """
+    resources = list(resources)
+    if not resources:
+        return []
+    known = frozenset(_get_keys(resources[0]))
+    names = ('uuid', 'name') if 'name' in known else ('uuid',)
+    fields = tuple(dict.fromkeys(names + tuple(fields)))
+    row_class = _get_row_class(type(resources[0]).__name__, fields, known)
+    return [
+        row_class(loader, *(getattr(item, name, None) for name in fields))
+        for item in resources
+    ]
+
+
+def get_table_fields(table_class):
+    """Return the attributes the rows of ``table_class`` need.
+
+    These are the attributes of the columns with a ``transform`` name and
+    the ``row_fields`` declared by the table for its callable columns, row
+    actions and row class.
+    """
+    fields = [
+        column.transform
+        for column in table_class.base_columns.values()
+        if isinstance(column.transform, str) and not column.auto
+    ]
+    fields.extend(getattr(table_class, 'row_fields', ()))
+    return tuple(dict.fromkeys(fields))
@@ -0,0 +1,355 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Batched refresh of table rows and concurrent table batch actions.
+
+Instead of letting every row poll its own ``Row.get_data`` (one Watcher API
+call per row and per poll cycle), the pages post the visible rows to a
+single endpoint per table, as ``<uuid>,<state>,<updated_at>`` lines of the
+``rows`` field: a body rather than query parameters, as a page may hold
+thousands of rows. The endpoint fetches these resources only, with as few
+calls as possible (see ``Action.get_many``), and answers with the rendered
+HTML of the rows whose state or update time changed only, along with the
+UUIDs of the rows that no longer exist::
+
+    {"rows": {"<uuid>": "<tr ...>...</tr>"}, "deleted": ["<uuid>"]}
+
+Batch actions mixing in :class:`ConcurrentBatchActionMixin` process the
+selected objects concurrently instead of one after another.
+
+Tables whose filter action derives from :class:`QueryFilterAction` can
+also be filtered with a query, see :mod:`watcher_dashboard.common.query`.
+"""
+
+import functools
+import logging
+import time
+
+import horizon.exceptions
+import horizon.messages
+import horizon.tables
+
+from django import shortcuts
+from django.http import JsonResponse
+from django.utils.translation import gettext_lazy as _
+from horizon.utils import functions
+
+from watcher_dashboard import config
+from watcher_dashboard.common import concurrency
+from watcher_dashboard.common import metrics
+from watcher_dashboard.common import query
+from watcher_dashboard.common import rows
+
+
+LOG = logging.getLogger(__name__)
+
+ROW_SEPARATOR = ','
+
+QUERY_CHOICE = (
+    query.FIELD,
+    _("Query"),
+    False,
+    _("e.g. state=FAILED and action_type in (migrate, resize)"),
+)
+
+
+class RefreshableRow(horizon.tables.Row):
+    """Row exposing the state and update time of its datum.
+
+    The ``data-state`` and ``data-updated-at`` attributes are sent back by
+    the page to the refresh endpoint, see :func:`refresh_rows`. Rows whose
+    state is one of ``final_states`` are flagged with ``data-final`` and
+    are not refreshed anymore.
+    """
+
+    final_states = ()
+
+    def load_cells(self, datum=None):
+        super().load_cells(datum)
+        state = getattr(self.datum, 'state', None) or ''
+        self.attrs['data-state'] = state
+        self.attrs['data-updated-at'] = (
+            getattr(self.datum, 'updated_at', None) or ''
+        )
+        if state in self.final_states:
+            self.attrs['data-final'] = 'true'
+
+
+class QueryFilterAction(horizon.tables.FilterAction):
+    """Server filter also taking a query, with the :data:`QUERY_CHOICE`.
+
+    The conditions of the query the Watcher API cannot check are checked
+    on the listed resources, see :func:`get_query`.
+    """
+
+    filter_type = "server"
+
+    def filter(self, table, data, filter_string):
+        try:
+            compiled = get_query(table)
+        except query.QueryError as exc:
+            horizon.messages.error(table.request, str(exc))
+            return []
+        if compiled is None:
+            return data
+        return list(compiled.filter(data))
+
+
+def get_query(table):
+    """Return the query ``table`` is filtered with, compiled.
+
+    The query may test the fields of the API filters of the table and the
+    attributes its rows hold, see
+    :func:`watcher_dashboard.common.rows.get_table_fields`.
+
+    :returns: A :class:`watcher_dashboard.common.query.Query`, or ``None``
+        if the table is not filtered with a query.
+    :raises watcher_dashboard.common.query.QueryError: if the query is
+        invalid.
+    """
+    filter_action = table._meta._filter_action
+    if not filter_action or table.get_filter_field() != query.FIELD:
+        return None
+    filter_string = table.get_filter_string()
+    if not filter_string:
+        return None
+    api_fields = tuple(
+        choice[0]
+        for choice in filter_action.filter_choices
+        if filter_action.is_api_filter(choice[0])
+    )
+    fields = ('uuid', 'name') + rows.get_table_fields(type(table))
+    return query.compile_query(filter_string, api_fields, fields)
+
+
+def get_query_select(table):
+    """Return the function keeping the resources matching the query.
+
+    Passed as ``select`` to the ``list_paged`` methods of the API
+    resources, it lets them fill the pages of ``table`` with the resources
+    the local conditions of its query keep.
+
+    :returns: A callable taking and returning a list of resources, or
+        ``None`` if the query has no local conditions.
+    """
+    try:
+        compiled = get_query(table)
+    except query.QueryError:
+        # Reported by QueryFilterAction.filter.
+        return None
+    if compiled is None or not compiled.tests:
+        return None
+    return lambda resources: list(compiled.filter(resources))
+
+
+def get_api_filters(table):
+    """Return the server-side filter applied to ``table`` as API filters.
+
+    :returns: A ``{field: value}`` dict, empty unless the user filtered the
+        table on a field the Watcher API can filter on, or with a query
+        testing such fields.
+    """
+    filters = {}
+    filter_action = table._meta._filter_action
+    if filter_action:
+        filter_field = table.get_filter_field()
+        if filter_field == query.FIELD:
+            try:
+                compiled = get_query(table)
+            except query.QueryError:
+                # Reported by QueryFilterAction.filter.
+                compiled = None
+            if compiled is not None:
+                filters.update(compiled.api_filters)
+        elif filter_action.is_api_filter(filter_field):
+            filter_string = table.get_filter_string()
+            if filter_field and filter_string:
+                filters[filter_field] = filter_string
+    return filters
+
+
+def parse_rows(request):
+    """Return the ``{uuid: (state, updated_at)}`` rows known by the page."""
+    known = {}
+    for row in request.POST.get('rows', '').splitlines():
+        uuid, _sep, fingerprint = row.partition(ROW_SEPARATOR)
+        state, _sep, updated_at = fingerprint.partition(ROW_SEPARATOR)
+        if uuid:
+            known[uuid] = (state, updated_at)
+    return known
+
+
+def refresh_rows(
+    request, table_class, get_many_func, table_kwargs=None, **filters
+):
+    """Return the rows of ``table_class`` that changed since the page load.
+
+    :param request: The AJAX POST request, carrying the rows known by the
+        page.
+    :param table_class: The ``DataTable`` used to render the changed rows.
+    :param get_many_func: Called once as
+        ``get_many_func(request, uuids, **filters)`` to fetch the current
+        resources of the known rows, keyed by UUID.
+    :param table_kwargs: Extra keyword arguments for ``table_class``.
+    :param filters: API filters narrowing down the resources to fetch.
+    """
+    known = parse_rows(request)
+    if not known:
+        return JsonResponse({'rows': {}, 'deleted': []})
+
+    try:
+        visible = get_many_func(request, list(known), **filters)
+    except Exception:
+        LOG.exception("Unable to refresh the %s rows", table_class.Meta.name)
+        return JsonResponse({'error': 'Unable to refresh rows'}, status=500)
+
+    changed = [
+        item
+        for uuid, item in visible.items()
+        if known[uuid]
+        != (
+            getattr(item, 'state', None) or '',
+            getattr(item, 'updated_at', None) or '',
+        )
+    ]
+
+    table = table_class(request, data=changed, **(table_kwargs or {}))
+    rows = {
+        table.get_object_id(row.datum): row.render()
+        for row in table.get_rows()
+    }
+    deleted = [uuid for uuid in known if uuid not in visible]
+    return JsonResponse({'rows': rows, 'deleted': deleted})
+
+
+class ConcurrentBatchActionMixin:
+    """Run the API call of a ``BatchAction`` concurrently for all objects.
+
+    Horizon calls ``action`` for each selected object in turn, so archiving
+    a few hundred audits keeps the request busy for minutes.  This mixin
+    runs up to ``WATCHER_BATCH_ACTION_MAX_WORKERS`` calls at once and then
+    reports the outcome the way Horizon does: one message listing the
+    processed objects and one listing those that failed or were not
+    allowed.
+
+    ``action`` runs in a worker thread: it must raise on failure rather
+    than adding messages to the request itself.  ``update`` still runs in
+    the thread serving the request.
+    """
+
+    def handle(self, table, request, obj_ids):
+        allowed = []
+        action_not_allowed = []
+        for datum_id in obj_ids:
+            datum = table.get_object_by_id(datum_id)
+            datum_display = table.get_object_display(datum) or datum_id
+            if table._filter_action(self, request, datum):
+                allowed.append((datum_id, datum, datum_display))
+                continue
+            action_not_allowed.append(datum_display)
+            LOG.warning(
+                'Permission denied to %(name)s: "%(dis)s"',
+                {
+                    'name': self._get_action_name(past=True).lower(),
+                    'dis': datum_display,
+                },
+            )
+
+        start = time.perf_counter()
+        results = concurrency.run_bounded(
+            request,
+            [
+                functools.partial(self.action, request, datum_id)
+                for datum_id, _datum, _display in allowed
+            ],
+            config.get_batch_action_max_workers(),
+        )
+
+        action_success = []
+        action_failure = []
+        for (datum_id, datum, datum_display), result in zip(allowed, results):
+            try:
+                result.result()
+                self.update(request, datum)
+            except horizon.exceptions.HandledException as exc:
+                # The message was already added by exceptions.handle().
+                LOG.warning(
+                    'Action %(action)s failed for "%(dis)s": %(reason)s',
+                    {
+                        'action': self._get_action_name(past=True).lower(),
+                        'dis': datum_display,
+                        'reason': exc.wrapped[1],
+                    },
+                )
+            except Exception as exc:
+                action_failure.append(datum_display)
+                LOG.warning(
+                    'Action %(action)s failed for "%(dis)s": %(reason)s',
+                    {
+                        'action': self._get_action_name(past=True).lower(),
+                        'dis': datum_display,
+                        'reason': exc,
+                    },
+                )
+            else:
+                action_success.append(datum_display)
+                self.success_ids.append(datum_id)
+                LOG.info(
+                    '%(action)s: "%(dis)s"',
+                    {
+                        'action': self._get_action_name(past=True),
+                        'dis': datum_display,
+                    },
+                )
+
+        action = f'{table._meta.name}:{self.name}'
+        metrics.BATCH_ACTION_DURATION.observe(
+            time.perf_counter() - start, action=action
+        )
+        for outcome, objs in (
+            ('success', action_success),
+            ('failure', action_failure),
+            ('not_allowed', action_not_allowed),
+        ):
+            if objs:
+                metrics.BATCH_ACTION_OBJECTS.inc(
+                    len(objs), action=action, outcome=outcome
+                )
+
+        success_message_level = getattr(
+            horizon.messages, self.default_message_level
+        )
+        if action_not_allowed:
+            msg = _('You are not allowed to %(action)s: %(objs)s')
+            params = {
+                'action': self._get_action_name(action_not_allowed).lower(),
+                'objs': functions.lazy_join(', ', action_not_allowed),
+            }
+            horizon.messages.error(request, msg % params)
+            success_message_level = horizon.messages.info
+        if action_failure:
+            msg = _('Unable to %(action)s: %(objs)s')
+            params = {
+                'action': self._get_action_name(action_failure).lower(),
+                'objs': functions.lazy_join(', ', action_failure),
+            }
+            horizon.messages.error(request, msg % params)
+            success_message_level = horizon.messages.info
+        if action_success:
+            msg = _('%(action)s: %(objs)s')
+            params = {
+                'action': self._get_action_name(action_success, past=True),
+                'objs': functions.lazy_join(', ', action_success),
+            }
+            success_message_level(request, msg % params)
+
+        return shortcuts.redirect(self.get_success_url(request))
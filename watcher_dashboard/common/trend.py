@@ -0,0 +1,138 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Trend of the global efficacy of the action plans of an audit.
+
+A continuous audit creates a new action plan at every interval, each with
+its own global efficacy indicators. :func:`build` gathers the values of
+each indicator across the plans, oldest first, and computes their
+statistics in a single pass over each series: minimum, maximum, change
+from the first to the last plan and a rolling mean. Long series are then
+reduced to at most ``max_points`` buckets, so that what is sent to the
+browser does not grow with the number of plans::
+
+    {
+        "indicators": [
+            {
+                "name": "...", "unit": "...", "count": <plans>,
+                "min": ..., "max": ..., "first": ..., "last": ...,
+                "delta": <last - first>,
+                "points": [
+                    ["<created_at>", <mean>, <rolling mean>, <min>, <max>],
+                    ...
+                ]
+            }
+        ]
+    }
+
+Each point stands for a bucket of consecutive plans: the creation time of
+its first plan, the mean, minimum and maximum of its values and the
+rolling mean at its last plan.
+"""
+
+import math
+
+
+# Number of consecutive plans averaged by the rolling mean
+DEFAULT_WINDOW = 5
+
+# Maximum number of points per indicator
+DEFAULT_MAX_POINTS = 200
+
+
+def _to_number(value):
+    if isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _collect(action_plans):
+    series = {}
+    units = {}
+    plans = sorted(
+        action_plans, key=lambda plan: getattr(plan, 'created_at', '') or ''
+    )
+    for plan in plans:
+        for indicator in getattr(plan, 'global_efficacy', None) or ():
+            value = _to_number(indicator.get('value'))
+            name = indicator.get('name')
+            if name is None or value is None:
+                continue
+            series.setdefault(name, ([], []))
+            series[name][0].append(plan.created_at)
+            series[name][1].append(value)
+            units.setdefault(name, indicator.get('unit'))
+    return series, units
+
+
+def rolling_mean(values, window):
+    """Return the mean of each value and the ``window - 1`` before it."""
+    means = []
+    total = 0.0
+    for i, value in enumerate(values):
+        total += value
+        if i >= window:
+            total -= values[i - window]
+        means.append(total / min(i + 1, window))
+    return means
+
+
+def downsample(times, values, means, max_points):
+    """Reduce a series to at most ``max_points`` points, see :func:`build`."""
+    size = max(1, math.ceil(len(values) / max_points))
+    points = []
+    for start in range(0, len(values), size):
+        bucket = values[start : start + size]
+        points.append(
+            [
+                times[start],
+                sum(bucket) / len(bucket),
+                means[start + len(bucket) - 1],
+                min(bucket),
+                max(bucket),
+            ]
+        )
+    return points
+
+
+def build(action_plans, window=DEFAULT_WINDOW, max_points=DEFAULT_MAX_POINTS):
+    """Return the efficacy trend of ``action_plans``.
+
+    :param action_plans: The action plans of an audit, with at least their
+        ``created_at`` and ``global_efficacy`` attributes, in any order.
+    :param window: Number of plans averaged by the rolling mean.
+    :param max_points: Maximum number of points per indicator.
+    :returns: A dict, see the module documentation.
+    """
+    series, units = _collect(action_plans)
+    indicators = []
+    for name, (times, values) in series.items():
+        indicators.append(
+            {
+                'name': name,
+                'unit': units[name],
+                'count': len(values),
+                'min': min(values),
+                'max': max(values),
+                'first': values[0],
+                'last': values[-1],
+                'delta': values[-1] - values[0],
+                'points': downsample(
+                    times, values, rolling_mean(values, window), max_points
+                ),
+            }
+        )
+    return {'indicators': indicators}
@@ -23,6 +23,7 @@ write.
 import functools
 
 from django.conf import settings
+from django.utils import module_loading
 from oslo_utils import strutils
 
 
@@ -89,3 +90,188 @@ def set_policy_file(service: str, filename: str) -> None:
     policy_files[service] = filename
     settings.POLICY_FILES = policy_files
     get_policy_files.cache_clear()
+
+
+def _get_int(name: str, default: int, minimum: int = 1) -> int:
+    value = getattr(settings, name, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError(f"{name} must be an int, got {type(value)!r}")
+    if value < minimum:
+        raise ValueError(f"{name} must be >= {minimum}")
+    return value
+
+
+@functools.cache
+def get_max_version_cache_ttl() -> int:
+    """Return how long a discovered max microversion is cached, in seconds.
+
+    Reads the WATCHER_MAX_VERSION_CACHE_TTL setting and defaults to 300.
+    A value of 0 disables the cache.  Raises TypeError for non-integer
+    values and ValueError for negative ones.
+    """
+    return _get_int('WATCHER_MAX_VERSION_CACHE_TTL', 300, minimum=0)
+
+
+@functools.cache
+def get_client_pool_size() -> int:
+    """Return the maximum number of pooled Watcher clients per process.
+
+    Reads the WATCHER_CLIENT_POOL_SIZE setting and defaults to 100.
+    Raises TypeError for non-integer values and ValueError for values
+    lower than 1.
+    """
+    return _get_int('WATCHER_CLIENT_POOL_SIZE', 100)
+
+
+@functools.cache
+def get_connection_pool_maxsize() -> int:
+    """Return the number of keep-alive connections kept per endpoint.
+
+    Reads the WATCHER_CONNECTION_POOL_MAXSIZE setting and defaults to 10.
+    Raises TypeError for non-integer values and ValueError for values
+    lower than 1.
+    """
+    return _get_int('WATCHER_CONNECTION_POOL_MAXSIZE', 10)
+
+
+@functools.cache
+def get_fan_out_max_workers() -> int:
+    """Return the size of the pool running concurrent Watcher API calls.
+
+    Reads the WATCHER_FAN_OUT_MAX_WORKERS setting and defaults to 8.
+    A value of 0 makes views issue their API calls sequentially.  Raises
+    TypeError for non-integer values and ValueError for negative ones.
+    """
+    return _get_int('WATCHER_FAN_OUT_MAX_WORKERS', 8, minimum=0)
+
+
+@functools.cache
+def get_batch_action_max_workers() -> int:
+    """Return how many objects a table batch action processes at once.
+
+    Reads the WATCHER_BATCH_ACTION_MAX_WORKERS setting and defaults to 8.
+    A value of 0 processes the selected objects one after another.  Raises
+    TypeError for non-integer values and ValueError for negative ones.
+    """
+    return _get_int('WATCHER_BATCH_ACTION_MAX_WORKERS', 8, minimum=0)
+
+
+@functools.cache
+def get_export_page_size() -> int:
+    """Return how many resources the table exports fetch per API call.
+
+    Reads the WATCHER_EXPORT_PAGE_SIZE setting and defaults to 1000, the
+    default maximum page size of the Watcher API.  Raises TypeError for
+    non-integer values and ValueError for values lower than 1.
+    """
+    return _get_int('WATCHER_EXPORT_PAGE_SIZE', 1000)
+
+
+@functools.cache
+def get_audit_template_select_threshold() -> int:
+    """Return how many audit templates the audit form lists at most.
+
+    Reads the WATCHER_AUDIT_TEMPLATE_SELECT_THRESHOLD setting and defaults
+    to 200.  Above it, the audit creation form searches the templates as
+    the user types instead of listing all of them.  Raises TypeError for
+    non-integer values and ValueError for negative ones.
+    """
+    return _get_int('WATCHER_AUDIT_TEMPLATE_SELECT_THRESHOLD', 200, minimum=0)
+
+
+@functools.cache
+def get_audit_template_names_cache_ttl() -> int:
+    """Return how long cached audit template names are fresh, in seconds.
+
+    Reads the WATCHER_AUDIT_TEMPLATE_NAMES_CACHE_TTL setting and defaults
+    to 60.  Audit templates are created and archived far more often than
+    goals and strategies, so they are not kept for the catalog TTL.  A
+    value of 0 disables the cache.  Raises TypeError for non-integer
+    values and ValueError for negative ones.
+    """
+    return _get_int('WATCHER_AUDIT_TEMPLATE_NAMES_CACHE_TTL', 60, minimum=0)
+
+
+@functools.cache
+def get_api_call_hooks() -> tuple:
+    """Return the callables notified of every Watcher API call.
+
+    Reads the WATCHER_API_CALL_HOOKS setting, a list of callables or of
+    their dotted paths, and defaults to an empty list.  Each hook is
+    called as ``hook(request, call)``, see
+    :mod:`watcher_dashboard.common.instrumentation`.  Raises TypeError if
+    the setting is not a list or tuple, or if a hook is not callable, and
+    ImportError if a dotted path cannot be imported.
+    """
+    value = getattr(settings, 'WATCHER_API_CALL_HOOKS', ())
+    if not isinstance(value, (list, tuple)):
+        raise TypeError(
+            "WATCHER_API_CALL_HOOKS must be a list or tuple, got "
+            f"{type(value)!r}"
+        )
+    hooks = tuple(
+        module_loading.import_string(hook) if isinstance(hook, str) else hook
+        for hook in value
+    )
+    for hook in hooks:
+        if not callable(hook):
+            raise TypeError(
+                f"WATCHER_API_CALL_HOOKS: {hook!r} is not callable"
+            )
+    return hooks
+
+
+@functools.cache
+def get_metrics_enabled() -> bool:
+    """Return whether the metrics of the Watcher panels are collected.
+
+    Reads the WATCHER_METRICS_ENABLED setting and defaults to False.
+    """
+    return strutils.bool_from_string(
+        getattr(settings, 'WATCHER_METRICS_ENABLED', False), default=False
+    )
+
+
+@functools.cache
+def get_metrics_dir() -> str | None:
+    """Return the directory shared by the processes to merge metrics.
+
+    Reads the WATCHER_METRICS_DIR setting.  Returns None when the setting
+    is absent or empty, in which case each process only reports its own
+    metrics.  Raises TypeError if a non-string, non-None value is
+    configured.
+    """
+    value = getattr(settings, 'WATCHER_METRICS_DIR', None)
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise TypeError(
+            f"WATCHER_METRICS_DIR must be a str or None, got {type(value)!r}"
+        )
+    return value or None
+
+
+@functools.cache
+def get_catalog_cache_ttl() -> int:
+    """Return how long cached goals and strategies are fresh, in seconds.
+
+    Reads the WATCHER_CATALOG_CACHE_TTL setting and defaults to 3600.
+    A value of 0 disables the cache.  Raises TypeError for non-integer
+    values and ValueError for negative ones.
+    """
+    return _get_int('WATCHER_CATALOG_CACHE_TTL', 3600, minimum=0)
+
+
+@functools.cache
+def get_catalog_cache_alias() -> str:
+    """Return the Django cache holding the goals and strategies.
+
+    Reads the WATCHER_CATALOG_CACHE setting and defaults to 'default'.
+    Raises TypeError if a non-string value is configured.
+    """
+    value = getattr(settings, 'WATCHER_CATALOG_CACHE', 'default')
+    if not isinstance(value, str):
+        raise TypeError(
+            f"WATCHER_CATALOG_CACHE must be a str, got {type(value)!r}"
+        )
+    return value
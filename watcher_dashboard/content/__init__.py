@@ -0,0 +1,2 @@
+# Registers the REST endpoints of the plugin with Horizon.
+from watcher_dashboard.api import rest  # noqa: F401
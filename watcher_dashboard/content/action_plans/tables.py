@@ -22,16 +22,29 @@ import horizon.tables
 from django import template
 from django import urls
 from django.template.defaultfilters import title  # noqa
+from django.utils import html
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
 from django.utils.translation import pgettext_lazy
 from horizon.utils import filters
 
 from watcher_dashboard.api import watcher
+from watcher_dashboard.common import cache
+from watcher_dashboard.common import export
+from watcher_dashboard.common import tables as common_tables
 
 
 LOG = logging.getLogger(__name__)
 
+# Number of rendered global efficacy fragments kept per process
+EFFICACY_CACHE_SIZE = 1024
+# Largest number of indicators rendered without the template engine
+EFFICACY_FAST_PATH_MAX_INDICATORS = 3
+
+_efficacy_cache = cache.TTLCache(
+    maxsize=EFFICACY_CACHE_SIZE, name='global-efficacy'
+)
+
 ACTION_PLAN_STATE_DISPLAY_CHOICES = (
     ("NO STATE", pgettext_lazy("State of an action plan", "No State")),
     ("ONGOING", pgettext_lazy("State of an action plan", "On Going")),
@@ -42,15 +55,31 @@ ACTION_PLAN_STATE_DISPLAY_CHOICES = (
     ("RECOMMENDED", pgettext_lazy("State of an action plan", "Recommended")),
 )
 
+ACTION_PLAN_FINAL_STATES = (
+    "SUCCEEDED",
+    "FAILED",
+    "DELETED",
+    "CANCELLED",
+    "SUPERSEDED",
+)
+
+
+class ActionPlansFilterAction(common_tables.QueryFilterAction):
+    filter_choices = (
+        ('audit', _("Audit ="), True),
+        common_tables.QUERY_CHOICE,
+    )
+    policy_rules = (("infra-optim", "action_plan:detail"),)
+
 
-class ActionPlansFilterAction(horizon.tables.FilterAction):
-    # server = choices query = text
-    filter_type = "server"
-    filter_choices = (('audit', _("Audit ="), True),)
+class ExportActionPlans(export.ExportAction):
+    url = "horizon:admin:action_plans:export"
     policy_rules = (("infra-optim", "action_plan:detail"),)
 
 
-class ArchiveActionPlan(horizon.tables.DeleteAction):
+class ArchiveActionPlan(
+    common_tables.ConcurrentBatchActionMixin, horizon.tables.DeleteAction
+):
     verbose_name = _("Archive Action Plans")
     policy_rules = (("infra-optim", "action_plan:delete"),)
 
@@ -70,7 +99,9 @@ class ArchiveActionPlan(horizon.tables.DeleteAction):
         watcher.ActionPlan.delete(request, obj_id)
 
 
-class StartActionPlan(horizon.tables.BatchAction):
+class StartActionPlan(
+    common_tables.ConcurrentBatchActionMixin, horizon.tables.BatchAction
+):
     name = "start_action_plan"
     classes = ('btn-confirm',)
     policy_rules = (("infra-optim", "action_plan:update"),)
@@ -87,12 +118,7 @@ class StartActionPlan(horizon.tables.BatchAction):
         )
 
     def action(self, request, action_plan_id):
-        try:
-            watcher.ActionPlan.start(request, action_plan_id)
-        except Exception:
-            msg = _('Failed to start the action plan.')
-            LOG.info(msg)
-            horizon.messages.warning(request, msg)
+        watcher.ActionPlan.start(request, action_plan_id)
 
     def allowed(self, request, action_plan):
         return (action_plan is None) or (
@@ -100,14 +126,14 @@ class StartActionPlan(horizon.tables.BatchAction):
         )
 
 
-class UpdateRow(horizon.tables.Row):
-    ajax = True
+class UpdateRow(common_tables.RefreshableRow):
+    final_states = ACTION_PLAN_FINAL_STATES
 
     def get_data(self, request, action_plan_id):
         action_plan = None
 
         try:
-            action_plan = watcher.Action.get(request, action_plan_id)
+            action_plan = watcher.ActionPlan.get(request, action_plan_id)
         except Exception:
             msg = _('Failed to get the action plan.')
             LOG.info(msg)
@@ -116,9 +142,7 @@ class UpdateRow(horizon.tables.Row):
         return action_plan
 
 
-def format_global_efficacy(action_plan):
-    template_name = 'infra_optim/action_plans/_global_efficacy.html'
-
+def _get_global_indicators(action_plan):
     global_efficacy_dict = {}
     for indicator in action_plan.global_efficacy:
         global_efficacy = watcher.EfficacyIndicator(indicator)
@@ -133,12 +157,46 @@ def format_global_efficacy(action_plan):
             global_efficacy_dict[global_efficacy.name] = str(
                 global_efficacy.value
             )
+    return global_efficacy_dict
+
+
+def _render_global_efficacy(action_plan):
+    global_efficacy_dict = _get_global_indicators(action_plan)
 
+    # Most goals have a couple of indicators: build their list directly
+    # rather than going through the template engine for every row.
+    if len(global_efficacy_dict) <= EFFICACY_FAST_PATH_MAX_INDICATORS:
+        return html.format_html(
+            '<ul class="list-unstyled">{}</ul>',
+            html.format_html_join(
+                '', '<li><b>{}</b> {}</li>', global_efficacy_dict.items()
+            ),
+        )
+
+    template_name = 'infra_optim/action_plans/_global_efficacy.html'
     context = {"global_indicators": global_efficacy_dict}
 
     return template.loader.render_to_string(template_name, context)
 
 
+def format_global_efficacy(action_plan):
+    """Return the HTML list of the global efficacy of ``action_plan``.
+
+    The fragment is cached per action plan and update time, so rows of
+    action plans that did not change are not rendered again.
+    """
+    uuid = getattr(action_plan, 'uuid', None)
+    if uuid is None:
+        return _render_global_efficacy(action_plan)
+
+    key = (uuid, getattr(action_plan, 'updated_at', None))
+    fragment = _efficacy_cache.get(key)
+    if fragment is None:
+        fragment = _render_global_efficacy(action_plan)
+        _efficacy_cache.set(key, fragment)
+    return fragment
+
+
 def get_audit_link(datum):
     try:
         return urls.reverse(
@@ -172,6 +230,9 @@ class ActionPlansTable(horizon.tables.DataTable):
         transform=format_global_efficacy, verbose_name=_('Efficacy')
     )
 
+    # Read by the efficacy column
+    row_fields = ('global_efficacy',)
+
     def get_object_id(self, datum):
         return datum.uuid
 
@@ -181,6 +242,7 @@ class ActionPlansTable(horizon.tables.DataTable):
         table_actions = (
             # CancelActionPlan,
             ActionPlansFilterAction,
+            ExportActionPlans,
             StartActionPlan,
             ArchiveActionPlan,
         )
@@ -217,6 +279,9 @@ class RelatedActionPlansTable(horizon.tables.DataTable):
         transform=format_global_efficacy, verbose_name=_('Efficacy')
     )
 
+    # Read by the efficacy column
+    row_fields = ('global_efficacy',)
+
     def get_object_id(self, datum):
         return datum.uuid
 
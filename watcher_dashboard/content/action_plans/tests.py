@@ -0,0 +1,193 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from django import urls
+
+from watcher_dashboard import api
+from watcher_dashboard.content.action_plans import tables
+from watcher_dashboard.tests import helpers as test
+
+
+REFRESH_URL = urls.reverse('horizon:admin:action_plans:refresh_rows')
+
+
+class ActionPlansRefreshRowsTest(test.BaseAdminViewTests):
+    @mock.patch.object(api.watcher.ActionPlan, 'list')
+    def test_refresh_related_rows(self, mock_list):
+        action_plan = self.action_plans.first()
+        action_plan.global_efficacy = []
+        mock_list.return_value = [action_plan]
+
+        res = self.client.post(
+            f'{REFRESH_URL}?audit={action_plan.audit_uuid}',
+            {
+                'rows': f'{action_plan.uuid},ONGOING,',
+                'table': 'related_action_plans',
+            },
+        )
+
+        data = res.json()
+        self.assertEqual(list(data['rows']), [action_plan.uuid])
+        self.assertIn(
+            'related_action_plans__row__', data['rows'][action_plan.uuid]
+        )
+        mock_list.assert_called_once_with(
+            mock.ANY, limit=0, audit=action_plan.audit_uuid
+        )
+
+    @mock.patch.object(api.watcher.ActionPlan, 'get')
+    def test_refresh_unchanged_rows(self, mock_get):
+        action_plan = self.action_plans.first()
+        mock_get.return_value = action_plan
+
+        res = self.client.post(
+            REFRESH_URL, {'rows': f'{action_plan.uuid},RECOMMENDED,'}
+        )
+
+        self.assertEqual(res.json(), {'rows': {}, 'deleted': []})
+
+
+class GlobalEfficacyTest(test.TestCase):
+    def setUp(self):
+        super().setUp()
+        tables._efficacy_cache.clear()
+
+    def _action_plan(self, count, updated_at=None):
+        return api.watcher.ActionPlan(
+            {
+                'uuid': 'd9d9978e-6db5-4a05-8eab-1531795d7004',
+                'updated_at': updated_at,
+                'global_efficacy': [
+                    {'name': f'<indicator {i}>', 'value': i, 'unit': '%'}
+                    for i in range(count)
+                ]
+                + [{'name': 'empty', 'value': None, 'unit': None}],
+            }
+        )
+
+    def test_fast_path_matches_template(self):
+        action_plan = self._action_plan(3)
+
+        with mock.patch.object(
+            tables.template.loader, 'render_to_string'
+        ) as m_render:
+            fragment = tables.format_global_efficacy(action_plan)
+            m_render.assert_not_called()
+
+        self.assertHTMLEqual(
+            fragment,
+            tables.template.loader.render_to_string(
+                'infra_optim/action_plans/_global_efficacy.html',
+                {
+                    'global_indicators': tables._get_global_indicators(
+                        action_plan
+                    )
+                },
+            ),
+        )
+        self.assertIn('&lt;indicator 0&gt;', fragment)
+
+    @mock.patch.object(tables.template.loader, 'render_to_string')
+    def test_cached_per_update(self, m_render):
+        m_render.side_effect = lambda name, context: str(
+            len(context['global_indicators'])
+        )
+
+        first = tables.format_global_efficacy(self._action_plan(4))
+        second = tables.format_global_efficacy(self._action_plan(5))
+        updated = tables.format_global_efficacy(
+            self._action_plan(5, updated_at='2025-01-02T00:00:00')
+        )
+
+        self.assertEqual((first, second, updated), ('4', '4', '5'))
+        self.assertEqual(m_render.call_count, 2)
+
+
+class ActionPlanGraphTest(test.BaseAdminViewTests):
+    def setUp(self):
+        super().setUp()
+        test.patch_watcher_url(self)
+        self.action_plan = api.watcher.ActionPlan(
+            dict(
+                self.api_action_plans.first(), updated_at='2025-01-01T00:00:00'
+            )
+        )
+        self.url = urls.reverse(
+            'horizon:admin:action_plans:graph', args=[self.action_plan.uuid]
+        )
+        self.actions_list = [
+            api.watcher.Action(dict(action, action_type='migrate'))
+            for action in self.api_actions.list()
+        ]
+
+    @mock.patch.object(api.watcher.Action, 'list')
+    @mock.patch.object(api.watcher.ActionPlan, 'get')
+    def test_graph(self, m_get, m_list):
+        m_get.return_value = self.action_plan
+        m_list.return_value = self.actions_list
+
+        res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, 200)
+        first, second = self.actions_list
+        self.assertEqual(
+            res.json(),
+            {
+                'nodes': [
+                    [first.uuid, 'migrate', 0, 0],
+                    [second.uuid, 'migrate', 1, 0],
+                ],
+                'edges': [[0, 1]],
+                'levels': 2,
+                'critical_path': [0, 1],
+            },
+        )
+        m_list.assert_called_once_with(
+            mock.ANY,
+            action_plan=self.action_plan.uuid,
+            limit=0,
+            fields=('action_type', 'parents', 'next_uuid'),
+        )
+
+    @mock.patch.object(api.watcher.Action, 'list')
+    @mock.patch.object(api.watcher.ActionPlan, 'get')
+    def test_graph_cached_per_update(self, m_get, m_list):
+        m_get.return_value = self.action_plan
+        m_list.return_value = self.actions_list
+
+        etag = self.client.get(self.url)['ETag']
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(m_list.call_count, 1)
+
+        m_get.return_value = api.watcher.ActionPlan(
+            dict(
+                self.api_action_plans.first(), updated_at='2025-01-02T00:00:00'
+            )
+        )
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(m_list.call_count, 2)
+
+    @mock.patch.object(api.watcher.ActionPlan, 'get')
+    def test_graph_unavailable(self, m_get):
+        m_get.side_effect = self.exceptions.watcher
+
+        with self.assertLogs(
+            'watcher_dashboard.content.action_plans.views', level='ERROR'
+        ):
+            res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, 500)
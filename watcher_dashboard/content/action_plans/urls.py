@@ -25,5 +25,12 @@ urlpatterns = [
         views.DetailView.as_view(),
         name='detail',
     ),
+    re_path(
+        r'^(?P<action_plan_uuid>[^/]+)/graph$',
+        views.action_plan_graph,
+        name='graph',
+    ),
     re_path(r'^archive/$', views.ArchiveView.as_view(), name='archive'),
+    re_path(r'^export/$', views.export_action_plans, name='export'),
+    re_path(r'^ajax/rows/$', views.refresh_rows, name='refresh_rows'),
 ]
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
 
 import horizon.exceptions
@@ -20,12 +21,23 @@ import horizon.tables
 import horizon.tabs
 import horizon.workflows
 
+from django.http import JsonResponse
+from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
+from django.views.decorators import http as http_decorators
 from horizon import forms
 from horizon.utils import memoized
 
+from watcher_dashboard.api import catalog
 from watcher_dashboard.api import watcher
 from watcher_dashboard.common import client as common_client
+from watcher_dashboard.common import concurrency
+from watcher_dashboard.common import deferred as common_deferred
+from watcher_dashboard.common import export
+from watcher_dashboard.common import graph
+from watcher_dashboard.common import http as common_http
+from watcher_dashboard.common import rows
+from watcher_dashboard.common import tables as common_tables
 from watcher_dashboard.content.action_plans import tables
 from watcher_dashboard.content.actions import tables as action_tables
 from watcher_dashboard.content.audits import forms as wforms
@@ -33,22 +45,43 @@ from watcher_dashboard.content.audits import forms as wforms
 
 LOG = logging.getLogger(__name__)
 
+# Attributes of the exported action plans, in column order
+EXPORT_FIELDS = (
+    'uuid',
+    'audit_uuid',
+    'strategy_name',
+    'state',
+    'global_efficacy',
+    'created_at',
+    'updated_at',
+)
 
-class IndexView(horizon.tables.DataTableView):
+# Attributes of the actions needed to lay out their dependency graph
+GRAPH_FIELDS = ('action_type', 'parents', 'next_uuid')
+
+
+class IndexView(horizon.tables.PagedTableMixin, horizon.tables.DataTableView):
     table_class = tables.ActionPlansTable
     template_name = 'infra_optim/action_plans/index.html'
     page_title = _("Action Plans")
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['action_plans_count'] = self.get_action_plans_count()
-        return context
-
     def get_data(self):
         action_plans = []
         search_opts = self.get_filters()
         try:
-            action_plans = watcher.ActionPlan.list(self.request, **search_opts)
+            marker, sort_dir = self._get_marker()
+            action_plans, self._has_more_data, self._has_prev_data = (
+                watcher.ActionPlan.list_paged(
+                    self.request,
+                    marker=marker,
+                    paginate=True,
+                    sort_dir=sort_dir,
+                    select=common_tables.get_query_select(self.table),
+                    fields=rows.get_table_fields(self.table_class),
+                    index=True,
+                    **search_opts,
+                )
+            )
         except Exception as exc:
             LOG.exception(exc)
             horizon.exceptions.handle(
@@ -56,19 +89,8 @@ class IndexView(horizon.tables.DataTableView):
             )
         return action_plans
 
-    def get_action_plans_count(self):
-        return len(self.get_data())
-
     def get_filters(self):
-        filters = {}
-        filter_action = self.table._meta._filter_action
-        if filter_action:
-            filter_field = self.table.get_filter_field()
-            if filter_action.is_api_filter(filter_field):
-                filter_string = self.table.get_filter_string()
-                if filter_field and filter_string:
-                    filters[filter_field] = filter_string
-        return filters
+        return common_tables.get_api_filters(self.table)
 
 
 class ArchiveView(forms.ModalFormView):
@@ -80,11 +102,16 @@ class ArchiveView(forms.ModalFormView):
     submit_label = _("Create Audit")
 
 
-class DetailView(horizon.tables.MultiTableView):
+class DetailView(
+    common_deferred.DeferredTablesMixin, horizon.tables.MultiTableView
+):
     table_classes = (
         action_tables.RelatedActionsTable,
         tables.RelatedEfficacyIndicatorsTable,
     )
+    # The efficacy indicators come with the action plan, which the page
+    # loads anyway.
+    deferred_tables = {'related_wactions': 0}
     template_name = 'infra_optim/action_plans/details.html'
     page_title = _("Action Plan Details: {{ action_plan.uuid }}")
 
@@ -92,22 +119,42 @@ class DetailView(horizon.tables.MultiTableView):
     def max_version(self):
         return common_client.get_max_version(self.request)
 
+    def _fetch_action_plan(self):
+        server_version = self.max_version()
+        version = (
+            common_client.MV_SKIP_ACTION
+            if common_client.is_microversion_supported(
+                server_version, common_client.MV_SKIP_ACTION
+            )
+            else None
+        )
+        return watcher.ActionPlan.get(
+            self.request, self.kwargs['action_plan_uuid'], api_version=version
+        )
+
+    @memoized.memoized_method
+    def _prefetch(self):
+        """Fetch the action plan and, unless deferred, its actions."""
+        calls = [self._fetch_action_plan]
+        if not self.is_deferred('related_wactions'):
+            calls.append(
+                functools.partial(
+                    watcher.Action.list,
+                    self.request,
+                    action_plan=self.kwargs['action_plan_uuid'],
+                    fields=rows.get_table_fields(
+                        action_tables.RelatedActionsTable
+                    ),
+                )
+            )
+        return concurrency.fan_out(self.request, *calls)
+
     @memoized.memoized_method
     def _get_data(self):
         action_plan_uuid = None
         try:
             action_plan_uuid = self.kwargs['action_plan_uuid']
-            server_version = self.max_version()
-            version = (
-                common_client.MV_SKIP_ACTION
-                if common_client.is_microversion_supported(
-                    server_version, common_client.MV_SKIP_ACTION
-                )
-                else None
-            )
-            action_plan = watcher.ActionPlan.get(
-                self.request, action_plan_uuid, api_version=version
-            )
+            action_plan = self._prefetch()[0].result()
         except Exception as exc:
             LOG.exception(exc)
             msg = (
@@ -121,10 +168,7 @@ class DetailView(horizon.tables.MultiTableView):
 
     def get_related_wactions_data(self):
         try:
-            action_plan = self._get_data()
-            actions = watcher.Action.list(
-                self.request, action_plan=action_plan.uuid
-            )
+            actions = self._prefetch()[1].result()
         except Exception as exc:
             LOG.exception(exc)
             actions = []
@@ -171,8 +215,105 @@ class DetailView(horizon.tables.MultiTableView):
             mv, common_client.MV_SKIP_ACTION
         )
         table._parent_succeeded = action_plan.state == 'SUCCEEDED'
+        table._parent_ongoing = action_plan.state == 'ONGOING'
         return table_dict
 
+    def get_table_version(self, table):
+        # The row actions and refresh of the actions depend on the state of
+        # their action plan, see get_tables.
+        action_plan = self._get_data()
+        return (
+            action_plan.state,
+            self.max_version(),
+            super().get_table_version(table),
+        )
+
     def get_tabs(self, request, *args, **kwargs):
         action_plan = self._get_data()
         return self.tab_group_class(request, action_plan=action_plan, **kwargs)
+
+
+@http_decorators.require_POST
+def refresh_rows(request):
+    """AJAX endpoint returning the action plan rows that changed.
+
+    Expects the rows known by the page in the ``rows`` POST field (see
+    :func:`watcher_dashboard.common.tables.refresh_rows`), the name of the
+    table in ``table`` and, for the related action plans of an audit, the
+    audit UUID in the ``audit`` GET parameter.
+    """
+    table_class = tables.ActionPlansTable
+    if request.POST.get('table') == tables.RelatedActionPlansTable._meta.name:
+        table_class = tables.RelatedActionPlansTable
+    filters = {}
+    if request.GET.get('audit'):
+        filters['audit'] = request.GET['audit']
+    return common_tables.refresh_rows(
+        request, table_class, watcher.ActionPlan.get_many, **filters
+    )
+
+
+def export_action_plans(request):
+    """Stream every action plan matching the table filter.
+
+    See :mod:`watcher_dashboard.common.export`.
+    """
+    return export.export(
+        request,
+        tables.ActionPlansTable,
+        watcher.ActionPlan.iter_all,
+        EXPORT_FIELDS,
+        'action_plans',
+        reverse('horizon:admin:action_plans:index'),
+    )
+
+
+def _get_graph_id(action_plan):
+    # The actions of a plan only change along with its update time.
+    return f'{action_plan.uuid}:{action_plan.updated_at}'
+
+
+def _get_cached_graph(request, action_plan):
+    return catalog.get_item(
+        request,
+        catalog.ACTION_PLAN_GRAPHS,
+        _get_graph_id(action_plan),
+        lambda: graph.layout(
+            watcher.Action.list(
+                request,
+                action_plan=action_plan.uuid,
+                limit=0,
+                fields=GRAPH_FIELDS,
+            )
+        ),
+    )
+
+
+def _graph_version(request, action_plan_uuid):
+    action_plan = watcher.ActionPlan.get(
+        request, action_plan_uuid, _error_handle=False
+    )
+    _get_cached_graph(request, action_plan)
+    return catalog.get_version(
+        request, catalog.ACTION_PLAN_GRAPHS, _get_graph_id(action_plan)
+    )
+
+
+@common_http.conditional(_graph_version)
+def action_plan_graph(request, action_plan_uuid):
+    """AJAX endpoint returning the dependency graph of the plan's actions.
+
+    The layout, see :func:`watcher_dashboard.common.graph.layout`, is
+    computed once per action plan and update time.
+    """
+    try:
+        action_plan = watcher.ActionPlan.get(
+            request, action_plan_uuid, _error_handle=False
+        )
+        layout = _get_cached_graph(request, action_plan)
+    except Exception:
+        LOG.exception("Unable to lay out the actions of %s", action_plan_uuid)
+        return JsonResponse(
+            {'error': 'Unable to retrieve the actions'}, status=500
+        )
+    return JsonResponse(layout)
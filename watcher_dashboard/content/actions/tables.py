@@ -26,6 +26,8 @@ from django.utils.translation import pgettext_lazy
 from horizon.utils import filters
 
 from watcher_dashboard.api import watcher
+from watcher_dashboard.common import export
+from watcher_dashboard.common import tables as common_tables
 
 
 LOG = logging.getLogger(__name__)
@@ -42,9 +44,17 @@ ACTION_STATE_DISPLAY_CHOICES = (
     ("SKIPPED", pgettext_lazy("Power state of an Instance", "Skipped")),
 )
 
+ACTION_FINAL_STATES = (
+    "SUCCEEDED",
+    "CANCELLED",
+    "FAILED",
+    "DELETED",
+    "SKIPPED",
+)
+
 
-class UpdateRow(horizon.tables.Row):
-    ajax = True
+class UpdateRow(common_tables.RefreshableRow):
+    final_states = ACTION_FINAL_STATES
 
     def get_data(self, request, action_id):
         action = None
@@ -58,9 +68,30 @@ class UpdateRow(horizon.tables.Row):
         return action
 
 
-class ActionsFilterAction(horizon.tables.FilterAction):
-    filter_type = "server"
-    filter_choices = (('action_plan', _("Action Plan ID ="), True),)
+class RelatedUpdateRow(UpdateRow):
+    """Row of the actions of an action plan.
+
+    Pending actions only move on while their action plan is ongoing, so
+    they are not refreshed otherwise.
+    """
+
+    @property
+    def final_states(self):
+        if self.table._parent_ongoing:
+            return ACTION_FINAL_STATES
+        return ACTION_FINAL_STATES + ('PENDING',)
+
+
+class ActionsFilterAction(common_tables.QueryFilterAction):
+    filter_choices = (
+        ('action_plan', _("Action Plan ID ="), True),
+        common_tables.QUERY_CHOICE,
+    )
+    policy_rules = (("infra-optim", "action:detail"),)
+
+
+class ExportActions(export.ExportAction):
+    url = "horizon:admin:actions:export"
     policy_rules = (("infra-optim", "action:detail"),)
 
 
@@ -110,13 +141,16 @@ class ActionsTable(horizon.tables.DataTable):
         link=get_action_plan_link,
     )
 
+    # Read by UpdateRow
+    row_fields = ('updated_at',)
+
     def get_object_id(self, datum):
         return datum.uuid
 
     class Meta:
         name = "wactions"
         verbose_name = _("Actions")
-        table_actions = (ActionsFilterAction,)
+        table_actions = (ActionsFilterAction, ExportActions)
         row_class = UpdateRow
 
 
@@ -145,6 +179,7 @@ class RelatedActionsTable(horizon.tables.DataTable):
     def __init__(self, *args, **kwargs):
         self._supports_skip = kwargs.pop('supports_skip', False)
         self._parent_succeeded = kwargs.pop('parent_succeeded', False)
+        self._parent_ongoing = kwargs.pop('parent_ongoing', True)
         super().__init__(*args, **kwargs)
 
     def get_row_actions(self, datum):
@@ -160,6 +195,9 @@ class RelatedActionsTable(horizon.tables.DataTable):
             return False
         return len(self._meta.row_actions) > 0
 
+    # Read by UpdateRow
+    row_fields = ('updated_at',)
+
     def get_object_id(self, datum):
         return datum.uuid
 
@@ -168,6 +206,7 @@ class RelatedActionsTable(horizon.tables.DataTable):
         verbose_name = _("Related Actions")
         hidden_title = False
         row_actions = (SkipAction,)
+        row_class = RelatedUpdateRow
 
 
 class ActionParametersTable(horizon.tables.DataTable):
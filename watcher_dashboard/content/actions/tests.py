@@ -0,0 +1,238 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from unittest import mock
+
+from django import urls
+from watcherclient.common.apiclient import exceptions as wc_exc
+
+from watcher_dashboard import api
+from watcher_dashboard.common import client as common_client
+from watcher_dashboard.content.actions import tables
+from watcher_dashboard.tests import helpers as test
+
+
+REFRESH_URL = urls.reverse('horizon:admin:actions:refresh_rows')
+EXPORT_URL = urls.reverse('horizon:admin:actions:export')
+INDEX_URL = urls.reverse('horizon:admin:actions:index')
+
+
+class ActionsRefreshRowsTest(test.BaseAdminViewTests):
+    @mock.patch.object(api.watcher.Action, 'get')
+    def test_refresh_rows(self, mock_get):
+        action1, action2 = self.actions.list()
+        found = {action.uuid: action for action in (action1, action2)}
+
+        def get(request, action_id, **kwargs):
+            if action_id not in found:
+                raise wc_exc.NotFound()
+            return found[action_id]
+
+        mock_get.side_effect = get
+
+        res = self.client.post(
+            REFRESH_URL,
+            {
+                'rows': '\n'.join(
+                    [
+                        f'{action1.uuid},PENDING,',
+                        f'{action2.uuid},ONGOING,',
+                        'deleted-uuid,ONGOING,',
+                    ]
+                ),
+                'table': 'wactions',
+            },
+        )
+
+        self.assertEqual(res.status_code, 200)
+        data = res.json()
+        self.assertEqual(list(data['rows']), [action2.uuid])
+        self.assertIn(
+            f'data-object-id="{action2.uuid}"', data['rows'][action2.uuid]
+        )
+        self.assertEqual(data['deleted'], ['deleted-uuid'])
+        mock_get.assert_has_calls(
+            [
+                mock.call(mock.ANY, uuid, _error_handle=False)
+                for uuid in (action1.uuid, action2.uuid, 'deleted-uuid')
+            ],
+            any_order=True,
+        )
+
+    @mock.patch.object(common_client, 'get_max_version')
+    @mock.patch.object(api.watcher.Action, 'list')
+    def test_refresh_related_rows(self, mock_list, mock_max_version):
+        mock_max_version.return_value = common_client.MV_SKIP_ACTION
+        action = self.actions.first()
+        mock_list.return_value = self.actions.list()
+
+        res = self.client.post(
+            f'{REFRESH_URL}?action_plan={action.action_plan_uuid}',
+            {'rows': f'{action.uuid},ONGOING,', 'table': 'related_wactions'},
+        )
+
+        rows = res.json()['rows']
+        self.assertEqual(list(rows), [action.uuid])
+        self.assertIn('related_wactions__row__', rows[action.uuid])
+        mock_list.assert_called_once_with(
+            mock.ANY, limit=0, action_plan=action.action_plan_uuid
+        )
+
+    @mock.patch.object(api.watcher.Action, 'list')
+    def test_refresh_rows_without_rows(self, mock_list):
+        res = self.client.post(REFRESH_URL)
+
+        self.assertEqual(res.json(), {'rows': {}, 'deleted': []})
+        mock_list.assert_not_called()
+
+    def test_refresh_rows_requires_post(self):
+        res = self.client.get(REFRESH_URL, {'rows': 'uuid,PENDING,'})
+
+        self.assertEqual(res.status_code, 405)
+
+    @mock.patch.object(api.watcher.Action, 'get')
+    def test_refresh_rows_unavailable(self, mock_get):
+        mock_get.side_effect = self.exceptions.watcher
+        logger = 'watcher_dashboard.common.tables'
+        with self.assertLogs(logger, level='ERROR'):
+            res = self.client.post(REFRESH_URL, {'rows': 'uuid,PENDING,'})
+        self.assertEqual(res.status_code, 500)
+
+
+class RelatedActionsTableTest(test.BaseAdminViewTests):
+    def _is_final(self, action, **kwargs):
+        table = tables.RelatedActionsTable(
+            self.request, data=[action], **kwargs
+        )
+        return 'data-final' in table.get_rows()[0].attrs
+
+    def test_pending_rows_refreshed_while_ongoing(self):
+        action = self.actions.first()
+        action.state = 'PENDING'
+
+        self.assertFalse(self._is_final(action))
+        self.assertTrue(self._is_final(action, parent_ongoing=False))
+
+
+class ActionsQueryFilterTest(test.BaseAdminViewTests):
+    def _set_query(self, text):
+        self.setSessionValues(
+            wactions__filter__q_field='query', wactions__filter__q=text
+        )
+
+    @mock.patch.object(api.watcher.Action, 'list_paged')
+    def test_index_query(self, mock_list_paged):
+        action1, action2 = self.actions.list()
+        mock_list_paged.return_value = (self.actions.list(), False, False)
+        self._set_query(
+            f'action_plan={action1.action_plan_uuid} '
+            f'and uuid != {action1.uuid}'
+        )
+
+        res = self.client.get(INDEX_URL)
+
+        self.assertEqual(
+            [row.datum for row in res.context['table'].get_rows()], [action2]
+        )
+        self.assertEqual(
+            mock_list_paged.call_args.kwargs['action_plan'],
+            action1.action_plan_uuid,
+        )
+
+    @mock.patch.object(api.watcher.Action, 'list_paged')
+    def test_index_invalid_query(self, mock_list_paged):
+        mock_list_paged.return_value = (self.actions.list(), False, False)
+        self._set_query('state in PENDING')
+
+        res = self.client.get(INDEX_URL)
+
+        self.assertEqual(res.context['table'].get_rows(), [])
+        self.assertMessageCount(res, error=1)
+        self.assertNotIn('state', mock_list_paged.call_args.kwargs)
+
+    @mock.patch.object(api.watcher.Action, 'iter_all')
+    def test_export_query(self, mock_iter_all):
+        action1, action2 = self.actions.list()
+        mock_iter_all.return_value = iter(self.actions.list())
+        self._set_query(f'uuid in ({action2.uuid}, unknown)')
+
+        res = self.client.get(EXPORT_URL, {'format': 'ndjson'})
+
+        lines = b''.join(res.streaming_content).decode().splitlines()
+        self.assertEqual(
+            [json.loads(line)['uuid'] for line in lines], [action2.uuid]
+        )
+        mock_iter_all.assert_called_once_with(mock.ANY, 1000)
+
+
+class ActionsExportTest(test.BaseAdminViewTests):
+    @mock.patch.object(api.watcher.Action, 'iter_all')
+    def test_export_csv(self, mock_iter_all):
+        action1, action2 = self.actions.list()
+        action1.input_parameters = {'resource_id': 'vm-1'}
+        mock_iter_all.return_value = iter([action1, action2])
+
+        res = self.client.get(EXPORT_URL)
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertEqual(
+            res['Content-Disposition'], 'attachment; filename="actions.csv"'
+        )
+        lines = b''.join(res.streaming_content).decode().splitlines()
+        self.assertEqual(
+            lines[0].split(',')[:3],
+            ['uuid', 'action_plan_uuid', 'action_type'],
+        )
+        self.assertEqual(len(lines), 3)
+        self.assertIn('"{""resource_id"": ""vm-1""}"', lines[1])
+        mock_iter_all.assert_called_once_with(mock.ANY, 1000)
+
+    @mock.patch.object(api.watcher.Action, 'iter_all')
+    def test_export_ndjson_filtered(self, mock_iter_all):
+        action = self.actions.first()
+        mock_iter_all.return_value = iter([action])
+
+        res = self.client.get(
+            EXPORT_URL,
+            {'format': 'ndjson', 'action_plan': action.action_plan_uuid},
+        )
+
+        self.assertEqual(
+            res['Content-Type'], 'application/x-ndjson; charset=utf-8'
+        )
+        lines = b''.join(res.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(
+            json.loads(lines[0])['action_plan_uuid'], action.action_plan_uuid
+        )
+        mock_iter_all.assert_called_once_with(
+            mock.ANY, 1000, action_plan=action.action_plan_uuid
+        )
+
+    @mock.patch.object(api.watcher.Action, 'iter_all')
+    def test_export_unknown_format(self, mock_iter_all):
+        res = self.client.get(EXPORT_URL, {'format': 'xml'})
+
+        self.assertEqual(res.status_code, 400)
+        mock_iter_all.assert_not_called()
+
+    @mock.patch.object(api.watcher.Action, 'iter_all')
+    def test_export_unavailable(self, mock_iter_all):
+        mock_iter_all.side_effect = self.exceptions.watcher
+
+        res = self.client.get(EXPORT_URL)
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
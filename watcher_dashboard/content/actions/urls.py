@@ -30,4 +30,6 @@ urlpatterns = [
         views.SkipActionView.as_view(),
         name='skip',
     ),
+    re_path(r'^export/$', views.export_actions, name='export'),
+    re_path(r'^ajax/rows/$', views.refresh_rows, name='refresh_rows'),
 ]
@@ -22,50 +22,62 @@ import horizon.workflows
 
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
+from django.views.decorators import http as http_decorators
 from horizon import forms
 from horizon.utils import memoized
 
 from watcher_dashboard.api import watcher
 from watcher_dashboard.common import client as common_client
+from watcher_dashboard.common import export
+from watcher_dashboard.common import rows
+from watcher_dashboard.common import tables as common_tables
 from watcher_dashboard.content.actions import forms as action_forms
 from watcher_dashboard.content.actions import tables
 from watcher_dashboard.content.actions import tabs as wtabs
 
 
-class IndexView(horizon.tables.DataTableView):
+# Attributes of the exported actions, in column order
+EXPORT_FIELDS = (
+    'uuid',
+    'action_plan_uuid',
+    'action_type',
+    'state',
+    'input_parameters',
+    'parents',
+    'created_at',
+    'updated_at',
+)
+
+
+class IndexView(horizon.tables.PagedTableMixin, horizon.tables.DataTableView):
     table_class = tables.ActionsTable
     template_name = 'infra_optim/actions/index.html'
     page_title = _("Actions")
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['audits_count'] = self.get_actions_count()
-        return context
-
     def get_data(self):
         actions = []
         search_opts = self.get_filters()
         try:
-            actions = watcher.Action.list(self.request, **search_opts)
+            marker, sort_dir = self._get_marker()
+            actions, self._has_more_data, self._has_prev_data = (
+                watcher.Action.list_paged(
+                    self.request,
+                    marker=marker,
+                    paginate=True,
+                    sort_dir=sort_dir,
+                    select=common_tables.get_query_select(self.table),
+                    fields=rows.get_table_fields(self.table_class),
+                    **search_opts,
+                )
+            )
         except Exception:
             horizon.exceptions.handle(
                 self.request, _("Unable to retrieve action information.")
             )
         return actions
 
-    def get_actions_count(self):
-        return len(self.get_data())
-
     def get_filters(self):
-        filters = {}
-        filter_action = self.table._meta._filter_action
-        if filter_action:
-            filter_field = self.table.get_filter_field()
-            if filter_action.is_api_filter(filter_field):
-                filter_string = self.table.get_filter_string()
-                if filter_field and filter_string:
-                    filters[filter_field] = filter_string
-        return filters
+        return common_tables.get_api_filters(self.table)
 
 
 class DetailView(horizon.tables.MultiTableView):
@@ -170,3 +182,49 @@ class SkipActionView(forms.ModalFormView):
 
     def get_initial(self):
         return {'action_id': self.kwargs['action_id']}
+
+
+@http_decorators.require_POST
+def refresh_rows(request):
+    """AJAX endpoint returning the action rows that changed.
+
+    Expects the rows known by the page in the ``rows`` POST field (see
+    :func:`watcher_dashboard.common.tables.refresh_rows`), the name of the
+    table in ``table`` and, for the related actions of an action plan, the
+    action plan UUID in the ``action_plan`` GET parameter.
+    """
+    table_class = tables.ActionsTable
+    table_kwargs = {}
+    if request.POST.get('table') == tables.RelatedActionsTable._meta.name:
+        table_class = tables.RelatedActionsTable
+        table_kwargs['supports_skip'] = (
+            common_client.is_microversion_supported(
+                common_client.get_max_version(request),
+                common_client.MV_SKIP_ACTION,
+            )
+        )
+    filters = {}
+    if request.GET.get('action_plan'):
+        filters['action_plan'] = request.GET['action_plan']
+    return common_tables.refresh_rows(
+        request,
+        table_class,
+        watcher.Action.get_many,
+        table_kwargs=table_kwargs,
+        **filters,
+    )
+
+
+def export_actions(request):
+    """Stream every action matching the table filter.
+
+    See :mod:`watcher_dashboard.common.export`.
+    """
+    return export.export(
+        request,
+        tables.ActionsTable,
+        watcher.Action.iter_all,
+        EXPORT_FIELDS,
+        'actions',
+        reverse('horizon:admin:actions:index'),
+    )
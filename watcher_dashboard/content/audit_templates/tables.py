@@ -21,6 +21,7 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
 
 from watcher_dashboard.api import watcher
+from watcher_dashboard.common import tables as common_tables
 
 
 class CreateAuditTemplates(horizon.tables.LinkAction):
@@ -31,16 +32,18 @@ class CreateAuditTemplates(horizon.tables.LinkAction):
     policy_rules = (("infra-optim", "audit_template:create"),)
 
 
-class AuditTemplatesFilterAction(horizon.tables.FilterAction):
-    filter_type = "server"
+class AuditTemplatesFilterAction(common_tables.QueryFilterAction):
     filter_choices = (
         ('goal', _("Goal ="), True),
         ('strategy', _("Strategy ="), True),
+        common_tables.QUERY_CHOICE,
     )
     policy_rules = (("infra-optim", "audit_template:detail"),)
 
 
-class LaunchAudit(horizon.tables.BatchAction):
+class LaunchAudit(
+    common_tables.ConcurrentBatchActionMixin, horizon.tables.BatchAction
+):
     name = "launch_audit"
     verbose_name = _("Launch Audit")
     data_type_singular = _("Launch Audit")
@@ -63,7 +66,9 @@ class LaunchAudit(horizon.tables.BatchAction):
         watcher.Audit.create(request, **params)
 
 
-class ArchiveAuditTemplates(horizon.tables.DeleteAction):
+class ArchiveAuditTemplates(
+    common_tables.ConcurrentBatchActionMixin, horizon.tables.DeleteAction
+):
     verbose_name = _("Archive Templates")
     policy_rules = (("infra-optim", "audit_template:delete"),)
 
@@ -18,12 +18,16 @@ from unittest import mock
 from django import urls
 
 from watcher_dashboard import api
+from watcher_dashboard.common import client as common_client
 from watcher_dashboard.tests import helpers as test
 
 
 INDEX_URL = urls.reverse('horizon:admin:audit_templates:index')
 CREATE_URL = urls.reverse('horizon:admin:audit_templates:create')
 DETAILS_VIEW = 'horizon:admin:audit_templates:detail'
+STRATEGIES_URL = urls.reverse(
+    'horizon:admin:audit_templates:get_strategies_for_goal'
+)
 
 
 class AuditTemplatesTest(test.BaseAdminViewTests):
@@ -41,6 +45,44 @@ class AuditTemplatesTest(test.BaseAdminViewTests):
         audit_templates = res.context['audit_templates_table'].data
         self.assertCountEqual(audit_templates, self.audit_templates.list())
 
+    @mock.patch.object(api.watcher, 'watcherclient')
+    def test_index_lists_once(self, mock_client):
+        audit_templates = mock_client.return_value.audit_template
+        audit_templates.list.return_value = self.audit_templates.list()
+
+        res = self.client.get(INDEX_URL)
+
+        self.assertCountEqual(
+            res.context['audit_templates_table'].data,
+            self.audit_templates.list(),
+        )
+        audit_templates.list.assert_called_once_with(
+            detail=True,
+            limit=21,
+            marker=None,
+            sort_key='created_at',
+            sort_dir='desc',
+        )
+
+    @mock.patch.object(api.watcher.utils, 'get_page_size', return_value=1)
+    @mock.patch.object(api.watcher.AuditTemplate, 'list')
+    def test_index_paginated(self, mock_list, _get_page_size):
+        mock_list.return_value = self.audit_templates.list()[:2]
+
+        res = self.client.get(INDEX_URL)
+
+        table = res.context['audit_templates_table']
+        self.assertEqual(table.data, self.audit_templates.list()[:1])
+        self.assertTrue(table.has_more_data())
+        self.assertFalse(table.has_prev_data())
+        mock_list.assert_called_with(
+            mock.ANY,
+            limit=2,
+            marker=None,
+            sort_key='created_at',
+            sort_dir='desc',
+        )
+
     @mock.patch.object(api.watcher.AuditTemplate, 'list')
     def test_audit_template_list_unavailable(self, mock_list):
         mock_list.side_effect = self.exceptions.watcher
@@ -91,6 +133,28 @@ class AuditTemplatesTest(test.BaseAdminViewTests):
         )
         audit_templates = res.context['audit_template']
         self.assertCountEqual([audit_templates], [at])
+        self.assertContains(res, '?deferred=audits')
+
+    @mock.patch.object(common_client, 'get_max_version')
+    @mock.patch.object(api.watcher.Audit, 'list')
+    @mock.patch.object(api.watcher.AuditTemplate, 'get')
+    def test_details_deferred_audits(self, m_get, m_list, m_max_version):
+        m_max_version.return_value = common_client.MV_START_END
+        at = self.audit_templates.first()
+        audit = self.audits.first()
+        m_list.return_value = [audit]
+        url = urls.reverse(DETAILS_VIEW, args=[at.uuid])
+
+        res = self.client.get(url, {'deferred': 'audits'})
+
+        self.assertContains(res, audit.uuid)
+        self.assertIn('max-age=0', res['Cache-Control'])
+        m_get.assert_not_called()
+        m_list.assert_called_once_with(
+            mock.ANY,
+            api_version=common_client.MV_START_END,
+            audit_template=at.uuid,
+        )
 
     @mock.patch.object(api.watcher.AuditTemplate, 'get')
     def test_details_exception(self, m_get):
@@ -115,3 +179,22 @@ class AuditTemplatesTest(test.BaseAdminViewTests):
 
         res = self.client.post(INDEX_URL, form_data)
         self.assertRedirectsNoFollow(res, INDEX_URL)
+
+    @mock.patch.object(api.watcher, 'watcherclient')
+    def test_strategies_for_goal_not_modified(self, mock_client):
+        test.patch_watcher_url(self)
+        strategy_list = mock_client.return_value.strategy.list
+        strategy_list.return_value = self.api_strategies.list()
+        goal_uuid = self.api_strategies.first()['goal_uuid']
+
+        res = self.client.get(STRATEGIES_URL, {'goal_uuid': goal_uuid})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(res.json()['strategies']), 2)
+
+        res = self.client.get(
+            STRATEGIES_URL,
+            {'goal_uuid': goal_uuid},
+            HTTP_IF_NONE_MATCH=res['ETag'],
+        )
+        self.assertEqual(res.status_code, 304)
+        strategy_list.assert_called_once_with(detail=True, limit=0)
@@ -27,32 +27,41 @@ from django.utils.translation import gettext_lazy as _
 from horizon import forms
 from horizon.utils import memoized
 
+from watcher_dashboard.api import aio
+from watcher_dashboard.api import catalog
 from watcher_dashboard.api import watcher
 from watcher_dashboard.common import client as common_client
+from watcher_dashboard.common import deferred as common_deferred
+from watcher_dashboard.common import http as common_http
+from watcher_dashboard.common import tables as common_tables
 from watcher_dashboard.content.audit_templates import forms as wforms
 from watcher_dashboard.content.audit_templates import tables
 from watcher_dashboard.content.audit_templates import tabs as wtabs
+from watcher_dashboard.content.audits import tables as audit_tables
 
 
 LOG = logging.getLogger(__name__)
 
 
-class IndexView(horizon.tables.DataTableView):
+class IndexView(horizon.tables.PagedTableMixin, horizon.tables.DataTableView):
     table_class = tables.AuditTemplatesTable
     template_name = 'infra_optim/audit_templates/index.html'
     page_title = _("Audit Templates")
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['audit_templates_count'] = self.get_count()
-        return context
-
     def get_data(self):
         audit_templates = []
         search_opts = self.get_filters()
         try:
-            audit_templates = watcher.AuditTemplate.list(
-                self.request, **search_opts
+            marker, sort_dir = self._get_marker()
+            audit_templates, self._has_more_data, self._has_prev_data = (
+                watcher.AuditTemplate.list_paged(
+                    self.request,
+                    marker=marker,
+                    paginate=True,
+                    sort_dir=sort_dir,
+                    select=common_tables.get_query_select(self.table),
+                    **search_opts,
+                )
             )
         except Exception as exc:
             LOG.exception(exc)
@@ -62,19 +71,8 @@ class IndexView(horizon.tables.DataTableView):
             )
         return audit_templates
 
-    def get_count(self):
-        return len(self.get_data())
-
     def get_filters(self):
-        filters = {}
-        filter_action = self.table._meta._filter_action
-        if filter_action:
-            filter_field = self.table.get_filter_field()
-            if filter_action.is_api_filter(filter_field):
-                filter_string = self.table.get_filter_string()
-                if filter_field and filter_string:
-                    filters[filter_field] = filter_string
-        return filters
+        return common_tables.get_api_filters(self.table)
 
 
 class CreateView(forms.ModalFormView):
@@ -91,7 +89,11 @@ class CreateView(forms.ModalFormView):
         return obj.uuid
 
 
-class DetailView(horizon.tabs.TabbedTableView):
+class DetailView(
+    common_deferred.DeferredTablesMixin, horizon.tables.MultiTableView
+):
+    table_classes = (audit_tables.RelatedAuditsTable,)
+    deferred_tables = {'audits': 0}
     tab_group_class = wtabs.AuditTemplateDetailTabs
     template_name = 'infra_optim/audit_templates/details.html'
     redirect_url = 'horizon:admin:audit_templates:index'
@@ -101,6 +103,7 @@ class DetailView(horizon.tabs.TabbedTableView):
     def max_version(self):
         return common_client.get_max_version(self.request)
 
+    @memoized.memoized_method
     def _get_data(self):
         audit_template_uuid = None
         try:
@@ -122,9 +125,8 @@ class DetailView(horizon.tabs.TabbedTableView):
             )
         return audit_template
 
-    def get_related_audits_data(self):
+    def get_audits_data(self):
         try:
-            audit_template = self._get_data()
             server_version = self.max_version()
             version = (
                 common_client.MV_START_END
@@ -136,7 +138,7 @@ class DetailView(horizon.tabs.TabbedTableView):
             audits = watcher.Audit.list(
                 self.request,
                 api_version=version,
-                audit_template=audit_template.uuid,
+                audit_template=self.kwargs['audit_template_uuid'],
             )
         except Exception as exc:
             LOG.exception(exc)
@@ -159,7 +161,15 @@ class DetailView(horizon.tabs.TabbedTableView):
         )
 
 
-def get_strategies_for_goal(request):
+def _strategies_version(request):
+    if not request.GET.get('goal_uuid'):
+        return None
+    watcher.Strategy.list(request)
+    return catalog.get_version(request, catalog.STRATEGIES)
+
+
+@common_http.conditional(_strategies_version)
+async def get_strategies_for_goal(request):
     """AJAX endpoint to get strategies filtered by selected goal.
 
     Expects a GET parameter 'goal_uuid'. Returns a JSON with a list of
@@ -170,7 +180,7 @@ def get_strategies_for_goal(request):
         if not goal_uuid:
             return JsonResponse({'error': 'goal_uuid is required'}, status=400)
 
-        strategies = watcher.Strategy.list(request, goal=goal_uuid)
+        strategies = await aio.Strategy.list(request, goal=goal_uuid)
 
         data = [
             {
@@ -26,12 +26,14 @@ from horizon import exceptions
 from horizon import forms
 from horizon import messages
 
+from watcher_dashboard import config
 from watcher_dashboard.api import watcher
 from watcher_dashboard.common import client as common_client
 
 
 LOG = logging.getLogger(__name__)
 ADD_AUDIT_TEMPLATES_URL = "horizon:admin:audit_templates:create"
+SEARCH_AUDIT_TEMPLATES_URL = "horizon:admin:audits:search_audit_templates"
 
 
 class CreateForm(forms.SelfHandlingForm):
@@ -160,24 +162,64 @@ class CreateForm(forms.SelfHandlingForm):
 
     def _get_audit_template_list(self, request):
         try:
-            audit_templates = watcher.AuditTemplate.list(self.request)
+            audit_templates = watcher.AuditTemplate.list_names(self.request)
         except Exception as e:
             msg = _('Failed to get audit template list: %s') % str(e)
             LOG.info(msg)
             messages.warning(request, msg)
             audit_templates = []
 
-        choices = [
-            (audit_template.uuid, audit_template.name or audit_template.uuid)
+        selected = self.data.get(
+            self.add_prefix('audit_template')
+        ) or self.initial.get('audit_template')
+        if selected and not any(
+            audit_template['uuid'] == selected
             for audit_template in audit_templates
-        ]
+        ):
+            # The cached names may predate the selected template.
+            audit_template = self._get_audit_template(request, selected)
+            if audit_template is not None:
+                audit_templates = audit_templates + [audit_template]
 
-        if choices:
-            choices.insert(0, ("", _("Select Audit Template")))
+        if len(audit_templates) > config.get_audit_template_select_threshold():
+            # Too many templates to list them all: only keep the selected
+            # one, the others are searched as the user types.
+            self.fields['audit_template'].widget.attrs['data-search-url'] = (
+                reverse(SEARCH_AUDIT_TEMPLATES_URL)
+            )
+            audit_templates = [
+                audit_template
+                for audit_template in audit_templates
+                if audit_template['uuid'] == selected
+            ]
+            choices = [("", _("Search Audit Template"))]
+        elif audit_templates:
+            choices = [("", _("Select Audit Template"))]
         else:
-            choices.insert(0, ("", _("No Audit Template found")))
+            choices = [("", _("No Audit Template found"))]
+
+        choices.extend(
+            (
+                audit_template['uuid'],
+                audit_template['name'] or audit_template['uuid'],
+            )
+            for audit_template in audit_templates
+        )
         return choices
 
+    def _get_audit_template(self, request, audit_template_id):
+        """Return the UUID and name of an audit template, or ``None``."""
+        try:
+            audit_template = watcher.AuditTemplate.get(
+                request, audit_template_id, _error_handle=False
+            )
+        except Exception:
+            LOG.debug(
+                'Audit template %s not found', audit_template_id, exc_info=True
+            )
+            return None
+        return {'uuid': audit_template.uuid, 'name': audit_template.name}
+
     def _parse_parameters(self, param_string):
         """Parse parameters JSON string into a dictionary
 
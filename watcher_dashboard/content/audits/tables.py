@@ -26,6 +26,8 @@ from django.utils.translation import pgettext_lazy
 from horizon.utils import filters
 
 from watcher_dashboard.api import watcher
+from watcher_dashboard.common import export
+from watcher_dashboard.common import tables as common_tables
 
 
 AUDIT_STATE_DISPLAY_CHOICES = (
@@ -39,16 +41,20 @@ AUDIT_STATE_DISPLAY_CHOICES = (
 )
 
 
-class AuditsFilterAction(horizon.tables.FilterAction):
-    # server = choices query = text
-    filter_type = "server"
+class AuditsFilterAction(common_tables.QueryFilterAction):
     filter_choices = (
         ('goal', _("Goal ="), True),
         ('strategy', _("Strategy ="), True),
+        common_tables.QUERY_CHOICE,
     )
     policy_rules = (("infra-optim", "audit:detail"),)
 
 
+class ExportAudits(export.ExportAction):
+    url = "horizon:admin:audits:export"
+    policy_rules = (("infra-optim", "audit:detail"),)
+
+
 class CreateAudit(horizon.tables.LinkAction):
     name = "create_audit"
     verbose_name = _("Create Audit")
@@ -64,23 +70,45 @@ class GoToActionPlan(horizon.tables.Action):
     policy_rules = (("infra-optim", "action_plan:detail"),)
 
     def allowed(self, request, audit):
-        return audit or audit.state in ("SUCCEEDED",)
+        return audit is not None and bool(
+            getattr(audit, 'action_plan_uuid', None)
+            or audit.state == "SUCCEEDED"
+        )
 
     def single(self, table, request, audit_id):
-        try:
-            action_plans = watcher.ActionPlan.list(request, audit=audit_id)
-        except Exception:
-            horizon.exceptions.handle(
-                request, _("Unable to retrieve action_plan information.")
-            )
-            return "javascript:void(0);"
+        action_plan_uuid = watcher.ActionPlan.latest_by_audit(
+            request, [audit_id]
+        ).get(audit_id)
+        if action_plan_uuid is None:
+            # The action plans of this audit were never listed.
+            try:
+                action_plans = watcher.ActionPlan.list(
+                    request, index=True, audit=audit_id
+                )
+            except Exception:
+                horizon.exceptions.handle(
+                    request,
+                    _("Unable to retrieve action_plan information."),
+                    redirect=table.get_full_url(),
+                )
+            if not action_plans:
+                horizon.messages.info(
+                    request, _("This audit has no action plan.")
+                )
+                return shortcuts.redirect(table.get_full_url())
+            action_plan_uuid = max(
+                action_plans,
+                key=lambda action_plan: action_plan.created_at or '',
+            ).uuid
 
         return shortcuts.redirect(
-            urls.reverse(self.url, args=[action_plans[0].uuid])
+            urls.reverse(self.url, args=[action_plan_uuid])
         )
 
 
-class ArchiveAudits(horizon.tables.DeleteAction):
+class ArchiveAudits(
+    common_tables.ConcurrentBatchActionMixin, horizon.tables.DeleteAction
+):
     verbose_name = _("Archive Audits")
     policy_rules = (("infra-optim", "audit:delete"),)
 
@@ -99,7 +127,9 @@ class ArchiveAudits(horizon.tables.DeleteAction):
         watcher.Audit.delete(request, obj_id)
 
 
-class CancelAudits(horizon.tables.BatchAction):
+class CancelAudits(
+    common_tables.ConcurrentBatchActionMixin, horizon.tables.BatchAction
+):
     name = _("Cancel")
     verbose_name = _("Cancel Audits")
     policy_rules = (("infra-optim", "audit:update"),)
@@ -119,6 +149,16 @@ class CancelAudits(horizon.tables.BatchAction):
         watcher.Audit.cancel(request, obj_id)
 
 
+def get_action_plan_link(datum):
+    action_plan_uuid = getattr(datum, "action_plan_uuid", None)
+    if not action_plan_uuid:
+        return None
+    return urls.reverse(
+        "horizon:admin:action_plans:detail",
+        kwargs={"action_plan_uuid": action_plan_uuid},
+    )
+
+
 class AuditsTable(horizon.tables.DataTable):
     uuid = horizon.tables.Column(
         'uuid', verbose_name=_("UUID"), link="horizon:admin:audits:detail"
@@ -141,6 +181,11 @@ class AuditsTable(horizon.tables.DataTable):
         verbose_name=_('State'),
         display_choices=AUDIT_STATE_DISPLAY_CHOICES,
     )
+    action_plan = horizon.tables.Column(
+        'action_plan_uuid',
+        verbose_name=_('Action Plan'),
+        link=get_action_plan_link,
+    )
 
     def get_object_id(self, datum):
         return datum.uuid
@@ -149,7 +194,7 @@ class AuditsTable(horizon.tables.DataTable):
         name = "audits"
         verbose_name = _("Audits")
         launch_actions = (CreateAudit,)
-        table_actions = launch_actions + (AuditsFilterAction,)
+        table_actions = launch_actions + (AuditsFilterAction, ExportAudits)
         row_actions = (GoToActionPlan, ArchiveAudits, CancelAudits)
 
 
@@ -0,0 +1,446 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+
+from unittest import mock
+
+from django import urls
+
+from watcher_dashboard import api
+from watcher_dashboard.common import client as common_client
+from watcher_dashboard.content.audits import forms
+from watcher_dashboard.tests import helpers as test
+
+
+INDEX_URL = urls.reverse('horizon:admin:audits:index')
+CREATE_URL = urls.reverse('horizon:admin:audits:create')
+EXPORT_URL = urls.reverse('horizon:admin:audits:export')
+SEARCH_URL = urls.reverse('horizon:admin:audits:search_audit_templates')
+PARAMETERS_URL = urls.reverse('horizon:admin:audits:get_strategy_parameters')
+
+
+class StrategyParametersTest(test.BaseAdminViewTests):
+    def setUp(self):
+        super().setUp()
+        test.patch_watcher_url(self)
+        self.strategy = api.watcher.Strategy(
+            {
+                'uuid': 'ssssssss-1111-1111-1111-ssssssssssss',
+                'name': 'dummy',
+                'display_name': 'Dummy strategy',
+                'parameters_spec': json.dumps(
+                    {'properties': {'para1': {'type': 'number'}}}
+                ),
+            }
+        )
+        self.audit_template = api.watcher.AuditTemplate(
+            {
+                'uuid': 'aaaaaaaa-1111-1111-1111-aaaaaaaaaaaa',
+                'strategy_uuid': self.strategy.uuid,
+                'strategy_name': self.strategy.name,
+            }
+        )
+
+    def _get_parameters(self):
+        return self.client.get(
+            PARAMETERS_URL, {'audit_template_uuid': self.audit_template.uuid}
+        )
+
+    @mock.patch.object(api.watcher.Strategy, 'get')
+    @mock.patch.object(api.watcher.AuditTemplate, 'get')
+    def test_parameters_cached(self, m_template_get, m_strategy_get):
+        m_template_get.return_value = self.audit_template
+        m_strategy_get.return_value = self.strategy
+
+        first = self._get_parameters().json()
+        template_calls = m_template_get.call_count
+        second = self._get_parameters().json()
+
+        self.assertEqual(
+            first,
+            {
+                'strategy_name': 'Dummy strategy',
+                'strategy_uuid': self.strategy.uuid,
+                'parameters_spec': {'para1': {'type': 'number'}},
+            },
+        )
+        self.assertEqual(second, first)
+        self.assertEqual(m_template_get.call_count, template_calls)
+
+    @mock.patch.object(api.watcher.Strategy, 'get')
+    @mock.patch.object(api.watcher.AuditTemplate, 'get')
+    @mock.patch.object(api.watcher, 'watcherclient')
+    def test_parameters_forgotten_on_delete(
+        self, m_client, m_template_get, m_strategy_get
+    ):
+        m_template_get.return_value = self.audit_template
+        m_strategy_get.return_value = self.strategy
+
+        self._get_parameters()
+        template_calls = m_template_get.call_count
+        api.watcher.AuditTemplate.delete(mock.Mock(), self.audit_template.uuid)
+        self._get_parameters()
+
+        self.assertEqual(m_template_get.call_count, 2 * template_calls)
+
+    @mock.patch.object(api.watcher.AuditTemplate, 'get')
+    def test_failure_not_cached(self, m_template_get):
+        m_template_get.side_effect = self.exceptions.watcher
+        self.audit_template.strategy_uuid = None
+
+        with self.assertLogs('watcher_dashboard.content.audits.views'):
+            res = self._get_parameters()
+        self.assertEqual(res.status_code, 500)
+        self.assertNotIn('ETag', res)
+
+        m_template_get.side_effect = None
+        m_template_get.return_value = self.audit_template
+        self.assertEqual(self._get_parameters().json()['parameters_spec'], {})
+
+    @mock.patch.object(api.watcher.Strategy, 'get')
+    @mock.patch.object(api.watcher.AuditTemplate, 'get')
+    def test_not_modified(self, m_template_get, m_strategy_get):
+        m_template_get.return_value = self.audit_template
+        m_strategy_get.return_value = self.strategy
+
+        res = self._get_parameters()
+        self.assertEqual(res.status_code, 200)
+        self.assertIn('private', res['Cache-Control'])
+
+        res = self.client.get(
+            PARAMETERS_URL,
+            {'audit_template_uuid': self.audit_template.uuid},
+            HTTP_IF_NONE_MATCH=res['ETag'],
+        )
+        self.assertEqual(res.status_code, 304)
+        self.assertIn('max-age', res['Cache-Control'])
+
+    @mock.patch.object(api.watcher.Strategy, 'get')
+    @mock.patch.object(api.watcher.AuditTemplate, 'get')
+    @mock.patch.object(api.watcher, 'watcherclient')
+    def test_etag_changes_on_update(
+        self, m_client, m_template_get, m_strategy_get
+    ):
+        m_template_get.return_value = self.audit_template
+        m_strategy_get.return_value = self.strategy
+
+        etag = self._get_parameters()['ETag']
+        api.watcher.AuditTemplate.patch(
+            mock.Mock(),
+            self.audit_template.uuid,
+            {'strategy_uuid': 'tttttttt-1111-1111-1111-tttttttttttt'},
+        )
+        self.audit_template.strategy_uuid = (
+            'tttttttt-1111-1111-1111-tttttttttttt'
+        )
+        res = self.client.get(
+            PARAMETERS_URL,
+            {'audit_template_uuid': self.audit_template.uuid},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res['ETag'], etag)
+
+
+class ArchiveAuditsTest(test.BaseAdminViewTests):
+    def setUp(self):
+        super().setUp()
+        self.audits = [
+            api.watcher.Audit(
+                {
+                    'uuid': f'{i}{i}{i}{i}{i}{i}{i}{i}-2222-2222-2222-'
+                    f'222222222222',
+                    'name': f'Audit {i}',
+                    'state': 'SUCCEEDED',
+                }
+            )
+            for i in range(1, 4)
+        ]
+
+    @mock.patch.object(api.watcher.Audit, 'delete')
+    @mock.patch.object(api.watcher.Audit, 'list_paged')
+    @mock.patch.object(common_client, 'get_max_version', return_value='1.0')
+    def test_archive_concurrently(self, _m_version, m_list, m_delete):
+        m_list.return_value = (self.audits, False, False)
+        failing = self.audits[1].uuid
+        barrier = threading.Barrier(len(self.audits), timeout=5)
+
+        def delete(request, audit_id):
+            # Only returns once every audit is being archived at once.
+            barrier.wait()
+            if audit_id == failing:
+                raise ValueError('boom')
+
+        m_delete.side_effect = delete
+
+        res = self.client.post(
+            INDEX_URL,
+            {
+                'action': 'audits__delete',
+                'object_ids': [audit.uuid for audit in self.audits],
+            },
+        )
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+        self.assertCountEqual(
+            [c.args[1] for c in m_delete.call_args_list],
+            [audit.uuid for audit in self.audits],
+        )
+        self.assertMessageCount(info=1, error=1)
+
+
+class GoToActionPlanTest(test.BaseAdminViewTests):
+    def setUp(self):
+        super().setUp()
+        test.patch_watcher_url(self)
+        self.audit = api.watcher.Audit(
+            {
+                'uuid': '22222222-2222-2222-2222-222222222222',
+                'name': 'Audit 1',
+                'state': 'SUCCEEDED',
+            }
+        )
+        self.action_plan = api.watcher.ActionPlan(
+            {
+                'uuid': '33333333-3333-3333-3333-333333333333',
+                'audit_uuid': self.audit.uuid,
+                'created_at': '2026-01-01T00:00:00',
+            }
+        )
+        self.detail_url = urls.reverse(
+            'horizon:admin:action_plans:detail', args=[self.action_plan.uuid]
+        )
+
+    def _go_to_action_plan(self):
+        return self.client.post(
+            INDEX_URL,
+            {'action': f'audits__go_to_action_plan__{self.audit.uuid}'},
+        )
+
+    @mock.patch.object(api.watcher, 'watcherclient')
+    @mock.patch.object(api.watcher.Audit, 'list_paged')
+    @mock.patch.object(common_client, 'get_max_version', return_value='1.0')
+    def test_indexed_action_plan(self, _m_version, m_list, m_client):
+        m_list.return_value = ([self.audit], False, False)
+        m_client.return_value.action_plan.list.return_value = [
+            self.action_plan
+        ]
+        api.watcher.ActionPlan.list(self.mock_rest_request(), index=True)
+        m_client.reset_mock()
+
+        res = self._go_to_action_plan()
+        index = self.client.get(INDEX_URL)
+
+        self.assertRedirectsNoFollow(res, self.detail_url)
+        self.assertContains(index, f'href="{self.detail_url}"')
+        m_client.return_value.action_plan.list.assert_not_called()
+
+    @mock.patch.object(api.watcher.ActionPlan, 'list')
+    @mock.patch.object(api.watcher.Audit, 'list_paged')
+    @mock.patch.object(common_client, 'get_max_version', return_value='1.0')
+    def test_unknown_action_plan(self, _m_version, m_list, m_plan_list):
+        m_list.return_value = ([self.audit], False, False)
+        m_plan_list.return_value = [self.action_plan]
+
+        res = self._go_to_action_plan()
+
+        self.assertRedirectsNoFollow(res, self.detail_url)
+        m_plan_list.assert_called_once_with(
+            mock.ANY, index=True, audit=self.audit.uuid
+        )
+
+
+class AuditTemplateSearchTest(test.BaseAdminViewTests):
+    def setUp(self):
+        super().setUp()
+        test.patch_watcher_url(self)
+        self.audit_templates = [
+            {'uuid': audit_template['uuid'], 'name': audit_template['name']}
+            for audit_template in self.api_audit_templates.list()
+        ]
+
+    @mock.patch.object(api.watcher.AuditTemplate, 'list_names')
+    def test_search(self, m_list_names):
+        m_list_names.return_value = self.audit_templates
+
+        res = self.client.get(SEARCH_URL, {'q': 'audit template 2'})
+
+        self.assertEqual(
+            res.json(), {'audit_templates': [self.audit_templates[1]]}
+        )
+
+    @mock.patch.object(
+        forms.config, 'get_audit_template_select_threshold', return_value=1
+    )
+    @mock.patch.object(common_client, 'get_max_version', return_value='1.0')
+    @mock.patch.object(api.watcher.AuditTemplate, 'list_names')
+    def test_create_form_searches_templates(
+        self, m_list_names, _m_version, _m_threshold
+    ):
+        m_list_names.return_value = self.audit_templates
+
+        res = self.client.get(CREATE_URL)
+
+        field = res.context['form'].fields['audit_template']
+        self.assertEqual(field.widget.attrs['data-search-url'], SEARCH_URL)
+        self.assertEqual([value for value, _label in field.choices], [''])
+
+    @mock.patch.object(common_client, 'get_max_version', return_value='1.0')
+    @mock.patch.object(api.watcher.AuditTemplate, 'list_names')
+    def test_create_form_lists_templates(self, m_list_names, _m_version):
+        m_list_names.return_value = self.audit_templates
+
+        res = self.client.get(CREATE_URL)
+
+        field = res.context['form'].fields['audit_template']
+        self.assertNotIn('data-search-url', field.widget.attrs)
+        self.assertEqual(len(field.choices), len(self.audit_templates) + 1)
+
+    @mock.patch.object(common_client, 'get_max_version', return_value='1.0')
+    @mock.patch.object(api.watcher.AuditTemplate, 'get')
+    @mock.patch.object(api.watcher.AuditTemplate, 'list_names')
+    def test_create_form_accepts_uncached_template(
+        self, m_list_names, m_get, _m_version
+    ):
+        m_list_names.return_value = self.audit_templates[1:]
+        audit_template = self.api_audit_templates.first()
+        m_get.return_value = api.watcher.AuditTemplate(audit_template)
+
+        form = forms.CreateForm(
+            self.request, data={'audit_template': audit_template['uuid']}
+        )
+
+        field = form.fields['audit_template']
+        self.assertEqual(
+            field.clean(audit_template['uuid']), audit_template['uuid']
+        )
+        m_get.assert_called_once_with(
+            self.request, audit_template['uuid'], _error_handle=False
+        )
+
+
+class ExportAuditsTest(test.BaseAdminViewTests):
+    @mock.patch.object(api.watcher.Audit, 'iter_all')
+    @mock.patch.object(
+        common_client,
+        'get_max_version',
+        return_value=common_client.MV_SKIP_ACTION,
+    )
+    def test_export_table_filter(self, _m_version, m_iter_all):
+        m_iter_all.return_value = iter(self.audits.list())
+        self.setSessionValues(
+            audits__filter__q_field='goal', audits__filter__q='dummy'
+        )
+
+        res = self.client.get(EXPORT_URL, {'format': 'ndjson'})
+
+        lines = b''.join(res.streaming_content).decode().splitlines()
+        self.assertEqual(
+            [json.loads(line)['uuid'] for line in lines],
+            [audit.uuid for audit in self.audits.list()],
+        )
+        m_iter_all.assert_called_once_with(
+            mock.ANY,
+            1000,
+            api_version=common_client.MV_START_END,
+            goal='dummy',
+        )
+
+
+class EfficacyTrendTest(test.BaseAdminViewTests):
+    @mock.patch.object(api.watcher.ActionPlan, 'list')
+    def test_trend(self, m_list):
+        audit = self.audits.first()
+        m_list.return_value = [
+            api.watcher.ActionPlan(
+                {
+                    'uuid': f'{i}{i}{i}{i}{i}{i}{i}{i}-3333-3333-3333-'
+                    f'333333333333',
+                    'created_at': f'2025-01-0{i}T00:00:00',
+                    'global_efficacy': [
+                        {'name': 'released', 'unit': '%', 'value': i * 10}
+                    ],
+                }
+            )
+            for i in range(1, 4)
+        ]
+
+        res = self.client.get(
+            urls.reverse('horizon:admin:audits:trend', args=[audit.uuid])
+        )
+
+        (indicator,) = res.json()['indicators']
+        self.assertEqual(indicator['count'], 3)
+        self.assertEqual(indicator['delta'], 20.0)
+        m_list.assert_called_once_with(
+            mock.ANY,
+            audit=audit.uuid,
+            limit=0,
+            fields=('created_at', 'global_efficacy'),
+        )
+
+
+class AuditDetailTest(test.BaseAdminViewTests):
+    def setUp(self):
+        super().setUp()
+        max_version = mock.patch.object(
+            common_client,
+            'get_max_version',
+            return_value=common_client.MV_START_END,
+        )
+        max_version.start()
+        self.addCleanup(max_version.stop)
+        self.audit = self.audits.first()
+        self.url = urls.reverse(
+            'horizon:admin:audits:detail', args=[self.audit.uuid]
+        )
+
+    @mock.patch.object(api.watcher.ActionPlan, 'list')
+    @mock.patch.object(api.watcher.Audit, 'get')
+    def test_details_defer_action_plans(self, m_get, m_list):
+        m_get.return_value = self.audit
+
+        res = self.client.get(self.url)
+
+        self.assertTemplateUsed(res, 'infra_optim/audits/details.html')
+        self.assertContains(res, '?deferred=related_action_plans')
+        m_list.assert_not_called()
+
+    @mock.patch.object(api.watcher.ActionPlan, 'list')
+    @mock.patch.object(api.watcher.Audit, 'get')
+    def test_deferred_action_plans(self, m_get, m_list):
+        action_plan = self.action_plans.first()
+        action_plan.global_efficacy = []
+        m_list.return_value = [action_plan]
+
+        res = self.client.get(self.url, {'deferred': 'related_action_plans'})
+
+        self.assertContains(res, f'data-object-id="{action_plan.uuid}"')
+        # Row actions are posted to, and come back to, the page.
+        self.assertContains(res, f'action="{self.url}"')
+        self.assertIn('ETag', res)
+        m_get.assert_not_called()
+        m_list.assert_called_once_with(
+            mock.ANY, audit=self.audit.uuid, fields=mock.ANY, index=True
+        )
+
+        # The ETag doesn't depend on the CSRF token of the rendered table.
+        res = self.client.get(
+            self.url,
+            {'deferred': 'related_action_plans'},
+            HTTP_IF_NONE_MATCH=res['ETag'],
+        )
+        self.assertEqual(res.status_code, 304)
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import json
 import logging
 
@@ -30,8 +31,16 @@ from django.utils.translation import gettext_lazy as _
 from horizon import forms
 from horizon.utils import memoized
 
+from watcher_dashboard.api import catalog
 from watcher_dashboard.api import watcher
 from watcher_dashboard.common import client as common_client
+from watcher_dashboard.common import concurrency
+from watcher_dashboard.common import deferred as common_deferred
+from watcher_dashboard.common import export
+from watcher_dashboard.common import http as common_http
+from watcher_dashboard.common import rows
+from watcher_dashboard.common import tables as common_tables
+from watcher_dashboard.common import trend
 from watcher_dashboard.content.action_plans import tables as action_plan_tables
 from watcher_dashboard.content.audits import forms as wforms
 from watcher_dashboard.content.audits import tables
@@ -40,8 +49,31 @@ from watcher_dashboard.content.audits import tabs as wtabs
 
 LOG = logging.getLogger(__name__)
 
-
-class IndexView(horizon.tables.DataTableView):
+# Maximum number of audit templates returned by a search
+AUDIT_TEMPLATE_SEARCH_LIMIT = 20
+
+# Attributes of the exported audits, in column order
+EXPORT_FIELDS = (
+    'uuid',
+    'name',
+    'audit_type',
+    'state',
+    'goal_name',
+    'strategy_name',
+    'interval',
+    'parameters',
+    'auto_trigger',
+    'start_time',
+    'end_time',
+    'created_at',
+    'updated_at',
+)
+
+# Attributes of the action plans needed by the efficacy trend
+TREND_FIELDS = ('created_at', 'global_efficacy')
+
+
+class IndexView(horizon.tables.PagedTableMixin, horizon.tables.DataTableView):
     table_class = tables.AuditsTable
     template_name = 'infra_optim/audits/index.html'
     page_title = _("Audits")
@@ -59,7 +91,6 @@ class IndexView(horizon.tables.DataTableView):
             'ajax_modal': True,
         }
         context['header_actions'] = [create_action]
-        context['audits_count'] = self.get_audits_count()
         return context
 
     def get_data(self):
@@ -74,28 +105,43 @@ class IndexView(horizon.tables.DataTableView):
                 )
                 else None
             )
-            audits = watcher.Audit.list(
-                self.request, api_version=version, **search_opts
+            select = common_tables.get_query_select(self.table)
+            if select is not None:
+                # The query may test the action plans of the audits.
+                select = functools.partial(self._select, select)
+
+            marker, sort_dir = self._get_marker()
+            audits, self._has_more_data, self._has_prev_data = (
+                watcher.Audit.list_paged(
+                    self.request,
+                    marker=marker,
+                    paginate=True,
+                    sort_dir=sort_dir,
+                    select=select,
+                    api_version=version,
+                    **search_opts,
+                )
             )
         except Exception:
             horizon.exceptions.handle(
                 self.request, _("Unable to retrieve audit information.")
             )
-        return audits
+        return self._set_action_plans(audits)
 
-    def get_audits_count(self):
-        return len(self.get_data())
+    def _select(self, select, audits):
+        return select(self._set_action_plans(audits))
+
+    def _set_action_plans(self, audits):
+        """Set the UUID of the latest action plan of each of ``audits``."""
+        action_plans = watcher.ActionPlan.latest_by_audit(
+            self.request, [audit.uuid for audit in audits]
+        )
+        for audit in audits:
+            audit.action_plan_uuid = action_plans.get(audit.uuid)
+        return audits
 
     def get_filters(self):
-        filters = {}
-        filter_action = self.table._meta._filter_action
-        if filter_action:
-            filter_field = self.table.get_filter_field()
-            if filter_action.is_api_filter(filter_field):
-                filter_string = self.table.get_filter_string()
-                if filter_field and filter_string:
-                    filters[filter_field] = filter_string
-        return filters
+        return common_tables.get_api_filters(self.table)
 
 
 class CreateView(forms.ModalFormView):
@@ -109,8 +155,11 @@ class CreateView(forms.ModalFormView):
     submit_url = reverse_lazy("horizon:admin:audits:create")
 
 
-class DetailView(horizon.tables.MultiTableView):
+class DetailView(
+    common_deferred.DeferredTablesMixin, horizon.tables.MultiTableView
+):
     table_classes = (action_plan_tables.RelatedActionPlansTable,)
+    deferred_tables = {'related_action_plans': 0}
     tab_group_class = wtabs.AuditDetailTabs
     template_name = 'infra_optim/audits/details.html'
     redirect_url = 'horizon:admin:audits:index'
@@ -120,22 +169,49 @@ class DetailView(horizon.tables.MultiTableView):
     def max_version(self):
         return common_client.get_max_version(self.request)
 
+    def _fetch_audit(self):
+        server_version = self.max_version()
+        version = (
+            common_client.MV_START_END
+            if common_client.is_microversion_supported(
+                server_version, common_client.MV_START_END
+            )
+            else None
+        )
+        return watcher.Audit.get(
+            self.request, self.kwargs['audit_uuid'], api_version=version
+        )
+
+    @memoized.memoized_method
+    def _prefetch(self):
+        """Fetch the audit and its action plans concurrently.
+
+        Only the audit is fetched for the page, and only the action plans
+        for their deferred table.
+        """
+        calls = {}
+        if self.get_requested_table() is None:
+            calls['audit'] = self._fetch_audit
+        if not self.is_deferred('related_action_plans'):
+            calls['action_plans'] = functools.partial(
+                watcher.ActionPlan.list,
+                self.request,
+                audit=self.kwargs['audit_uuid'],
+                fields=rows.get_table_fields(
+                    action_plan_tables.RelatedActionPlansTable
+                ),
+                index=True,
+            )
+        return dict(
+            zip(calls, concurrency.fan_out(self.request, *calls.values()))
+        )
+
     @memoized.memoized_method
     def _get_data(self):
         audit_uuid = None
         try:
             audit_uuid = self.kwargs['audit_uuid']
-            server_version = self.max_version()
-            version = (
-                common_client.MV_START_END
-                if common_client.is_microversion_supported(
-                    server_version, common_client.MV_START_END
-                )
-                else None
-            )
-            audit = watcher.Audit.get(
-                self.request, audit_uuid, api_version=version
-            )
+            audit = self._prefetch()['audit'].result()
         except Exception:
             msg = _('Unable to retrieve details for audit "%s".') % audit_uuid
             horizon.exceptions.handle(
@@ -183,10 +259,7 @@ class DetailView(horizon.tables.MultiTableView):
 
     def get_related_action_plans_data(self):
         try:
-            action_plan = self._get_data()
-            audits = watcher.ActionPlan.list(
-                self.request, audit=action_plan.uuid
-            )
+            audits = self._prefetch()['action_plans'].result()
         except Exception as exc:
             LOG.exception(exc)
             audits = []
@@ -211,8 +284,84 @@ class DetailView(horizon.tables.MultiTableView):
         return self.tab_group_class(request, audit=audit, **kwargs)
 
 
-def get_strategy_parameters(request):
-    """AJAX endpoint to get strategy parameters based on audit template."""
+def _resolve_strategy_parameters(request, audit_template_uuid):
+    """Resolve an audit template to its strategy and parameters spec."""
+    audit_template = watcher.AuditTemplate.get(request, audit_template_uuid)
+
+    if not audit_template.strategy_uuid:
+        return {
+            'strategy_name': audit_template.strategy_name or 'auto',
+            'parameters_spec': {},
+            'message': (
+                'No specific strategy selected. Parameters will '
+                'be automatically determined.'
+            ),
+        }
+
+    # Get the strategy details
+    strategy = watcher.Strategy.get(request, audit_template.strategy_uuid)
+
+    # Parse parameters_spec if it exists
+    parameters_spec = {}
+    if hasattr(strategy, 'parameters_spec') and strategy.parameters_spec:
+        if isinstance(strategy.parameters_spec, dict):
+            properties = strategy.parameters_spec.get('properties', {})
+            parameters_spec = properties
+        elif isinstance(strategy.parameters_spec, str):
+            try:
+                parsed_spec = json.loads(strategy.parameters_spec)
+                parameters_spec = parsed_spec.get('properties', {})
+            except ValueError:
+                parameters_spec = {}
+
+    return {
+        'strategy_name': watcher.get_strategy_display_name(strategy),
+        'strategy_uuid': strategy.uuid,
+        'parameters_spec': parameters_spec,
+    }
+
+
+def _get_cached_strategy_parameters(request, audit_template_uuid):
+    return catalog.get_item(
+        request,
+        catalog.TEMPLATE_PARAMETERS,
+        audit_template_uuid,
+        lambda: _resolve_strategy_parameters(request, audit_template_uuid),
+    )
+
+
+def _strategy_parameters_version(request):
+    """Return the version of the strategy parameters of an audit template.
+
+    The parameters only depend on the strategy of the template, so the
+    version is derived from the strategy UUID and update time, leaving
+    the parameters themselves to the view.
+    """
+    audit_template_uuid = request.GET.get('audit_template_uuid')
+    if not audit_template_uuid:
+        return None
+    parameters = catalog.get_items(
+        request, catalog.TEMPLATE_PARAMETERS, [audit_template_uuid]
+    ).get(audit_template_uuid)
+    if parameters is not None:
+        strategy_uuid = parameters.get('strategy_uuid')
+    else:
+        strategy_uuid = watcher.AuditTemplate.get(
+            request, audit_template_uuid
+        ).strategy_uuid
+    if not strategy_uuid:
+        return 'auto'
+    strategy = watcher.Strategy.get(request, strategy_uuid)
+    return f'{strategy_uuid}:{getattr(strategy, "updated_at", None)}'
+
+
+@common_http.conditional(_strategy_parameters_version)
+async def get_strategy_parameters(request):
+    """AJAX endpoint to get strategy parameters based on audit template.
+
+    The resolved parameters are cached per audit template, and dropped
+    when the template is updated or archived.
+    """
     try:
         audit_template_uuid = request.GET.get('audit_template_uuid')
         if not audit_template_uuid:
@@ -220,47 +369,78 @@ def get_strategy_parameters(request):
                 {'error': 'Audit template UUID is required'}, status=400
             )
 
-        # Get the audit template
-        audit_template = watcher.AuditTemplate.get(
-            request, audit_template_uuid
+        parameters = await concurrency.run_async(
+            request,
+            functools.partial(
+                _get_cached_strategy_parameters, request, audit_template_uuid
+            ),
         )
+        return JsonResponse(parameters)
 
-        if not audit_template.strategy_uuid:
-            return JsonResponse(
-                {
-                    'strategy_name': audit_template.strategy_name or 'auto',
-                    'parameters_spec': {},
-                    'message': (
-                        'No specific strategy selected. Parameters will '
-                        'be automatically determined.'
-                    ),
-                }
-            )
+    except Exception as e:
+        LOG.exception("Error getting strategy parameters")
+        return JsonResponse({'error': str(e)}, status=500)
 
-        # Get the strategy details
-        strategy = watcher.Strategy.get(request, audit_template.strategy_uuid)
 
-        # Parse parameters_spec if it exists
-        parameters_spec = {}
-        if hasattr(strategy, 'parameters_spec') and strategy.parameters_spec:
-            if isinstance(strategy.parameters_spec, dict):
-                properties = strategy.parameters_spec.get('properties', {})
-                parameters_spec = properties
-            elif isinstance(strategy.parameters_spec, str):
-                try:
-                    parsed_spec = json.loads(strategy.parameters_spec)
-                    parameters_spec = parsed_spec.get('properties', {})
-                except ValueError:
-                    parameters_spec = {}
+def _audit_templates_version(request):
+    watcher.AuditTemplate.list_names(request)
+    return catalog.get_version(request, catalog.AUDIT_TEMPLATES)
+
 
+@common_http.conditional(_audit_templates_version)
+def search_audit_templates(request):
+    """AJAX endpoint searching the audit templates by name or UUID prefix.
+
+    Used by the audit creation form when there are too many templates to
+    list them all, see ``WATCHER_AUDIT_TEMPLATE_SELECT_THRESHOLD``.
+    """
+    try:
+        audit_templates = watcher.AuditTemplate.search(
+            request,
+            request.GET.get('q', ''),
+            limit=AUDIT_TEMPLATE_SEARCH_LIMIT,
+        )
+    except Exception:
+        LOG.exception("Error searching audit templates")
         return JsonResponse(
-            {
-                'strategy_name': watcher.get_strategy_display_name(strategy),
-                'strategy_uuid': strategy.uuid,
-                'parameters_spec': parameters_spec,
-            }
+            {'error': 'Unable to search audit templates'}, status=500
         )
-
-    except Exception as e:
-        LOG.exception("Error getting strategy parameters")
-        return JsonResponse({'error': str(e)}, status=500)
+    return JsonResponse({'audit_templates': audit_templates})
+
+
+def export_audits(request):
+    """Stream every audit matching the table filter.
+
+    See :mod:`watcher_dashboard.common.export`.
+    """
+    version = None
+    if common_client.is_microversion_supported(
+        common_client.get_max_version(request), common_client.MV_START_END
+    ):
+        version = common_client.MV_START_END
+    return export.export(
+        request,
+        tables.AuditsTable,
+        watcher.Audit.iter_all,
+        EXPORT_FIELDS,
+        'audits',
+        reverse('horizon:admin:audits:index'),
+        api_version=version,
+    )
+
+
+def efficacy_trend(request, audit_uuid):
+    """AJAX endpoint returning the efficacy trend of an audit's plans.
+
+    See :func:`watcher_dashboard.common.trend.build`.
+    """
+    try:
+        action_plans = watcher.ActionPlan.list(
+            request, audit=audit_uuid, limit=0, fields=TREND_FIELDS
+        )
+    except Exception:
+        LOG.exception("Error getting the action plans of %s", audit_uuid)
+        return JsonResponse(
+            {'error': 'Unable to retrieve the action plans'}, status=500
+        )
+    return JsonResponse(trend.build(action_plans))
@@ -56,6 +56,37 @@ class GoalsTest(test.BaseAdminViewTests):
         self.assertTemplateUsed(res, 'infra_optim/goals/details.html')
         goals = res.context['goal']
         self.assertCountEqual([goals], [goal])
+        self.assertContains(res, '?deferred=related_strategies')
+        mock_list.assert_not_called()
+
+    @mock.patch.object(api.watcher.Strategy, 'list')
+    @mock.patch.object(api.watcher.Goal, 'get')
+    def test_details_deferred_strategies(self, mock_get, mock_list):
+        goal = self.goals.first()
+        strategy = self.strategies.first()
+        mock_list.return_value = [strategy]
+        url = urls.reverse(DETAILS_VIEW, args=[goal.uuid])
+
+        res = self.client.get(url, {'deferred': 'related_strategies'})
+
+        self.assertContains(res, strategy.uuid)
+        self.assertNotContains(res, '<html')
+        self.assertIn('private', res['Cache-Control'])
+        mock_get.assert_not_called()
+        mock_list.assert_called_once_with(mock.ANY, goal=goal.uuid)
+
+        res = self.client.get(
+            url,
+            {'deferred': 'related_strategies'},
+            HTTP_IF_NONE_MATCH=res['ETag'],
+        )
+        self.assertEqual(res.status_code, 304)
+
+    @mock.patch.object(api.watcher.Goal, 'get')
+    def test_details_unknown_deferred_table(self, mock_get):
+        url = urls.reverse(DETAILS_VIEW, args=[self.goals.first().uuid])
+        res = self.client.get(url, {'deferred': 'efficacy_specification'})
+        self.assertEqual(res.status_code, 404)
 
     @mock.patch.object(api.watcher.Goal, 'get')
     def test_details_exception(self, mock_get):
@@ -24,6 +24,8 @@ from django.utils.translation import gettext_lazy as _
 from horizon.utils import memoized
 
 from watcher_dashboard.api import watcher
+from watcher_dashboard.common import deferred as common_deferred
+from watcher_dashboard.common import http as common_http
 from watcher_dashboard.content.goals import tables
 from watcher_dashboard.content.goals import tabs as wtabs
 from watcher_dashboard.content.strategies import tables as strategies_tables
@@ -32,21 +34,25 @@ from watcher_dashboard.content.strategies import tables as strategies_tables
 LOG = logging.getLogger(__name__)
 
 
-class IndexView(horizon.tables.DataTableView):
+class IndexView(horizon.tables.PagedTableMixin, horizon.tables.DataTableView):
     table_class = tables.GoalsTable
     template_name = 'infra_optim/goals/index.html'
     page_title = _("Goals")
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['goals_count'] = self.get_goals_count()
-        return context
-
     def get_data(self):
         goals = []
         search_opts = self.get_filters()
         try:
-            goals = watcher.Goal.list(self.request, **search_opts)
+            marker, sort_dir = self._get_marker()
+            goals, self._has_more_data, self._has_prev_data = (
+                watcher.Goal.list_paged(
+                    self.request,
+                    marker=marker,
+                    paginate=True,
+                    sort_dir=sort_dir,
+                    **search_opts,
+                )
+            )
         except Exception as exc:
             LOG.exception(exc)
             horizon.exceptions.handle(
@@ -54,9 +60,6 @@ class IndexView(horizon.tables.DataTableView):
             )
         return goals
 
-    def get_goals_count(self):
-        return len(self.get_data())
-
     def get_filters(self):
         filters = {}
         filter_action = self.table._meta._filter_action
@@ -69,11 +72,14 @@ class IndexView(horizon.tables.DataTableView):
         return filters
 
 
-class DetailView(horizon.tables.MultiTableView):
+class DetailView(
+    common_deferred.DeferredTablesMixin, horizon.tables.MultiTableView
+):
     table_classes = (
         tables.EfficacySpecificationTable,
         strategies_tables.RelatedStrategiesTable,
     )
+    deferred_tables = {'related_strategies': common_http.JSON_MAX_AGE}
 
     tab_group_class = wtabs.GoalDetailTabs
     template_name = 'infra_optim/goals/details.html'
@@ -96,8 +102,9 @@ class DetailView(horizon.tables.MultiTableView):
 
     def get_related_strategies_data(self):
         try:
-            goal = self._get_data()
-            strategies = watcher.Strategy.list(self.request, goal=goal.uuid)
+            strategies = watcher.Strategy.list(
+                self.request, goal=self.kwargs['goal_uuid']
+            )
         except Exception as exc:
             LOG.exception(exc)
             strategies = []
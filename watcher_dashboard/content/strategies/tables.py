@@ -19,11 +19,11 @@ import horizon.tables
 
 from django.utils.translation import gettext_lazy as _
 
+from watcher_dashboard.common import tables as common_tables
 
-class StrategiesFilterAction(horizon.tables.FilterAction):
-    # server = choices query = text
-    filter_type = "server"
-    filter_choices = (('goal', _("Goal ="), True),)
+
+class StrategiesFilterAction(common_tables.QueryFilterAction):
+    filter_choices = (('goal', _("Goal ="), True), common_tables.QUERY_CHOICE)
     policy_rules = (("infra-optim", "strategy:detail"),)
 
 
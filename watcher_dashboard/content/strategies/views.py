@@ -26,6 +26,7 @@ from django.utils.translation import gettext_lazy as _
 from horizon.utils import memoized
 
 from watcher_dashboard.api import watcher
+from watcher_dashboard.common import tables as common_tables
 from watcher_dashboard.content.strategies import tables
 from watcher_dashboard.content.strategies import tabs as wtabs
 
@@ -33,21 +34,26 @@ from watcher_dashboard.content.strategies import tabs as wtabs
 LOG = logging.getLogger(__name__)
 
 
-class IndexView(horizon.tables.DataTableView):
+class IndexView(horizon.tables.PagedTableMixin, horizon.tables.DataTableView):
     table_class = tables.StrategiesTable
     template_name = 'infra_optim/strategies/index.html'
     page_title = _("Strategies")
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['strategies_count'] = self.get_strategies_count()
-        return context
-
     def get_data(self):
         strategies = []
         search_opts = self.get_filters()
         try:
-            strategies = watcher.Strategy.list(self.request, **search_opts)
+            marker, sort_dir = self._get_marker()
+            strategies, self._has_more_data, self._has_prev_data = (
+                watcher.Strategy.list_paged(
+                    self.request,
+                    marker=marker,
+                    paginate=True,
+                    sort_dir=sort_dir,
+                    select=common_tables.get_query_select(self.table),
+                    **search_opts,
+                )
+            )
         except Exception as exc:
             LOG.exception(exc)
             horizon.exceptions.handle(
@@ -55,19 +61,8 @@ class IndexView(horizon.tables.DataTableView):
             )
         return strategies
 
-    def get_strategies_count(self):
-        return len(self.get_data())
-
     def get_filters(self):
-        filters = {}
-        filter_action = self.table._meta._filter_action
-        if filter_action:
-            filter_field = self.table.get_filter_field()
-            if filter_action.is_api_filter(filter_field):
-                filter_string = self.table.get_filter_string()
-                if filter_field and filter_string:
-                    filters[filter_field] = filter_string
-        return filters
+        return common_tables.get_api_filters(self.table)
 
 
 class DetailView(horizon.tabs.TabbedTableView):
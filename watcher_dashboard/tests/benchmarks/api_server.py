@@ -0,0 +1,450 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""A stand-in of the Watcher v1 API, to load-test the dashboard.
+
+The server answers the calls the dashboard makes (version discovery, and
+the audits, audit templates, action plans, actions, goals and strategies
+endpoints) from a :class:`~.fakes.FakeWatcherClient` dataset, with an
+artificial latency and error rate per endpoint. Microversions are
+negotiated through the ``OpenStack-API-Version`` headers as Watcher does.
+
+Run it with::
+
+    python -m watcher_dashboard.tests.benchmarks.api_server --size 10000 \\
+        --latency 0.02 --latency action_plans=0.2 --error-rate actions=0.05
+
+then register ``http://<host>:9322`` as the ``infra-optim`` endpoint of
+the Keystone catalog used by the dashboard.
+"""
+
+import argparse
+import json
+import random
+import re
+import socketserver
+import sys
+import threading
+import time
+
+from urllib import parse
+from wsgiref import simple_server
+
+from watcherclient.common.apiclient import exceptions as wc_exc
+
+from watcher_dashboard.tests.benchmarks import fakes
+
+
+DEFAULT_PORT = 9322
+MIN_VERSION = '1.0'
+
+# Managers of the fake client serving each collection
+COLLECTIONS = {
+    'audits': 'audit',
+    'audit_templates': 'audit_template',
+    'action_plans': 'action_plan',
+    'actions': 'action',
+    'goals': 'goal',
+    'strategies': 'strategy',
+}
+
+# Fields of the collections returned without ``/detail``
+_SUMMARY_FIELDS = {
+    'audits': (
+        'uuid',
+        'name',
+        'audit_type',
+        'state',
+        'goal_name',
+        'strategy_name',
+    ),
+    'audit_templates': ('uuid', 'name', 'goal_name', 'strategy_name'),
+    'action_plans': (
+        'uuid',
+        'audit_uuid',
+        'state',
+        'global_efficacy',
+        'updated_at',
+    ),
+    'actions': ('uuid', 'action_plan_uuid', 'action_type', 'state'),
+    'goals': ('uuid', 'name', 'display_name'),
+    'strategies': ('uuid', 'name', 'display_name', 'goal_name'),
+}
+
+# Fields added by a microversion
+_FIELD_VERSIONS = {
+    'audits': {'start_time': (1, 1), 'end_time': (1, 1)},
+    'actions': {'status_message': (1, 5)},
+    'action_plans': {'status_message': (1, 5)},
+}
+
+# Collections the API creates resources of, and their initial attributes
+_CREATED = {'audits': {'state': 'PENDING'}, 'audit_templates': {}}
+
+# Query parameters of the list calls and the matching filter of the fake
+# managers
+_QUERY_FILTERS = {
+    'audit_uuid': 'audit',
+    'action_plan_uuid': 'action_plan',
+    'goal': 'goal',
+    'strategy': 'strategy',
+    'audit_template': 'audit_template',
+    'name': 'name',
+}
+
+_STATUS = {
+    200: '200 OK',
+    201: '201 Created',
+    204: '204 No Content',
+    400: '400 Bad Request',
+    404: '404 Not Found',
+    405: '405 Method Not Allowed',
+    406: '406 Not Acceptable',
+    500: '500 Internal Server Error',
+    503: '503 Service Unavailable',
+}
+
+_PATH = re.compile(
+    r'^/v1/(?P<collection>\w+)(?:/(?P<item>[^/]+))?(?:/(?P<action>\w+))?/?$'
+)
+
+
+class APIError(Exception):
+    def __init__(self, status, message, headers=()):
+        super().__init__(message)
+        self.status = status
+        self.headers = list(headers)
+
+
+def _parse_version(value):
+    major, minor = value.split('.')
+    return int(major), int(minor)
+
+
+def _format_version(version):
+    return '%d.%d' % version
+
+
+class WatcherAPI:
+    """WSGI application answering like the Watcher v1 API.
+
+    :param client: The :class:`~.fakes.FakeWatcherClient` holding the data.
+    :param max_version: Highest supported microversion.
+    :param latency: ``{collection: seconds}`` delays before answering;
+        the ``None`` key applies to the other endpoints.
+    :param error_rate: ``{collection: ratio}`` of the calls answered with
+        ``error_status``; the ``None`` key applies to the other endpoints.
+    :param error_status: HTTP status of the injected errors.
+    :param seed: Seed of the error injection.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_version=fakes.MAX_VERSION,
+        latency=None,
+        error_rate=None,
+        error_status=500,
+        seed=None,
+    ):
+        self.client = client
+        self.min_version = _parse_version(MIN_VERSION)
+        self.max_version = _parse_version(max_version)
+        self.latency = latency or {}
+        self.error_rate = error_rate or {}
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        headers = [('Content-Type', 'application/json')]
+        try:
+            path = environ.get('PATH_INFO', '/')
+            match = _PATH.match(path)
+            endpoint = match.group('collection') if match else None
+            self._inject(endpoint)
+            if not match:
+                version = None
+                if path.rstrip('/') not in ('', '/v1'):
+                    raise APIError(404, f'Unknown path {path}')
+                status, body = 200, self._versions(environ, path)
+            else:
+                version = self._negotiate(environ)
+                headers.extend(self._version_headers(version))
+                status, body = self._dispatch(environ, match, version)
+        except APIError as exc:
+            status = exc.status
+            headers.extend(exc.headers)
+            body = {
+                'error_message': json.dumps(
+                    {'faultstring': str(exc), 'debuginfo': None}
+                )
+            }
+        start_response(_STATUS.get(status, str(status)), headers)
+        if body is None:
+            return [b'']
+        return [json.dumps(body).encode('utf-8')]
+
+    def _inject(self, endpoint):
+        delay = self.latency.get(endpoint, self.latency.get(None, 0))
+        if delay:
+            time.sleep(delay)
+        rate = self.error_rate.get(endpoint, self.error_rate.get(None, 0))
+        with self._random_lock:
+            failed = rate and self._random.random() < rate
+        if failed:
+            raise APIError(self.error_status, 'Injected error')
+
+    def _version_headers(self, version):
+        return [
+            (
+                'OpenStack-API-Minimum-Version',
+                _format_version(self.min_version),
+            ),
+            (
+                'OpenStack-API-Maximum-Version',
+                _format_version(self.max_version),
+            ),
+            (
+                'OpenStack-API-Version',
+                f'infra-optim {_format_version(version)}',
+            ),
+            ('Vary', 'OpenStack-API-Version'),
+        ]
+
+    def _negotiate(self, environ):
+        header = environ.get('HTTP_OPENSTACK_API_VERSION', '')
+        requested = header.split()[-1] if header.strip() else MIN_VERSION
+        if requested == 'latest':
+            return self.max_version
+        try:
+            version = _parse_version(requested)
+        except ValueError:
+            raise APIError(400, f'Invalid microversion {requested}')
+        if not self.min_version <= version <= self.max_version:
+            raise APIError(
+                406,
+                f'Version {requested} is not supported by the API',
+                self._version_headers(self.min_version)[:2],
+            )
+        return version
+
+    def _versions(self, environ, path):
+        v1 = {
+            'id': 'v1',
+            'status': 'CURRENT',
+            'min_version': _format_version(self.min_version),
+            'max_version': _format_version(self.max_version),
+            'links': [{'href': self._url(environ, '/v1/'), 'rel': 'self'}],
+        }
+        if path.rstrip('/') == '/v1':
+            return v1
+        return {
+            'name': 'OpenStack Watcher API',
+            'versions': [v1],
+            'default_version': v1,
+        }
+
+    def _url(self, environ, path, query=None):
+        url = f"{environ['wsgi.url_scheme']}://{environ['HTTP_HOST']}{path}"
+        if query:
+            url += '?' + parse.urlencode(query)
+        return url
+
+    def _render(self, collection, resource, version, fields=None):
+        data = resource.to_dict()
+        if fields is not None:
+            data = {name: data.get(name) for name in fields}
+        for name, added_in in _FIELD_VERSIONS.get(collection, {}).items():
+            if version < added_in:
+                data.pop(name, None)
+        return data
+
+    def _dispatch(self, environ, match, version):
+        collection, item, action = match.group('collection', 'item', 'action')
+        if collection not in COLLECTIONS:
+            raise APIError(404, f'Unknown collection {collection}')
+        manager = getattr(self.client, COLLECTIONS[collection])
+        method = environ['REQUEST_METHOD']
+        try:
+            if item in (None, 'detail') and method == 'GET':
+                return 200, self._list(
+                    environ, collection, manager, version, item == 'detail'
+                )
+            if item is None and method == 'POST' and collection in _CREATED:
+                attrs = dict(_CREATED[collection], **_read_body(environ))
+                return 201, self._render(
+                    collection, manager.create(**attrs), version
+                )
+            if action == 'start' and method == 'POST':
+                return 200, self._render(
+                    collection, manager.start(item), version
+                )
+            if action is None and method == 'GET':
+                return 200, self._render(
+                    collection, manager.find(item), version
+                )
+            if action is None and method == 'PATCH':
+                return 200, self._render(
+                    collection,
+                    manager.update(item, _read_body(environ)),
+                    version,
+                )
+            if action is None and method == 'DELETE':
+                manager.delete(item)
+                return 204, None
+        except wc_exc.NotFound:
+            raise APIError(404, f'{collection} {item} could not be found')
+        except wc_exc.BadRequest as exc:
+            raise APIError(400, str(exc))
+        raise APIError(
+            405, f'{method} is not allowed on {environ["PATH_INFO"]}'
+        )
+
+    def _list(self, environ, collection, manager, version, detail):
+        query = dict(parse.parse_qsl(environ.get('QUERY_STRING', '')))
+        try:
+            limit = int(query.get('limit', fakes.API_MAX_LIMIT))
+        except ValueError:
+            raise APIError(400, 'Invalid limit')
+        limit = min(limit, fakes.API_MAX_LIMIT) or fakes.API_MAX_LIMIT
+        filters = {
+            _QUERY_FILTERS[name]: value
+            for name, value in query.items()
+            if name in _QUERY_FILTERS
+        }
+        items = manager.select(
+            marker=query.get('marker'),
+            sort_key=query.get('sort_key'),
+            sort_dir=query.get('sort_dir'),
+            **filters,
+        )[:limit]
+        fields = None if detail else _SUMMARY_FIELDS[collection]
+        body = {
+            collection: [
+                self._render(collection, resource, version, fields)
+                for resource in items
+            ]
+        }
+        if len(items) == limit:
+            # Like Watcher, link the next page whenever this one is full.
+            body['next'] = self._url(
+                environ,
+                environ['PATH_INFO'],
+                dict(query, limit=limit, marker=items[-1].uuid),
+            )
+        return body
+
+
+def _read_body(environ):
+    try:
+        length = int(environ.get('CONTENT_LENGTH') or 0)
+        return json.loads(environ['wsgi.input'].read(length) or b'{}')
+    except ValueError:
+        raise APIError(400, 'Invalid JSON body')
+
+
+class ThreadingWSGIServer(
+    socketserver.ThreadingMixIn, simple_server.WSGIServer
+):
+    daemon_threads = True
+
+
+class QuietHandler(simple_server.WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(app, host='127.0.0.1', port=DEFAULT_PORT, quiet=False):
+    """Return a threaded WSGI server running ``app``."""
+    handler = QuietHandler if quiet else simple_server.WSGIRequestHandler
+    return simple_server.make_server(
+        host,
+        port,
+        app,
+        server_class=ThreadingWSGIServer,
+        handler_class=handler,
+    )
+
+
+def _per_endpoint(values, type_):
+    """Parse ``value`` and ``collection=value`` options."""
+    result = {}
+    for value in values or ():
+        endpoint, _sep, number = value.rpartition('=')
+        if endpoint and endpoint not in COLLECTIONS:
+            raise argparse.ArgumentTypeError(f'Unknown endpoint {endpoint}')
+        result[endpoint or None] = type_(number)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        '--size',
+        type=int,
+        default=1000,
+        help='Number of resources of each collection.',
+    )
+    parser.add_argument(
+        '--max-version',
+        default=fakes.MAX_VERSION,
+        help='Highest microversion supported.',
+    )
+    parser.add_argument(
+        '--latency',
+        action='append',
+        metavar='[ENDPOINT=]SECONDS',
+        help='Delay of every call, or of the calls to one endpoint.',
+    )
+    parser.add_argument(
+        '--error-rate',
+        action='append',
+        metavar='[ENDPOINT=]RATIO',
+        help='Ratio of failed calls, overall or for one endpoint.',
+    )
+    parser.add_argument('--error-status', type=int, default=500)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument(
+        '--quiet', action='store_true', help='Do not log every request.'
+    )
+    args = parser.parse_args(argv)
+    try:
+        latency = _per_endpoint(args.latency, float)
+        error_rate = _per_endpoint(args.error_rate, float)
+    except (argparse.ArgumentTypeError, ValueError) as exc:
+        parser.error(str(exc))
+
+    app = WatcherAPI(
+        fakes.FakeWatcherClient(args.size),
+        max_version=args.max_version,
+        latency=latency,
+        error_rate=error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    server = make_server(app, args.host, args.port, quiet=args.quiet)
+    sys.stderr.write(
+        f'Serving the Watcher API on http://{args.host}:{args.port}\n'
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
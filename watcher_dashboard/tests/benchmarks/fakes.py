@@ -0,0 +1,340 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""A watcherclient stand-in serving synthetic datasets of any size.
+
+Every collection holds ``size`` resources, created on first use. To make
+the detail pages scale with the dataset too, all the strategies belong to
+the first goal, all the action plans to the first audit and all the
+actions to the first action plan.
+"""
+
+import copy
+import datetime
+import itertools
+import math
+import threading
+import uuid
+
+from watcherclient.common.apiclient import exceptions as wc_exc
+
+
+# Maximum number of resources returned by one Watcher API call, the
+# ``max_limit`` option of the Watcher API
+API_MAX_LIMIT = 1000
+
+MAX_VERSION = '1.5'
+
+_EPOCH = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+# Filters of the list calls and the attributes they match
+_FILTERS = {
+    'audit': ('audit_uuid',),
+    'action_plan': ('action_plan_uuid',),
+    'goal': ('goal_uuid', 'goal_name'),
+    'strategy': ('strategy_uuid', 'strategy_name'),
+    'audit_template': ('audit_template_uuid', 'audit_template_name'),
+}
+
+
+class Resource:
+    """A watcherclient resource: attributes and a ``to_dict`` method."""
+
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+
+def make_uuid(prefix, index):
+    return f'{prefix}-0000-4000-8000-{index:012d}'
+
+
+def _created_at(index):
+    return (_EPOCH + datetime.timedelta(seconds=index)).isoformat()
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
+def _common(prefix, index):
+    created_at = _created_at(index)
+    return {
+        'uuid': make_uuid(prefix, index),
+        'created_at': created_at,
+        'updated_at': created_at,
+        'deleted_at': None,
+    }
+
+
+def make_goal(index):
+    return Resource(
+        name=f'goal_{index}',
+        display_name=f'Goal {index}',
+        efficacy_specification=[
+            {
+                'name': 'released_nodes_ratio',
+                'description': 'Ratio of released compute nodes',
+                'unit': '%',
+                'schema': 'Range(min=0, max=100)',
+            }
+        ],
+        **_common('00000001', index),
+    )
+
+
+def make_strategy(index):
+    return Resource(
+        name=f'strategy_{index}',
+        display_name=f'Strategy {index}',
+        goal_uuid=make_uuid('00000001', 0),
+        goal_name='goal_0',
+        parameters_spec={
+            'properties': {'threshold': {'type': 'number', 'default': 25.0}}
+        },
+        **_common('00000002', index),
+    )
+
+
+def make_audit_template(index):
+    return Resource(
+        name=f'Audit Template {index}',
+        description=f'Audit Template {index} description',
+        goal_uuid=make_uuid('00000001', 0),
+        goal_name='goal_0',
+        strategy_uuid=make_uuid('00000002', 0),
+        strategy_name='strategy_0',
+        scope=[],
+        **_common('00000003', index),
+    )
+
+
+def make_audit(index):
+    return Resource(
+        name=f'Audit {index}',
+        audit_type='ONESHOT',
+        state='SUCCEEDED',
+        audit_template_uuid=make_uuid('00000003', 0),
+        audit_template_name='Audit Template 0',
+        goal_name='goal_0',
+        strategy_name='strategy_0',
+        parameters={'threshold': 25.0},
+        interval=None,
+        auto_trigger=False,
+        start_time=None,
+        end_time=None,
+        **_common('00000004', index),
+    )
+
+
+def make_action_plan(index):
+    return Resource(
+        audit_uuid=make_uuid('00000004', 0),
+        strategy_name='strategy_0',
+        state='RECOMMENDED',
+        global_efficacy=[
+            {
+                'name': 'released_nodes_ratio',
+                'description': 'Ratio of released compute nodes',
+                'unit': '%',
+                'value': 25.0,
+            }
+        ],
+        efficacy_indicators=[],
+        **_common('00000005', index),
+    )
+
+
+def make_action(index):
+    return Resource(
+        action_plan_uuid=make_uuid('00000005', 0),
+        action_type='migrate',
+        state='PENDING',
+        input_parameters={
+            'migration_type': 'live',
+            'resource_id': make_uuid('00000007', index),
+        },
+        parents=[],
+        status_message=None,
+        **_common('00000006', index),
+    )
+
+
+class FakeManager:
+    """Answer the calls of one watcherclient manager.
+
+    Writes replace the whole collection, so that concurrent reads keep
+    working on a consistent copy.
+    """
+
+    def __init__(self, client, factory):
+        self._client = client
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._data = None
+
+    def _get_data(self):
+        with self._lock:
+            if self._data is None:
+                self._data = self._index(
+                    [
+                        self._factory(index)
+                        for index in range(self._client.size)
+                    ]
+                )
+            return self._data
+
+    @staticmethod
+    def _index(items):
+        return items, {
+            item.uuid: position for position, item in enumerate(items)
+        }
+
+    def select(self, marker=None, sort_key=None, sort_dir=None, **filters):
+        """Return every resource after ``marker`` matching ``filters``.
+
+        Unlike :meth:`list`, the call is not recorded.
+
+        :raises: watcherclient ``BadRequest`` for an unknown ``marker``.
+        """
+        items, _positions = self._get_data()
+        for name, value in filters.items():
+            attrs = _FILTERS.get(name, (name,))
+            items = [
+                item
+                for item in items
+                if any(getattr(item, attr, None) == value for attr in attrs)
+            ]
+        # Resources are created in ``created_at`` order.
+        if sort_key not in (None, 'created_at'):
+            items = sorted(
+                items, key=lambda item: str(getattr(item, sort_key, ''))
+            )
+        if sort_dir == 'desc':
+            items = items[::-1]
+        if marker is not None:
+            uuids = [item.uuid for item in items]
+            if marker not in uuids:
+                raise wc_exc.BadRequest(f'Invalid marker {marker}')
+            items = items[uuids.index(marker) + 1 :]
+        return items
+
+    def list(self, detail=False, limit=None, **kwargs):
+        try:
+            items = self.select(**kwargs)
+        except wc_exc.BadRequest:
+            self._client.record_calls(1)
+            raise
+        if limit == 0:
+            # watcherclient follows the ``next`` links page after page.
+            self._client.record_calls(
+                max(1, math.ceil(len(items) / API_MAX_LIMIT))
+            )
+            return list(items)
+        self._client.record_calls(1)
+        return list(items[: min(limit or API_MAX_LIMIT, API_MAX_LIMIT)])
+
+    def find(self, resource_id):
+        """Return the resource of a UUID or name, without recording it.
+
+        :raises: watcherclient ``NotFound``
+        """
+        items, positions = self._get_data()
+        position = positions.get(resource_id)
+        if position is not None:
+            return items[position]
+        for item in items:
+            if getattr(item, 'name', None) == resource_id:
+                return item
+        raise wc_exc.NotFound(resource_id)
+
+    def get(self, *args, **kwargs):
+        (resource_id,) = itertools.chain(args, kwargs.values())
+        self._client.record_calls(1)
+        return self.find(resource_id)
+
+    def create(self, **attrs):
+        self._client.record_calls(1)
+        items, _positions = self._get_data()
+        resource = self._factory(len(items))
+        resource.__dict__.update(attrs, uuid=str(uuid.uuid4()))
+        resource.created_at = resource.updated_at = _now()
+        with self._lock:
+            items, _positions = self._data
+            self._data = self._index(items + [resource])
+        return resource
+
+    def update(self, *args, patch=None, **kwargs):
+        resource_id = args[0] if args else next(iter(kwargs.values()))
+        patch = args[1] if len(args) > 1 else patch
+        self._client.record_calls(1)
+        resource = copy.copy(self.find(resource_id))
+        for operation in patch:
+            name = operation['path'].strip('/')
+            if operation['op'] == 'remove':
+                setattr(resource, name, None)
+            else:
+                setattr(resource, name, operation['value'])
+        resource.updated_at = _now()
+        self._replace(resource.uuid, resource)
+        return resource
+
+    def start(self, action_plan_id):
+        return self.update(
+            action_plan_id,
+            [{'op': 'replace', 'path': '/state', 'value': 'ONGOING'}],
+        )
+
+    def delete(self, *args, **kwargs):
+        (resource_id,) = itertools.chain(args, kwargs.values())
+        self._client.record_calls(1)
+        self._replace(self.find(resource_id).uuid, None)
+
+    def _replace(self, resource_uuid, resource):
+        with self._lock:
+            items, positions = self._data
+            items = list(items)
+            if resource is None:
+                del items[positions[resource_uuid]]
+            else:
+                items[positions[resource_uuid]] = resource
+            self._data = self._index(items)
+
+
+class FakeWatcherClient:
+    """A watcherclient ``Client`` serving ``size`` resources of each kind.
+
+    :param size: Number of goals, strategies, audit templates, audits,
+        action plans and actions.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.goal = FakeManager(self, make_goal)
+        self.strategy = FakeManager(self, make_strategy)
+        self.audit_template = FakeManager(self, make_audit_template)
+        self.audit = FakeManager(self, make_audit)
+        self.action_plan = FakeManager(self, make_action_plan)
+        self.action = FakeManager(self, make_action)
+
+    def record_calls(self, count):
+        # Views call the API from several threads, see concurrency.fan_out.
+        with self._lock:
+            self.calls += count
+
+    def discover_max_version(self, request):
+        self.record_calls(1)
+        return MAX_VERSION
@@ -0,0 +1,222 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure how the panels render as the Watcher collections grow.
+
+Each panel's index page and the detail page of its first object are
+rendered with :class:`~.fakes.FakeWatcherClient` datasets of increasing
+size, with cold caches. For every page, the wall time, the number of
+Watcher API calls and the peak memory allocated while rendering it are
+reported and saved as JSON.
+
+The benchmarks are not part of the unit tests; run them with::
+
+    tox -e benchmark
+
+The following environment variables tune a run:
+
+``WATCHER_BENCHMARK_SIZES``
+    Comma-separated dataset sizes, ``10,1000,10000,100000`` by default.
+``WATCHER_BENCHMARK_OUTPUT``
+    File the results are written to, ``benchmark-results.json`` by default.
+``WATCHER_BENCHMARK_BASELINE``
+    Results of a previous run, to report the change of every measure.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from unittest import mock
+
+from django import urls
+
+from watcher_dashboard import api
+from watcher_dashboard.common import client as common_client
+from watcher_dashboard.content.action_plans import tables as ap_tables
+from watcher_dashboard.tests import helpers as test
+from watcher_dashboard.tests.benchmarks import fakes
+
+
+DEFAULT_SIZES = (10, 1000, 10000, 100000)
+DEFAULT_OUTPUT = 'benchmark-results.json'
+
+# The URL names of each panel's pages, and the prefix of the UUID of the
+# object whose detail page is rendered
+PANELS = {
+    'goals': ('goals', '00000001'),
+    'strategies': ('strategies', '00000002'),
+    'audit_templates': ('audit_templates', '00000003'),
+    'audits': ('audits', '00000004'),
+    'action_plans': ('action_plans', '00000005'),
+    'actions': ('actions', '00000006'),
+}
+
+
+def get_sizes():
+    sizes = os.environ.get('WATCHER_BENCHMARK_SIZES')
+    if not sizes:
+        return DEFAULT_SIZES
+    return tuple(int(size) for size in sizes.split(','))
+
+
+def _load_baseline():
+    path = os.environ.get('WATCHER_BENCHMARK_BASELINE')
+    if not path:
+        return {}
+    with open(path) as baseline_file:
+        results = json.load(baseline_file)['results']
+    return {
+        (result['panel'], result['page'], result['size']): result
+        for result in results
+    }
+
+
+def _format_change(value, baseline):
+    if not baseline:
+        return ''
+    return f' ({(value - baseline) / baseline:+.0%})'
+
+
+class PanelBenchmark(test.BaseAdminViewTests):
+    results = []
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        if cls.results:
+            cls._report()
+
+    @classmethod
+    def _report(cls):
+        output = os.environ.get('WATCHER_BENCHMARK_OUTPUT', DEFAULT_OUTPUT)
+        with open(output, 'w') as output_file:
+            json.dump(
+                {
+                    'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                    'python': platform.python_version(),
+                    'results': cls.results,
+                },
+                output_file,
+                indent=2,
+            )
+
+        baseline = _load_baseline()
+        lines = [
+            '',
+            f'{"panel":<16}{"page":<8}{"size":>8}{"time (s)":>20}'
+            f'{"calls":>14}{"peak (MiB)":>20}',
+        ]
+        for result in cls.results:
+            key = (result['panel'], result['page'], result['size'])
+            previous = baseline.get(key, {})
+            measures = ''.join(
+                f'{result[name] / scale:>{width}.{digits}f}'
+                f'{_format_change(result[name], previous.get(name)):>{pad}}'
+                for name, scale, width, digits, pad in (
+                    ('wall_time', 1, 10, 3, 10),
+                    ('watcher_calls', 1, 6, 0, 8),
+                    ('peak_memory', 2**20, 10, 1, 10),
+                )
+            )
+            lines.append(
+                f'{result["panel"]:<16}{result["page"]:<8}'
+                f'{result["size"]:>8}{measures}'
+            )
+        lines.append(f'Results saved to {output}')
+        sys.stderr.write('\n'.join(lines) + '\n')
+
+    def setUp(self):
+        super().setUp()
+        self.fake_client = None
+        test.patch_watcher_url(self)
+        watcherclient = mock.patch.object(
+            api.watcher,
+            'watcherclient',
+            lambda request, api_version=None: self.fake_client,
+        )
+        watcherclient.start()
+        self.addCleanup(watcherclient.stop)
+        discover = mock.patch.object(
+            common_client,
+            '_discover_max_version',
+            lambda request: self.fake_client.discover_max_version(request),
+        )
+        discover.start()
+        self.addCleanup(discover.stop)
+
+    def clear_caches(self):
+        super().clear_caches()
+        ap_tables._efficacy_cache.clear()
+
+    def _measure(self, url):
+        self.clear_caches()
+        self.fake_client.calls = 0
+        start = time.perf_counter()
+        response = self.client.get(url)
+        wall_time = time.perf_counter() - start
+        self.assertEqual(response.status_code, 200, url)
+        calls = self.fake_client.calls
+
+        # Tracing slows allocations down, so memory is measured apart.
+        self.clear_caches()
+        tracemalloc.start()
+        try:
+            self.client.get(url)
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return {
+            'wall_time': wall_time,
+            'watcher_calls': calls,
+            'peak_memory': peak,
+        }
+
+    def _benchmark(self, panel):
+        url_name, prefix = PANELS[panel]
+        pages = (
+            ('index', urls.reverse(f'horizon:admin:{url_name}:index')),
+            (
+                'detail',
+                urls.reverse(
+                    f'horizon:admin:{url_name}:detail',
+                    args=[fakes.make_uuid(prefix, 0)],
+                ),
+            ),
+        )
+        for size in get_sizes():
+            self.fake_client = fakes.FakeWatcherClient(size)
+            for page, url in pages:
+                self.results.append(
+                    dict(self._measure(url), panel=panel, page=page, size=size)
+                )
+
+    def test_goals(self):
+        self._benchmark('goals')
+
+    def test_strategies(self):
+        self._benchmark('strategies')
+
+    def test_audit_templates(self):
+        self._benchmark('audit_templates')
+
+    def test_audits(self):
+        self._benchmark('audits')
+
+    def test_action_plans(self):
+        self._benchmark('action_plans')
+
+    def test_actions(self):
+        self._benchmark('actions')
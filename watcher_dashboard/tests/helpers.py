@@ -18,17 +18,44 @@
 
 from unittest import mock
 
+from django.core import cache as django_cache
+from openstack_dashboard.api import base
 from openstack_dashboard.test import helpers
 
 from watcher_dashboard import api
+from watcher_dashboard import config
+from watcher_dashboard.common import client as common_client
 from watcher_dashboard.tests.local_fixtures import logging_fixture
 from watcher_dashboard.tests.test_data import utils
 
 
+WATCHER_URL = 'http://public.watcher.example.com:9322'
+
+
+def patch_watcher_url(testcase, url=WATCHER_URL):
+    """Make ``url`` the Watcher endpoint until the end of ``testcase``.
+
+    The catalog, client pool and max microversion caches are partitioned
+    by endpoint.
+
+    :returns: The mock of ``url_for``.
+    """
+    patcher = mock.patch.object(base, 'url_for', return_value=url)
+    testcase.addCleanup(patcher.stop)
+    return patcher.start()
+
+
 class WatcherTestsMixin:
     def setUp(self):
         logging_fixture.setup_standard_logging(self)
         super().setUp()
+        self.clear_caches()
+
+    def clear_caches(self):
+        common_client._max_version_cache.clear()
+        common_client._client_pool.clear()
+        common_client._sessions.clear()
+        django_cache.caches[config.get_catalog_cache_alias()].clear()
 
     def _setup_test_data(self):
         super()._setup_test_data()
@@ -48,6 +75,7 @@ class APITestCase(WatcherTestsMixin, helpers.APITestCase):
         api.watcher.watcherclient = lambda request, *args, **kwargs: (
             self.stub_watcherclient()
         )
+        patch_watcher_url(self)
 
     def tearDown(self):
         super().tearDown()
@@ -0,0 +1,49 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+
+from unittest import mock
+
+from asgiref import sync
+
+from watcher_dashboard import api
+from watcher_dashboard.api import aio
+from watcher_dashboard.tests import helpers as test
+
+
+class AsyncAPITests(test.APITestCase):
+    def test_calls_blocking_wrapper(self):
+        goals = self.api_goals.list()
+        strategies = self.api_strategies.list()
+        watcherclient = self.stub_watcherclient()
+        watcherclient.goal.list = mock.Mock(return_value=goals)
+        watcherclient.strategy.list = mock.Mock(return_value=strategies)
+
+        async def view():
+            return await asyncio.gather(
+                aio.Goal.list(self.request),
+                aio.Strategy.list(self.request, goal='dummy'),
+            )
+
+        ret_goals, ret_strategies = sync.async_to_sync(view)()
+
+        self.assertEqual(len(ret_goals), len(goals))
+        self.assertIsInstance(ret_goals[0], api.watcher.Goal)
+        watcherclient.strategy.list.assert_called_once_with(
+            detail=True, limit=0
+        )
+
+    def test_private_methods_hidden(self):
+        self.assertRaises(
+            AttributeError, getattr, aio.ActionPlan, '_index_by_audit'
+        )
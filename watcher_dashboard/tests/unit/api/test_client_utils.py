@@ -10,8 +10,23 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import datetime
+
+from unittest import mock
+
+from django.contrib.auth import signals as auth_signals
+from django.test import override_settings
+from django.utils import timezone
+from watcherclient import exceptions as wc_exc
+
+from watcher_dashboard import api
+from watcher_dashboard.common import cache
 from watcher_dashboard.common import client as common_client
 from watcher_dashboard.tests import helpers as test
+from watcher_dashboard.tests.local_fixtures.fixtures import ConfigMemoizedCache
+
+
+ENDPOINT = 'http://watcher.example.com:9322'
 
 
 class MicroversionSupportTests(test.TestCase):
@@ -69,3 +84,130 @@ class MicroversionSupportTests(test.TestCase):
                 None, common_client.MV_SKIP_ACTION
             )
         )
+
+
+@override_settings(WATCHER_MAX_VERSION_CACHE_TTL=300)
+class MaxVersionCacheTests(ConfigMemoizedCache, test.TestCase):
+    def setUp(self):
+        super().setUp()
+        test.patch_watcher_url(self, ENDPOINT)
+        get_client = mock.patch.object(common_client, 'get_client')
+        self.mock_get_client = get_client.start()
+        self.addCleanup(get_client.stop)
+        self.json_request = (
+            self.mock_get_client.return_value.http_client.json_request
+        )
+        self.json_request.return_value = (
+            None,
+            {'versions': [{'max_version': '1.5'}]},
+        )
+
+    def test_get_max_version_is_cached(self):
+        self.assertEqual(common_client.get_max_version(self.request), '1.5')
+        self.assertEqual(common_client.get_max_version(self.request), '1.5')
+        self.json_request.assert_called_once_with('GET', '/')
+        stats = common_client.get_max_version_cache_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+
+    def test_get_max_version_refresh(self):
+        common_client.get_max_version(self.request)
+        self.json_request.return_value = (
+            None,
+            {'version': {'max_version': '1.6'}},
+        )
+        self.assertEqual(
+            common_client.get_max_version(self.request, refresh=True), '1.6'
+        )
+        self.assertEqual(common_client.get_max_version(self.request), '1.6')
+        self.assertEqual(self.json_request.call_count, 2)
+
+    def test_get_max_version_expires(self):
+        with mock.patch.object(cache.time, 'monotonic', return_value=0):
+            common_client.get_max_version(self.request)
+        with mock.patch.object(cache.time, 'monotonic', return_value=301):
+            common_client.get_max_version(self.request)
+        self.assertEqual(self.json_request.call_count, 2)
+
+    def test_get_max_version_failure_not_cached(self):
+        self.json_request.side_effect = self.exceptions.watcher
+        self.assertIsNone(common_client.get_max_version(self.request))
+        self.json_request.side_effect = None
+        self.assertEqual(common_client.get_max_version(self.request), '1.5')
+
+    @override_settings(WATCHER_MAX_VERSION_CACHE_TTL=0)
+    def test_get_max_version_cache_disabled(self):
+        common_client.get_max_version(self.request)
+        common_client.get_max_version(self.request)
+        self.assertEqual(self.json_request.call_count, 2)
+
+    def test_version_error_invalidates_cache(self):
+        common_client.get_max_version(self.request)
+        with mock.patch.object(
+            api.watcher, 'watcherclient', autospec=True
+        ) as wc:
+            wc.return_value.audit.list.side_effect = (
+                wc_exc.UnsupportedVersion()
+            )
+            self.assertRaises(
+                wc_exc.UnsupportedVersion,
+                api.watcher.Audit.list,
+                self.request,
+                api_version=common_client.MV_START_END,
+            )
+        common_client.get_max_version(self.request)
+        self.assertEqual(self.json_request.call_count, 2)
+
+
+class ClientPoolTests(ConfigMemoizedCache, test.TestCase):
+    def setUp(self):
+        super().setUp()
+        test.patch_watcher_url(self, ENDPOINT)
+
+    def test_get_client_is_pooled(self):
+        first = common_client.get_client(self.request)
+        second = common_client.get_client(self.request)
+        self.assertIs(first, second)
+
+    def test_get_client_per_microversion(self):
+        first = common_client.get_client(self.request)
+        second = common_client.get_client(
+            self.request, required=common_client.MV_START_END
+        )
+        self.assertIsNot(first, second)
+        self.assertEqual(
+            second.http_client.os_infra_optim_api_version,
+            common_client.MV_START_END,
+        )
+
+    def test_clients_share_endpoint_session(self):
+        first = common_client.get_client(self.request)
+        second = common_client.get_client(
+            self.request, required=common_client.MV_START_END
+        )
+        self.assertIs(first.http_client.session, second.http_client.session)
+        adapter = first.http_client.session.get_adapter(ENDPOINT)
+        self.assertEqual(adapter._pool_maxsize, 10)
+
+    def test_expired_token_not_pooled(self):
+        self.request.user.token.expires = timezone.now() - datetime.timedelta(
+            seconds=1
+        )
+        first = common_client.get_client(self.request)
+        second = common_client.get_client(self.request)
+        self.assertIsNot(first, second)
+
+    @override_settings(WATCHER_CLIENT_POOL_SIZE=1)
+    def test_pool_is_bounded(self):
+        first = common_client.get_client(self.request)
+        common_client.get_client(
+            self.request, required=common_client.MV_START_END
+        )
+        self.assertIsNot(first, common_client.get_client(self.request))
+
+    def test_logout_evicts_clients(self):
+        first = common_client.get_client(self.request)
+        auth_signals.user_logged_out.send(
+            sender=self.__class__, request=self.request, user=self.request.user
+        )
+        self.assertIsNot(first, common_client.get_client(self.request))
@@ -15,56 +15,158 @@
 
 from unittest import mock
 
+from watcherclient.common.apiclient import exceptions as wc_exc
+from watcherclient.v1 import audit as wc_audit
+
 from watcher_dashboard import api
 from watcher_dashboard.tests import helpers as test
 
 
 class WatcherAPITests(test.APITestCase):
     def test_goal_list(self):
-        goals = {'goals': self.api_goals.list()}
+        goals = self.api_goals.list()
         watcherclient = self.stub_watcherclient()
         watcherclient.goal.list = mock.Mock(return_value=goals)
 
         ret_val = api.watcher.Goal.list(self.request)
-        self.assertIsInstance(ret_val, dict)
-        self.assertIn('goals', ret_val)
-        for n in ret_val['goals']:
-            self.assertIsInstance(n, dict)
-        watcherclient.goal.list.assert_called_with(detail=True)
+        self.assertEqual([goal.to_dict() for goal in ret_val], goals)
+        for n in ret_val:
+            self.assertIsInstance(n, api.watcher.Goal)
+        watcherclient.goal.list.assert_called_with(detail=True, limit=0)
+
+    def test_goal_list_cached(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.goal.list = mock.Mock(return_value=self.api_goals.list())
+
+        api.watcher.Goal.list(self.request)
+        # A new request of another worker would hit the shared cache too.
+        ret_val = api.watcher.Goal.list(self.mock_rest_request())
+
+        self.assertEqual(len(ret_val), len(self.api_goals.list()))
+        watcherclient.goal.list.assert_called_once_with(detail=True, limit=0)
+
+    def test_goal_list_invalidated(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.goal.list = mock.Mock(return_value=self.api_goals.list())
+
+        api.watcher.Goal.list(self.request)
+        api.catalog.invalidate(self.request)
+        api.watcher.Goal.list(self.mock_rest_request())
+
+        self.assertEqual(watcherclient.goal.list.call_count, 2)
+
+    @mock.patch.object(
+        api.catalog.config, 'get_catalog_cache_ttl', return_value=0
+    )
+    def test_goal_list_not_cached(self, _get_catalog_cache_ttl):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.goal.list = mock.Mock(return_value=self.api_goals.list())
+
+        api.watcher.Goal.list(self.request)
+        api.watcher.Goal.list(self.mock_rest_request())
+
+        self.assertEqual(watcherclient.goal.list.call_count, 2)
+
+    @mock.patch.object(api.catalog.time, 'time')
+    def test_goal_list_refreshed_in_background(self, mock_time):
+        goals = self.api_goals.list()
+        watcherclient = self.stub_watcherclient()
+        watcherclient.goal.list = mock.Mock(side_effect=[goals, goals[:1]])
+        mock_time.return_value = 1000
+
+        api.watcher.Goal.list(self.request)
+        mock_time.return_value += 3601
+        with mock.patch.object(api.catalog.concurrency, 'submit') as submit:
+            stale = api.watcher.Goal.list(self.mock_rest_request())
+            refresh = submit.call_args[0][0]
+        refresh()
+        fresh = api.watcher.Goal.list(self.mock_rest_request())
+
+        self.assertEqual(len(stale), len(goals))
+        self.assertEqual(len(fresh), 1)
 
     def test_goal_get(self):
         goal = self.api_goals.first()
         goal_id = self.api_goals.first()['uuid']
 
         watcherclient = self.stub_watcherclient()
+        watcherclient.goal.list = mock.Mock(return_value=self.api_goals.list())
+
+        ret_val = api.watcher.Goal.get(self.request, goal_id)
+        self.assertIsInstance(ret_val, api.watcher.Goal)
+        self.assertEqual(ret_val.to_dict(), goal)
+        watcherclient.goal.get.assert_not_called()
+
+    def test_goal_get_not_cached(self):
+        goal = self.api_goals.first()
+        goal_id = self.api_goals.first()['uuid']
+
+        watcherclient = self.stub_watcherclient()
+        watcherclient.goal.list = mock.Mock(return_value=[])
         watcherclient.goal.get = mock.Mock(return_value=goal)
 
         ret_val = api.watcher.Goal.get(self.request, goal_id)
-        self.assertIsInstance(ret_val, dict)
+        self.assertEqual(ret_val.to_dict(), goal)
         watcherclient.goal.get.assert_called_with(goal_id)
 
     def test_strategy_list(self):
-        strategies = {'strategies': self.api_strategies.list()}
+        strategies = self.api_strategies.list()
         watcherclient = self.stub_watcherclient()
 
         watcherclient.strategy.list = mock.Mock(return_value=strategies)
 
         ret_val = api.watcher.Strategy.list(self.request)
-        self.assertIn('strategies', ret_val)
-        for n in ret_val['strategies']:
-            self.assertIsInstance(n, dict)
-        watcherclient.strategy.list.assert_called_with(detail=True)
+        self.assertEqual(
+            [strategy.to_dict() for strategy in ret_val], strategies
+        )
+        for n in ret_val:
+            self.assertIsInstance(n, api.watcher.Strategy)
+        watcherclient.strategy.list.assert_called_with(detail=True, limit=0)
+
+    def test_strategy_list_by_goal(self):
+        strategies = self.api_strategies.list()
+        goal_uuid = strategies[0]['goal_uuid']
+        watcherclient = self.stub_watcherclient()
+        watcherclient.strategy.list = mock.Mock(return_value=strategies)
+
+        ret_val = api.watcher.Strategy.list(self.request, goal=goal_uuid)
+
+        self.assertEqual(
+            [strategy.uuid for strategy in ret_val],
+            [s['uuid'] for s in strategies if s['goal_uuid'] == goal_uuid],
+        )
+        watcherclient.strategy.list.assert_called_once_with(
+            detail=True, limit=0
+        )
+
+    def test_strategy_list_paged(self):
+        strategies = self.api_strategies.list()
+        watcherclient = self.stub_watcherclient()
+        watcherclient.strategy.list = mock.Mock(return_value=strategies)
+
+        ret_val = api.watcher.Strategy.list(
+            self.request,
+            marker=strategies[0]['uuid'],
+            limit=1,
+            sort_key='uuid',
+            sort_dir='asc',
+        )
+
+        self.assertEqual([s.uuid for s in ret_val], [strategies[1]['uuid']])
 
     def test_strategy_get(self):
         strategy = self.api_strategies.first()
         strategy_id = self.api_strategies.first()['uuid']
 
         watcherclient = self.stub_watcherclient()
-        watcherclient.strategy.get = mock.Mock(return_value=strategy)
+        watcherclient.strategy.list = mock.Mock(
+            return_value=self.api_strategies.list()
+        )
 
         ret_val = api.watcher.Strategy.get(self.request, strategy_id)
-        self.assertIsInstance(ret_val, dict)
-        watcherclient.strategy.get.assert_called_with(strategy_id)
+        self.assertIsInstance(ret_val, api.watcher.Strategy)
+        self.assertEqual(ret_val.to_dict(), strategy)
+        watcherclient.strategy.get.assert_not_called()
 
     def test_audit_template_list(self):
         audit_templates = {'audit_templates': self.api_audit_templates.list()}
@@ -103,6 +205,86 @@ class WatcherAPITests(test.APITestCase):
             detail=True, **search_opts
         )
 
+    def _audit_template_resources(self):
+        return [
+            api.watcher.AuditTemplate(audit_template)
+            for audit_template in self.api_audit_templates.list()
+        ]
+
+    def test_audit_template_list_names_cached(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.audit_template.list = mock.Mock(
+            return_value=self._audit_template_resources()
+        )
+
+        api.watcher.AuditTemplate.list_names(self.request)
+        ret_val = api.watcher.AuditTemplate.list_names(
+            self.mock_rest_request()
+        )
+
+        self.assertEqual(
+            ret_val,
+            [
+                {
+                    'uuid': audit_template['uuid'],
+                    'name': audit_template['name'],
+                }
+                for audit_template in self.api_audit_templates.list()
+            ],
+        )
+        watcherclient.audit_template.list.assert_called_once_with(limit=0)
+
+    @mock.patch.object(
+        api.watcher.config,
+        'get_audit_template_names_cache_ttl',
+        return_value=0,
+    )
+    def test_audit_template_list_names_own_ttl(self, _m_ttl):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.audit_template.list = mock.Mock(
+            return_value=self._audit_template_resources()
+        )
+
+        api.watcher.AuditTemplate.list_names(self.request)
+        api.watcher.AuditTemplate.list_names(self.mock_rest_request())
+
+        self.assertEqual(watcherclient.audit_template.list.call_count, 2)
+
+    def test_audit_template_list_names_forgotten_on_create(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.audit_template.list = mock.Mock(
+            return_value=self._audit_template_resources()
+        )
+        watcherclient.audit_template.create = mock.Mock()
+
+        api.watcher.AuditTemplate.list_names(self.request)
+        api.watcher.AuditTemplate.create(
+            self.request, 'new', 'goal', None, '', []
+        )
+        api.watcher.AuditTemplate.list_names(self.mock_rest_request())
+
+        self.assertEqual(watcherclient.audit_template.list.call_count, 2)
+
+    def test_audit_template_search(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.audit_template.list = mock.Mock(
+            return_value=self._audit_template_resources()
+        )
+        audit_templates = self.api_audit_templates.list()
+
+        by_name = api.watcher.AuditTemplate.search(self.request, 'audit TEMP')
+        by_uuid = api.watcher.AuditTemplate.search(
+            self.request, audit_templates[1]['uuid'][:13]
+        )
+        limited = api.watcher.AuditTemplate.search(self.request, '', limit=1)
+
+        self.assertEqual(len(by_name), len(audit_templates))
+        self.assertEqual(
+            [audit_template['uuid'] for audit_template in by_uuid],
+            [audit_templates[1]['uuid']],
+        )
+        self.assertEqual(len(limited), 1)
+
     def test_audit_template_get(self):
         audit_template = self.api_audit_templates.first()
         audit_template_id = self.api_audit_templates.first()['uuid']
@@ -465,6 +647,104 @@ class WatcherAPITests(test.APITestCase):
             action_plan_id=action_plan_id
         )
 
+    def _audit_action_plans(self):
+        return [
+            api.watcher.ActionPlan(
+                {
+                    'uuid': uuid,
+                    'audit_uuid': 'audit-1',
+                    'created_at': created_at,
+                }
+            )
+            for uuid, created_at in (
+                ('plan-1', '2026-01-01T00:00:00'),
+                ('plan-2', '2026-02-01T00:00:00'),
+            )
+        ]
+
+    def test_action_plan_latest_by_audit(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.action_plan.list = mock.Mock(
+            return_value=self._audit_action_plans()
+        )
+
+        api.watcher.ActionPlan.list(self.request, index=True)
+        # Older action plans listed later don't replace the latest one.
+        watcherclient.action_plan.list.return_value = (
+            self._audit_action_plans()[:1]
+        )
+        api.watcher.ActionPlan.list(
+            self.mock_rest_request(), index=True, audit='audit-1'
+        )
+
+        self.assertEqual(
+            api.watcher.ActionPlan.latest_by_audit(
+                self.request, ['audit-1', 'audit-2']
+            ),
+            {'audit-1': 'plan-2'},
+        )
+
+    def test_action_plan_list_not_indexed(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.action_plan.list = mock.Mock(
+            return_value=self._audit_action_plans()
+        )
+
+        with mock.patch.object(api.catalog, 'set_items') as m_set_items:
+            api.watcher.ActionPlan.list(self.request)
+
+        m_set_items.assert_not_called()
+
+    def test_action_plan_delete_index_unavailable(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.action_plan.delete = mock.Mock()
+
+        with mock.patch.object(
+            api.catalog, 'get_items', side_effect=RuntimeError
+        ):
+            api.watcher.ActionPlan.delete(self.request, 'plan-1')
+
+        watcherclient.action_plan.delete.assert_called_once_with(
+            action_plan_id='plan-1'
+        )
+
+    def test_action_plan_latest_by_audit_forgotten_on_delete(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.action_plan.list = mock.Mock(
+            return_value=self._audit_action_plans()
+        )
+        watcherclient.action_plan.delete = mock.Mock()
+
+        api.watcher.ActionPlan.list(self.request, index=True)
+        api.watcher.ActionPlan.delete(self.request, 'plan-2')
+
+        self.assertEqual(
+            api.watcher.ActionPlan.latest_by_audit(self.request, ['audit-1']),
+            {},
+        )
+
+    def test_action_plan_get_many_by_audit(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.action_plan.list = mock.Mock(
+            return_value=self._audit_action_plans()
+        )
+        watcherclient.action_plan.get = mock.Mock(
+            side_effect=wc_exc.NotFound()
+        )
+        api.watcher.ActionPlan.list(self.request, index=True)
+
+        ret_val = api.watcher.ActionPlan.get_many(
+            self.mock_rest_request(), ['plan-1', 'plan-2', 'plan-3']
+        )
+
+        self.assertEqual(sorted(ret_val), ['plan-1', 'plan-2'])
+        watcherclient.action_plan.list.assert_called_with(
+            detail=True, limit=0, audit='audit-1'
+        )
+        watcherclient.action_plan.get.assert_called_once_with(
+            action_plan_id='plan-3'
+        )
+
     def test_action_list(self):
         actions = {'actions': self.api_actions.list()}
         watcherclient = self.stub_watcherclient()
@@ -478,6 +758,42 @@ class WatcherAPITests(test.APITestCase):
             self.assertIsInstance(n, dict)
         watcherclient.action.list.assert_called_with(detail=True)
 
+    def test_action_get_many(self):
+        action1, action2 = self.actions.list()
+        watcherclient = self.stub_watcherclient()
+        watcherclient.action.list = mock.Mock(return_value=[action1])
+        watcherclient.action.get = mock.Mock(return_value=action2)
+
+        ret_val = api.watcher.Action.get_many(
+            self.request,
+            [action1.uuid, action2.uuid, action1.uuid],
+            action_plan='plan-uuid',
+        )
+
+        self.assertEqual(
+            ret_val, {action1.uuid: action1, action2.uuid: action2}
+        )
+        watcherclient.action.list.assert_called_once_with(
+            detail=True, limit=0, action_plan='plan-uuid'
+        )
+        # Missing from the listing, e.g. moved since.
+        watcherclient.action.get.assert_called_once_with(
+            action_id=action2.uuid
+        )
+
+    def test_action_get_many_error(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.action.get = mock.Mock(
+            side_effect=self.exceptions.watcher
+        )
+
+        self.assertRaises(
+            type(self.exceptions.watcher),
+            api.watcher.Action.get_many,
+            self.request,
+            ['uuid-1', 'uuid-2'],
+        )
+
     def test_action_get_with_api_version(self):
         action = self.api_actions.first()
         action_id = action['uuid']
@@ -603,3 +919,209 @@ class WatcherAPITests(test.APITestCase):
         self.assertRaises(
             AttributeError, api.watcher.get_strategy_display_name, strategy
         )
+
+    def test_list_is_memoized_per_request(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.audit.list = mock.Mock(return_value=[])
+
+        first = api.watcher.Audit.list(self.request, goal='goal-1')
+        second = api.watcher.Audit.list(self.request, goal='goal-1')
+
+        self.assertIs(first, second)
+        watcherclient.audit.list.assert_called_once_with(
+            detail=True, goal='goal-1'
+        )
+        self.assertEqual(
+            api.watcher.get_request_memo_stats(self.request), {'avoided': 1}
+        )
+
+    def test_memo_distinguishes_arguments(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.audit.list = mock.Mock(return_value=[])
+
+        api.watcher.Audit.list(self.request, goal='goal-1')
+        api.watcher.Audit.list(self.request, goal='goal-2')
+        api.watcher.Audit.list(self.request, goal='goal-1', api_version='1.1')
+
+        self.assertEqual(watcherclient.audit.list.call_count, 3)
+
+    def test_failed_call_is_not_memoized(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.goal.list = mock.Mock(
+            side_effect=[self.exceptions.watcher, []]
+        )
+
+        self.assertRaises(
+            self.exceptions.watcher.__class__,
+            api.watcher.Goal.list,
+            self.request,
+        )
+        self.assertEqual(api.watcher.Goal.list(self.request), [])
+
+    def test_write_invalidates_memo(self):
+        watcherclient = self.stub_watcherclient()
+        watcherclient.audit.list = mock.Mock(return_value=[])
+
+        api.watcher.Audit.list(self.request)
+        api.watcher.Audit.delete(self.request, 'audit-uuid')
+        api.watcher.Audit.list(self.request)
+
+        self.assertEqual(watcherclient.audit.list.call_count, 2)
+
+    def test_action_list_fields(self):
+        actions = [api.watcher.Action(a) for a in self.api_actions.list()]
+        watcherclient = self.stub_watcherclient()
+        watcherclient.action.list = mock.Mock(return_value=actions)
+        watcherclient.action.get = mock.Mock(return_value=actions[0])
+
+        ret_val = api.watcher.Action.list(self.request, fields=('state',))
+
+        self.assertEqual(
+            ret_val[0].to_dict(), {'uuid': actions[0].uuid, 'state': 'PENDING'}
+        )
+        watcherclient.action.list.assert_called_with(detail=True)
+        # Other attributes are loaded on demand.
+        self.assertEqual(ret_val[0].next_uuid, actions[0].next_uuid)
+        watcherclient.action.get.assert_called_once_with(
+            action_id=actions[0].uuid
+        )
+
+    @mock.patch.object(api.watcher.utils, 'get_page_size', return_value=1)
+    def test_action_list_paged(self, _get_page_size):
+        actions = self.api_actions.list()
+        watcherclient = self.stub_watcherclient()
+        watcherclient.action.list = mock.Mock(return_value=actions)
+
+        ret_val, has_more, has_prev = api.watcher.Action.list_paged(
+            self.request, marker='marker-uuid', paginate=True
+        )
+
+        self.assertEqual(ret_val, actions[:1])
+        self.assertTrue(has_more)
+        self.assertTrue(has_prev)
+        watcherclient.action.list.assert_called_with(
+            detail=True,
+            limit=2,
+            marker='marker-uuid',
+            sort_key='created_at',
+            sort_dir='desc',
+        )
+
+    @mock.patch.object(api.watcher.utils, 'get_page_size', return_value=2)
+    def test_action_list_paged_backwards(self, _get_page_size):
+        actions = self.api_actions.list()[:2]
+        watcherclient = self.stub_watcherclient()
+        watcherclient.action.list = mock.Mock(return_value=list(actions))
+
+        ret_val, has_more, has_prev = api.watcher.Action.list_paged(
+            self.request, marker='marker-uuid', paginate=True, sort_dir='asc'
+        )
+
+        self.assertEqual(ret_val, actions[::-1])
+        self.assertTrue(has_more)
+        self.assertFalse(has_prev)
+
+    @mock.patch.object(api.watcher.utils, 'get_page_size', return_value=2)
+    @mock.patch.object(api.watcher.Action, 'list')
+    def test_action_list_paged_select(self, m_list, _get_page_size):
+        actions = [mock.Mock(uuid=str(i), state=i % 3) for i in range(6)]
+        m_list.side_effect = [actions[:3], actions[3:]]
+
+        ret_val, has_more, has_prev = api.watcher.Action.list_paged(
+            self.request,
+            paginate=True,
+            select=lambda page: [action for action in page if action.state],
+        )
+
+        # The second page fills the first, and tells there is more.
+        self.assertEqual(ret_val, [actions[1], actions[2]])
+        self.assertTrue(has_more)
+        self.assertFalse(has_prev)
+        m_list.assert_has_calls(
+            [
+                mock.call(
+                    self.request,
+                    limit=3,
+                    marker=marker,
+                    sort_key='created_at',
+                    sort_dir='desc',
+                )
+                for marker in (None, actions[2].uuid)
+            ]
+        )
+
+    def test_audit_iter_all(self):
+        audits = self.audits.list()
+        client = mock.Mock()
+        # Check the calls against the signature of the real manager.
+        client.audit = mock.create_autospec(
+            wc_audit.AuditManager, instance=True
+        )
+        client.audit.list.side_effect = [audits[:1], []]
+
+        with mock.patch.object(
+            api.watcher, 'watcherclient', return_value=client
+        ) as m_client:
+            ret_val = api.watcher.Audit.iter_all(
+                self.request, 1, api_version='1.1', goal='goal-uuid'
+            )
+            self.assertEqual(list(ret_val), audits[:1])
+
+        m_client.assert_called_with(self.request, api_version='1.1')
+        client.audit.list.assert_has_calls(
+            [
+                mock.call(
+                    detail=True,
+                    limit=1,
+                    marker=marker,
+                    sort_key='created_at',
+                    sort_dir='asc',
+                    goal='goal-uuid',
+                )
+                for marker in (None, audits[0].uuid)
+            ]
+        )
+
+    def test_action_iter_all(self):
+        actions = self.actions.list()
+        watcherclient = self.stub_watcherclient()
+        watcherclient.action.list = mock.Mock(
+            side_effect=[actions, actions[:1]]
+        )
+
+        ret_val = api.watcher.Action.iter_all(
+            self.request, 2, action_plan='plan-uuid'
+        )
+
+        self.assertEqual(list(ret_val), actions + actions[:1])
+        watcherclient.action.list.assert_has_calls(
+            [
+                mock.call(
+                    detail=True,
+                    limit=2,
+                    marker=marker,
+                    sort_key='created_at',
+                    sort_dir='asc',
+                    action_plan='plan-uuid',
+                )
+                for marker in (None, actions[1].uuid)
+            ]
+        )
+        # Unlike list, the pages are not kept in the request memo.
+        self.assertFalse(vars(self.request).get(api.watcher._MEMO_ATTR))
+
+    def test_action_list_not_paged(self):
+        actions = self.api_actions.list()
+        watcherclient = self.stub_watcherclient()
+        watcherclient.action.list = mock.Mock(return_value=actions)
+
+        ret_val, has_more, has_prev = api.watcher.Action.list_paged(
+            self.request, action_plan='plan-uuid'
+        )
+
+        self.assertEqual(ret_val, actions)
+        self.assertFalse(has_more)
+        self.assertFalse(has_prev)
+        watcherclient.action.list.assert_called_with(
+            detail=True, action_plan='plan-uuid'
+        )
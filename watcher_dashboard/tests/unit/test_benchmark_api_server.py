@@ -0,0 +1,81 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+
+from django.test import TestCase
+from watcherclient.common.apiclient import exceptions as wc_exc
+from watcherclient.v1 import client
+
+from watcher_dashboard.tests.benchmarks import api_server
+from watcher_dashboard.tests.benchmarks import fakes
+
+
+class WatcherAPIServerTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.fake_client = fakes.FakeWatcherClient(2500)
+        self.app = api_server.WatcherAPI(self.fake_client, seed=0)
+        server = api_server.make_server(self.app, port=0, quiet=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.endpoint = f'http://127.0.0.1:{server.server_port}'
+
+    def _get_client(self, api_version='1.1'):
+        return client.Client(
+            endpoint=self.endpoint,
+            token='token',
+            os_infra_optim_api_version=api_version,
+        )
+
+    def test_version_discovery(self):
+        _resp, body = self._get_client().http_client.json_request('GET', '/')
+
+        self.assertEqual(body['versions'][0]['max_version'], '1.5')
+
+    def test_list_pages(self):
+        actions = self._get_client().action.list(
+            detail=True, limit=0, action_plan=fakes.make_uuid('00000005', 0)
+        )
+
+        # Fetched by pages of API_MAX_LIMIT actions.
+        self.assertEqual(len(actions), 2500)
+        self.assertEqual(len({action.uuid for action in actions}), 2500)
+
+    def test_microversion_fields(self):
+        audit_uuid = fakes.make_uuid('00000004', 0)
+
+        audit = self._get_client('1.1').audit.get(audit_uuid)
+        old_audit = self._get_client('1.0').audit.get(audit_uuid)
+
+        self.assertTrue(hasattr(audit, 'start_time'))
+        self.assertFalse(hasattr(old_audit, 'start_time'))
+
+    def test_writes(self):
+        watcher = self._get_client()
+        audit = watcher.audit.create(name='new', audit_type='ONESHOT')
+        watcher.audit.update(
+            audit.uuid, [{'op': 'replace', 'path': '/name', 'value': 'old'}]
+        )
+
+        self.assertEqual(audit.state, 'PENDING')
+        self.assertEqual(watcher.audit.get(audit.uuid).name, 'old')
+        watcher.audit.delete(audit.uuid)
+        self.assertRaises(wc_exc.NotFound, watcher.audit.get, audit.uuid)
+
+    def test_error_injection(self):
+        self.app.error_rate = {'goals': 1.0}
+        watcher = self._get_client()
+
+        self.assertRaises(wc_exc.InternalServerError, watcher.goal.list)
+        self.assertEqual(len(watcher.strategy.list(limit=5)), 5)
@@ -0,0 +1,63 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from django.test import TestCase
+from watcherclient.common.apiclient import exceptions as wc_exc
+
+from watcher_dashboard.tests.benchmarks import fakes
+
+
+class FakeWatcherClientTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = fakes.FakeWatcherClient(2500)
+
+    def test_list_page(self):
+        first = self.client.audit.list(
+            detail=True, limit=3, sort_key='created_at', sort_dir='desc'
+        )
+        second = self.client.audit.list(
+            detail=True, limit=3, marker=first[-1].uuid, sort_dir='desc'
+        )
+
+        self.assertEqual(
+            [audit.uuid for audit in first + second],
+            [fakes.make_uuid('00000004', i) for i in range(2499, 2493, -1)],
+        )
+        self.assertEqual(self.client.calls, 2)
+
+    def test_list_all(self):
+        actions = self.client.action.list(
+            detail=True, limit=0, action_plan=fakes.make_uuid('00000005', 0)
+        )
+
+        self.assertEqual(len(actions), 2500)
+        # watcherclient follows the pages of API_MAX_LIMIT actions.
+        self.assertEqual(self.client.calls, 3)
+
+    def test_list_default_limit(self):
+        self.assertEqual(
+            len(self.client.goal.list(detail=True)), fakes.API_MAX_LIMIT
+        )
+
+    def test_get(self):
+        goal = self.client.goal.get('goal_7')
+        strategy = self.client.strategy.get(fakes.make_uuid('00000002', 7))
+
+        self.assertEqual(
+            goal.to_dict()['uuid'], fakes.make_uuid('00000001', 7)
+        )
+        self.assertEqual(strategy.name, 'strategy_7')
+        self.assertRaises(
+            wc_exc.NotFound, self.client.audit.get, audit='unknown'
+        )
+        self.assertEqual(self.client.calls, 3)
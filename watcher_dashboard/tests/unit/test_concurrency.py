@@ -0,0 +1,159 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import threading
+
+from asgiref import sync
+from django.test import TestCase
+from django.test import override_settings
+
+from watcher_dashboard.common import concurrency
+from watcher_dashboard.tests.local_fixtures.fixtures import ConfigMemoizedCache
+
+
+class FanOutTests(ConfigMemoizedCache, TestCase):
+    def setUp(self):
+        super().setUp()
+        concurrency._reset_after_fork()
+
+    def tearDown(self):
+        super().tearDown()
+        if concurrency._executor is not None:
+            concurrency._executor.shutdown()
+        concurrency._reset_after_fork()
+
+    def test_results_keep_call_order(self):
+        futures = concurrency.fan_out(None, lambda: 1, lambda: 2, lambda: 3)
+        self.assertEqual([f.result() for f in futures], [1, 2, 3])
+
+    def test_calls_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        futures = concurrency.fan_out(None, barrier.wait, barrier.wait)
+        # Both calls only return once they are waiting at the same time.
+        self.assertCountEqual([f.result() for f in futures], [0, 1])
+
+    def test_exception_raised_in_caller(self):
+        def fail():
+            raise ValueError('boom')
+
+        futures = concurrency.fan_out(None, fail, lambda: 'ok')
+        self.assertRaises(ValueError, futures[0].result)
+        self.assertEqual(futures[1].result(), 'ok')
+
+    @override_settings(WATCHER_FAN_OUT_MAX_WORKERS=0)
+    def test_disabled_runs_inline(self):
+        caller = threading.current_thread()
+        futures = concurrency.fan_out(
+            None, threading.current_thread, threading.current_thread
+        )
+        self.assertEqual([f.result() for f in futures], [caller, caller])
+        self.assertIsNone(concurrency._executor)
+
+    def test_nested_fan_out_runs_inline(self):
+        def nested():
+            inner = concurrency.fan_out(
+                None, threading.current_thread, threading.current_thread
+            )
+            return threading.current_thread(), [f.result() for f in inner]
+
+        outer = concurrency.fan_out(None, nested, nested)
+        for future in outer:
+            worker, inner = future.result()
+            self.assertEqual(inner, [worker, worker])
+
+    def test_reset_after_fork_drops_pool(self):
+        concurrency.fan_out(None, lambda: 1, lambda: 2)
+        executor = concurrency._executor
+        self.assertIsNotNone(executor)
+        concurrency._reset_after_fork()
+        self.assertIsNone(concurrency._executor)
+        executor.shutdown()
+
+
+class RunBoundedTests(TestCase):
+    def test_results_keep_call_order(self):
+        futures = concurrency.run_bounded(
+            None, [lambda i=i: i for i in range(5)], 2
+        )
+        self.assertEqual([f.result() for f in futures], list(range(5)))
+
+    def test_concurrency_is_bounded(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def call():
+            with lock:
+                running.append(None)
+                peak.append(len(running))
+            threading.Event().wait(0.01)
+            with lock:
+                running.pop()
+
+        futures = concurrency.run_bounded(None, [call] * 10, 3)
+        for future in futures:
+            future.result()
+        self.assertLessEqual(max(peak), 3)
+
+    def test_exception_raised_in_caller(self):
+        def fail():
+            raise ValueError('boom')
+
+        futures = concurrency.run_bounded(None, [fail, lambda: 'ok'], 2)
+        self.assertRaises(ValueError, futures[0].result)
+        self.assertEqual(futures[1].result(), 'ok')
+
+    def test_disabled_runs_inline(self):
+        caller = threading.current_thread()
+        futures = concurrency.run_bounded(
+            None, [threading.current_thread] * 2, 0
+        )
+        self.assertEqual([f.result() for f in futures], [caller, caller])
+
+
+class RunAsyncTests(ConfigMemoizedCache, TestCase):
+    def setUp(self):
+        super().setUp()
+        concurrency._reset_after_fork()
+
+    def tearDown(self):
+        super().tearDown()
+        if concurrency._executor is not None:
+            concurrency._executor.shutdown()
+        concurrency._reset_after_fork()
+
+    def test_calls_awaited_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        async def view():
+            return await asyncio.gather(
+                concurrency.run_async(None, barrier.wait),
+                concurrency.run_async(None, barrier.wait),
+            )
+
+        # Both calls only return once they are waiting at the same time.
+        self.assertCountEqual(sync.async_to_sync(view)(), [0, 1])
+
+    def test_exception_raised_in_caller(self):
+        def fail():
+            raise ValueError('boom')
+
+        run = sync.async_to_sync(concurrency.run_async)
+        self.assertRaises(ValueError, run, None, fail)
+
+    @override_settings(WATCHER_FAN_OUT_MAX_WORKERS=0)
+    def test_disabled_runs_in_caller_thread(self):
+        caller = threading.current_thread()
+        run = sync.async_to_sync(concurrency.run_async)
+        self.assertEqual(run(None, threading.current_thread), caller)
+        self.assertIsNone(concurrency._executor)
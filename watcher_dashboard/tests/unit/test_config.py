@@ -91,3 +91,143 @@ class ConfigTests(ConfigMemoizedCache, TestCase):
 
     def test_set_policy_file_empty_filename(self):
         self.assertRaises(ValueError, config.set_policy_file, 'svc', '')
+
+    # --- get_max_version_cache_ttl ---
+
+    def test_get_max_version_cache_ttl_default(self):
+        self.assertEqual(config.get_max_version_cache_ttl(), 300)
+
+    @override_settings(WATCHER_MAX_VERSION_CACHE_TTL=0)
+    def test_get_max_version_cache_ttl_disabled(self):
+        self.assertEqual(config.get_max_version_cache_ttl(), 0)
+
+    @override_settings(WATCHER_MAX_VERSION_CACHE_TTL='60')
+    def test_get_max_version_cache_ttl_invalid_type(self):
+        self.assertRaises(TypeError, config.get_max_version_cache_ttl)
+
+    @override_settings(WATCHER_MAX_VERSION_CACHE_TTL=-1)
+    def test_get_max_version_cache_ttl_negative(self):
+        self.assertRaises(ValueError, config.get_max_version_cache_ttl)
+
+    # --- get_client_pool_size / get_connection_pool_maxsize ---
+
+    def test_get_client_pool_size_default(self):
+        self.assertEqual(config.get_client_pool_size(), 100)
+
+    @override_settings(WATCHER_CLIENT_POOL_SIZE=0)
+    def test_get_client_pool_size_invalid(self):
+        self.assertRaises(ValueError, config.get_client_pool_size)
+
+    def test_get_connection_pool_maxsize_default(self):
+        self.assertEqual(config.get_connection_pool_maxsize(), 10)
+
+    @override_settings(WATCHER_CONNECTION_POOL_MAXSIZE=2.5)
+    def test_get_connection_pool_maxsize_invalid_type(self):
+        self.assertRaises(TypeError, config.get_connection_pool_maxsize)
+
+    # --- get_fan_out_max_workers ---
+
+    def test_get_fan_out_max_workers_default(self):
+        self.assertEqual(config.get_fan_out_max_workers(), 8)
+
+    @override_settings(WATCHER_FAN_OUT_MAX_WORKERS=0)
+    def test_get_fan_out_max_workers_disabled(self):
+        self.assertEqual(config.get_fan_out_max_workers(), 0)
+
+    @override_settings(WATCHER_FAN_OUT_MAX_WORKERS=-1)
+    def test_get_fan_out_max_workers_invalid(self):
+        self.assertRaises(ValueError, config.get_fan_out_max_workers)
+
+    # --- get_batch_action_max_workers ---
+
+    def test_get_batch_action_max_workers_default(self):
+        self.assertEqual(config.get_batch_action_max_workers(), 8)
+
+    @override_settings(WATCHER_BATCH_ACTION_MAX_WORKERS=0)
+    def test_get_batch_action_max_workers_disabled(self):
+        self.assertEqual(config.get_batch_action_max_workers(), 0)
+
+    @override_settings(WATCHER_BATCH_ACTION_MAX_WORKERS='4')
+    def test_get_batch_action_max_workers_invalid_type(self):
+        self.assertRaises(TypeError, config.get_batch_action_max_workers)
+
+    # --- get_export_page_size ---
+
+    def test_get_export_page_size_default(self):
+        self.assertEqual(config.get_export_page_size(), 1000)
+
+    @override_settings(WATCHER_EXPORT_PAGE_SIZE=100)
+    def test_get_export_page_size_custom(self):
+        self.assertEqual(config.get_export_page_size(), 100)
+
+    @override_settings(WATCHER_EXPORT_PAGE_SIZE=0)
+    def test_get_export_page_size_invalid(self):
+        self.assertRaises(ValueError, config.get_export_page_size)
+
+    # --- get_api_call_hooks ---
+
+    def test_get_api_call_hooks_default(self):
+        self.assertEqual(config.get_api_call_hooks(), ())
+
+    @override_settings(
+        WATCHER_API_CALL_HOOKS=['watcher_dashboard.config.get_api_call_hooks']
+    )
+    def test_get_api_call_hooks_dotted_path(self):
+        self.assertEqual(
+            config.get_api_call_hooks(), (config.get_api_call_hooks,)
+        )
+
+    @override_settings(WATCHER_API_CALL_HOOKS='not.a.list')
+    def test_get_api_call_hooks_invalid_type(self):
+        self.assertRaises(TypeError, config.get_api_call_hooks)
+
+    @override_settings(WATCHER_API_CALL_HOOKS=[42])
+    def test_get_api_call_hooks_not_callable(self):
+        self.assertRaises(TypeError, config.get_api_call_hooks)
+
+    # --- get_metrics_enabled / get_metrics_dir ---
+
+    def test_get_metrics_enabled_default(self):
+        self.assertIs(config.get_metrics_enabled(), False)
+
+    @override_settings(WATCHER_METRICS_ENABLED='true')
+    def test_get_metrics_enabled_string(self):
+        self.assertIs(config.get_metrics_enabled(), True)
+
+    def test_get_metrics_dir_default(self):
+        self.assertIsNone(config.get_metrics_dir())
+
+    @override_settings(WATCHER_METRICS_DIR='/run/watcher-dashboard')
+    def test_get_metrics_dir_value(self):
+        self.assertEqual(config.get_metrics_dir(), '/run/watcher-dashboard')
+
+    @override_settings(WATCHER_METRICS_DIR=42)
+    def test_get_metrics_dir_invalid_type(self):
+        self.assertRaises(TypeError, config.get_metrics_dir)
+
+    # --- get_audit_template_names_cache_ttl ---
+
+    def test_get_audit_template_names_cache_ttl_default(self):
+        self.assertEqual(config.get_audit_template_names_cache_ttl(), 60)
+
+    @override_settings(WATCHER_AUDIT_TEMPLATE_NAMES_CACHE_TTL=-1)
+    def test_get_audit_template_names_cache_ttl_invalid(self):
+        self.assertRaises(
+            ValueError, config.get_audit_template_names_cache_ttl
+        )
+
+    # --- get_catalog_cache_ttl / get_catalog_cache_alias ---
+
+    def test_get_catalog_cache_ttl_default(self):
+        self.assertEqual(config.get_catalog_cache_ttl(), 3600)
+
+    @override_settings(WATCHER_CATALOG_CACHE_TTL=-5)
+    def test_get_catalog_cache_ttl_invalid(self):
+        self.assertRaises(ValueError, config.get_catalog_cache_ttl)
+
+    def test_get_catalog_cache_alias_default(self):
+        self.assertEqual(config.get_catalog_cache_alias(), 'default')
+
+    @override_settings(WATCHER_CATALOG_CACHE=None)
+    def test_get_catalog_cache_alias_invalid_type(self):
+        self.assertRaises(TypeError, config.get_catalog_cache_alias)
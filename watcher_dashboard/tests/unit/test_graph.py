@@ -0,0 +1,111 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import types
+
+from django.test import SimpleTestCase
+
+from watcher_dashboard.common import graph
+
+
+def _action(uuid, parents=None, next_uuid=None):
+    return types.SimpleNamespace(
+        uuid=uuid,
+        action_type=f'type-{uuid}',
+        parents=parents,
+        next_uuid=next_uuid,
+    )
+
+
+class LayoutTests(SimpleTestCase):
+    def test_chain(self):
+        actions = [
+            _action('b', next_uuid='c'),
+            _action('c'),
+            _action('a', next_uuid='b'),
+        ]
+
+        layout = graph.layout(actions)
+
+        self.assertEqual(
+            layout['nodes'],
+            [
+                ['a', 'type-a', 0, 0],
+                ['b', 'type-b', 1, 0],
+                ['c', 'type-c', 2, 0],
+            ],
+        )
+        self.assertEqual(layout['edges'], [[0, 1], [1, 2]])
+        self.assertEqual(layout['levels'], 3)
+        self.assertEqual(layout['critical_path'], [0, 1, 2])
+
+    def test_dag(self):
+        # a -> b -> d, a -> c -> d -> e, c -> f
+        actions = [
+            _action('a'),
+            _action('b', parents=['a']),
+            _action('c', parents=['a']),
+            _action('d', parents=['b', 'c']),
+            _action('e', parents=['d']),
+            _action('f', parents=['c', 'unknown']),
+        ]
+
+        layout = graph.layout(actions)
+
+        self.assertEqual(
+            [node[0] for node in layout['nodes']],
+            ['a', 'b', 'c', 'd', 'f', 'e'],
+        )
+        self.assertEqual(
+            [node[2:] for node in layout['nodes']],
+            [[0, 0], [1, 0], [1, 1], [2, 0], [2, 1], [3, 0]],
+        )
+        self.assertEqual(layout['levels'], 4)
+        names = [layout['nodes'][i][0] for i in layout['critical_path']]
+        self.assertEqual(names, ['a', 'b', 'd', 'e'])
+
+    def test_cycle(self):
+        actions = [
+            _action('a'),
+            _action('b', parents=['c']),
+            _action('c', parents=['b']),
+        ]
+
+        layout = graph.layout(actions)
+
+        self.assertEqual(
+            layout['nodes'],
+            [
+                ['a', 'type-a', 0, 0],
+                ['b', 'type-b', None, None],
+                ['c', 'type-c', None, None],
+            ],
+        )
+        self.assertEqual(layout['critical_path'], [0])
+
+    def test_empty(self):
+        self.assertEqual(
+            graph.layout([]),
+            {'nodes': [], 'edges': [], 'levels': 0, 'critical_path': []},
+        )
+
+    def test_large_chain(self):
+        count = 5000
+        actions = [
+            _action(str(i), parents=[str(i - 1)] if i else None)
+            for i in range(count)
+        ]
+
+        layout = graph.layout(reversed(actions))
+
+        self.assertEqual(layout['levels'], count)
+        self.assertEqual(len(layout['critical_path']), count)
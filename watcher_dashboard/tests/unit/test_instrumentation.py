@@ -0,0 +1,163 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from django.core import signals
+from django.test import RequestFactory
+from django.test import TestCase
+from django.test import override_settings
+from watcherclient.common import base as wc_base
+from watcherclient.common.apiclient import exceptions as wc_apiexc
+
+from watcher_dashboard.api import watcher
+from watcher_dashboard.common import client as common_client
+from watcher_dashboard.common import instrumentation
+from watcher_dashboard.tests import helpers as test
+from watcher_dashboard.tests.local_fixtures.fixtures import ConfigMemoizedCache
+
+
+ENDPOINT = 'http://watcher.example.com:9322'
+
+
+class AuditManager(wc_base.Manager):
+    def list(self, detail=False, **filters):
+        return [1, 2, 3]
+
+    def get(self, audit):
+        raise LookupError(audit)
+
+
+class InstrumentationTests(ConfigMemoizedCache, TestCase):
+    def setUp(self):
+        super().setUp()
+        # Forget the requests of other tests served by this thread.
+        instrumentation._get_tracked().clear()
+        self.request = RequestFactory().get('/admin/resources/?page=2')
+        self.request.user = mock.Mock()
+        m_hooks = mock.patch.object(
+            instrumentation.config, 'get_api_call_hooks', return_value=()
+        )
+        self.m_hooks = m_hooks.start()
+        self.addCleanup(m_hooks.stop)
+        self.client = mock.Mock()
+        self.client.audit_template = AuditManager(self.client.http_client)
+        for target, attr, value in (
+            (common_client, 'get_client', self.client),
+            (watcher, 'insert_watcher_policy_file', None),
+        ):
+            patcher = mock.patch.object(target, attr, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        test.patch_watcher_url(self, ENDPOINT)
+        common_client.invalidate_max_version(self.request)
+        self.addCleanup(common_client.invalidate_max_version, self.request)
+
+    def test_calls_recorded(self):
+        client = watcher.watcherclient(self.request, api_version='1.1')
+        self.assertEqual(client.audit_template.list(), [1, 2, 3])
+        client = watcher.watcherclient(self.request)
+        self.assertRaises(LookupError, client.audit_template.get, 'uuid')
+
+        calls = instrumentation.get_calls(self.request)
+
+        self.assertEqual(
+            [call[:2] + call[3:] for call in calls],
+            [
+                ('AuditTemplate.list', '1.1', 3, 'ok'),
+                ('AuditTemplate.get', None, 0, 'LookupError'),
+            ],
+        )
+        self.assertTrue(all(call.duration >= 0 for call in calls))
+
+    def test_other_attributes_not_recorded(self):
+        client = watcher.watcherclient(self.request)
+
+        self.assertIs(client.http_client, self.client.http_client)
+        self.assertEqual(instrumentation.get_calls(self.request), [])
+
+    def test_memo_hits_not_recorded(self):
+        self.client.audit = AuditManager(self.client.http_client)
+
+        watcher.Audit.list(self.request)
+        watcher.Audit.list(self.request)
+
+        calls = instrumentation.get_calls(self.request)
+        self.assertEqual([call.name for call in calls], ['Audit.list'])
+
+    def test_generator_pages_recorded(self):
+        self.client.audit = AuditManager(self.client.http_client)
+        pages = [
+            [mock.Mock(uuid='a'), mock.Mock(uuid='b')],
+            [mock.Mock(uuid='c')],
+        ]
+        self.client.audit.list = mock.Mock(side_effect=pages)
+
+        audits = watcher.Audit.iter_all(self.request, page_size=2)
+        self.assertEqual(instrumentation.get_calls(self.request), [])
+
+        self.assertEqual(len(list(audits)), 3)
+        calls = instrumentation.get_calls(self.request)
+        self.assertEqual(
+            [(call.name, call.size) for call in calls],
+            [('Audit.list', 2), ('Audit.list', 1)],
+        )
+
+    @override_settings(WATCHER_MAX_VERSION_CACHE_TTL=300)
+    def test_max_version_discovery_recorded(self):
+        json_request = self.client.http_client.json_request
+        json_request.side_effect = wc_apiexc.InternalServerError()
+        self.assertIsNone(common_client.get_max_version(self.request))
+        json_request.side_effect = None
+        json_request.return_value = (
+            None,
+            {'versions': [{'max_version': '1.5'}]},
+        )
+        self.assertEqual(common_client.get_max_version(self.request), '1.5')
+        self.assertEqual(common_client.get_max_version(self.request), '1.5')
+
+        calls = instrumentation.get_calls(self.request)
+        self.assertEqual(
+            [(call.name, call.outcome) for call in calls],
+            [
+                ('get_max_version', 'InternalServerError'),
+                ('get_max_version', 'ok'),
+            ],
+        )
+
+    def test_hooks_called(self):
+        failing_hook = mock.Mock(side_effect=ValueError('boom'))
+        hook = mock.Mock()
+        self.m_hooks.return_value = (failing_hook, hook)
+
+        client = watcher.watcherclient(self.request)
+        self.assertEqual(client.audit_template.list(), [1, 2, 3])
+
+        call = instrumentation.get_calls(self.request)[0]
+        hook.assert_called_once_with(self.request, call)
+        failing_hook.assert_called_once_with(self.request, call)
+
+    def test_summary_logged_once_answered(self):
+        client = watcher.watcherclient(self.request)
+        client.audit_template.list()
+        self.assertRaises(LookupError, client.audit_template.get, 'uuid')
+
+        with self.assertLogs(instrumentation.LOG, 'INFO') as logs:
+            signals.request_finished.send(sender=self.__class__)
+            signals.request_finished.send(sender=self.__class__)
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn(
+            'GET /admin/resources/?page=2: 2 Watcher API calls, 1 failed',
+            logs.output[0],
+        )
+        self.assertIn('AuditTemplate.get=', logs.output[0])
@@ -0,0 +1,186 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import tempfile
+
+from unittest import mock
+
+from django.test import TestCase
+
+from watcher_dashboard import config
+from watcher_dashboard.common import cache
+from watcher_dashboard.common import metrics
+
+
+class MetricsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        metrics._reset()
+        self.addCleanup(metrics._reset)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        for name, value in (
+            ('get_metrics_enabled', True),
+            ('get_metrics_dir', self.directory.name),
+        ):
+            patcher = mock.patch.object(config, name, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_render(self):
+        metrics.CACHE_LOOKUPS.inc(cache='catalog', result='hit')
+        metrics.CACHE_LOOKUPS.inc(cache='catalog', result='hit')
+        metrics.API_CALL_DURATION.observe(
+            0.02, method='Audit.list', outcome='ok'
+        )
+
+        lines = metrics.render().splitlines()
+
+        self.assertIn(
+            '# TYPE watcher_dashboard_cache_lookups_total counter', lines
+        )
+        self.assertIn(
+            'watcher_dashboard_cache_lookups_total'
+            '{cache="catalog",result="hit"} 2.0',
+            lines,
+        )
+        prefix = 'watcher_dashboard_api_call_duration_seconds'
+        labels = 'method="Audit.list",outcome="ok"'
+        self.assertIn(f'{prefix}_bucket{{{labels},le="0.01"}} 0.0', lines)
+        self.assertIn(f'{prefix}_bucket{{{labels},le="0.025"}} 1.0', lines)
+        self.assertIn(f'{prefix}_bucket{{{labels},le="+Inf"}} 1.0', lines)
+        self.assertIn(f'{prefix}_sum{{{labels}}} 0.02', lines)
+        self.assertIn(f'{prefix}_count{{{labels}}} 1.0', lines)
+
+    def test_merge_worker_files(self):
+        metrics.CACHE_LOOKUPS.inc(cache='catalog', result='miss')
+        metrics.VIEW_DURATION.observe(0.3, view='audits:index')
+        metrics.flush(force=True)
+        worker_path = os.path.join(
+            self.directory.name, 'watcher-dashboard-1.json'
+        )
+        os.rename(metrics._get_path(self.directory.name), worker_path)
+
+        merged = metrics.collect()
+
+        self.assertEqual(
+            merged['watcher_dashboard_cache_lookups_total'][
+                ('catalog', 'miss')
+            ],
+            2,
+        )
+        view_duration = merged['watcher_dashboard_view_duration_seconds'][
+            ('audits:index',)
+        ]
+        self.assertEqual(view_duration[-1], 2)
+        self.assertAlmostEqual(view_duration[-2], 0.6)
+
+    def test_exited_worker_files_folded(self):
+        metrics.CACHE_LOOKUPS.inc(cache='catalog', result='miss')
+        metrics.flush(force=True)
+        worker_path = os.path.join(
+            self.directory.name, 'watcher-dashboard-123.json'
+        )
+        os.rename(metrics._get_path(self.directory.name), worker_path)
+
+        with mock.patch.object(os, 'kill', side_effect=ProcessLookupError):
+            first = metrics.collect()
+        second = metrics.collect()
+
+        self.assertFalse(os.path.exists(worker_path))
+        for merged in (first, second):
+            self.assertEqual(
+                merged['watcher_dashboard_cache_lookups_total'][
+                    ('catalog', 'miss')
+                ],
+                2,
+            )
+
+    def test_reused_pid_file_folded(self):
+        metrics.CACHE_LOOKUPS.inc(cache='catalog', result='miss')
+        metrics.flush(force=True)
+        # A new worker gets the PID of the exited one.
+        metrics._reset()
+        metrics.CACHE_LOOKUPS.inc(cache='catalog', result='miss')
+        metrics.flush(force=True)
+
+        merged = metrics.collect()
+
+        self.assertEqual(
+            merged['watcher_dashboard_cache_lookups_total'][
+                ('catalog', 'miss')
+            ],
+            2,
+        )
+
+    def test_cache_lookups_survive_clear(self):
+        ttl_cache = cache.TTLCache(name='test-cache')
+        ttl_cache.get('key')
+        ttl_cache.clear()
+        ttl_cache.get('key')
+
+        merged = metrics.collect()
+
+        self.assertEqual(
+            merged['watcher_dashboard_cache_lookups_total'][
+                ('test-cache', 'miss')
+            ],
+            2,
+        )
+
+    def test_unreadable_worker_file_ignored(self):
+        path = os.path.join(self.directory.name, 'watcher-dashboard-1.json')
+        with open(path, 'w') as metrics_file:
+            metrics_file.write('{')
+        metrics.CACHE_LOOKUPS.inc(cache='catalog', result='hit')
+
+        merged = metrics.collect()
+
+        self.assertEqual(
+            merged['watcher_dashboard_cache_lookups_total'][
+                ('catalog', 'hit')
+            ],
+            1,
+        )
+
+    def test_disabled(self):
+        config.get_metrics_enabled.return_value = False
+        metrics.CACHE_LOOKUPS.inc(cache='catalog', result='hit')
+        metrics.flush(force=True)
+
+        self.assertEqual(os.listdir(self.directory.name), [])
+        self.assertEqual(
+            metrics.collect()['watcher_dashboard_cache_lookups_total'], {}
+        )
+
+    def test_endpoint(self):
+        metrics.BATCH_ACTION_OBJECTS.inc(
+            3, action='audits:archive', outcome='success'
+        )
+
+        response = self.client.get('/api/watcher/metrics/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], metrics.CONTENT_TYPE)
+        self.assertIn(
+            b'watcher_dashboard_batch_action_objects_total'
+            b'{action="audits:archive",outcome="success"} 3.0',
+            response.content,
+        )
+
+    def test_endpoint_disabled(self):
+        config.get_metrics_enabled.return_value = False
+
+        response = self.client.get('/api/watcher/metrics/')
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,105 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import types
+
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from watcher_dashboard.common import query
+
+
+API_FIELDS = ('action_plan',)
+FIELDS = ('uuid', 'state', 'action_type', 'description')
+
+
+def _action(uuid, state, action_type, description=None):
+    return types.SimpleNamespace(
+        uuid=uuid,
+        state=state,
+        action_type=action_type,
+        description=description,
+    )
+
+
+ACTIONS = [
+    _action('a1', 'FAILED', 'migrate'),
+    _action('a2', 'FAILED', 'nop'),
+    _action('a3', 'SUCCEEDED', 'resize', 'Resize vm-1'),
+    _action('a4', 'failed', 'resize'),
+]
+
+
+class QueryTests(SimpleTestCase):
+    def _filter(self, text):
+        compiled = query.compile_query(text, API_FIELDS, FIELDS)
+        return [item.uuid for item in compiled.filter(ACTIONS)]
+
+    def test_local_conditions(self):
+        self.assertEqual(
+            self._filter('state=FAILED and action_type in (migrate,resize)'),
+            ['a1', 'a4'],
+        )
+        self.assertEqual(
+            self._filter('state != failed AND action_type not in (nop)'),
+            ['a3'],
+        )
+        self.assertEqual(self._filter("description = 'resize VM-1'"), ['a3'])
+        self.assertEqual(self._filter('description=""'), ['a1', 'a2', 'a4'])
+
+    def test_api_filters(self):
+        compiled = query.compile_query(
+            'action_plan=Plan-1 and state=FAILED', API_FIELDS, FIELDS
+        )
+
+        self.assertEqual(compiled.api_filters, {'action_plan': 'Plan-1'})
+        self.assertEqual(
+            compiled.tests, (('state', frozenset(['failed']), False),)
+        )
+
+    def test_compiled_once(self):
+        self.assertIs(
+            query.compile_query('state=FAILED', API_FIELDS, FIELDS),
+            query.compile_query('state=FAILED', API_FIELDS, FIELDS),
+        )
+
+    @mock.patch.object(query, 'CHUNK_SIZE', 3)
+    def test_filter_in_chunks(self):
+        compiled = query.compile_query('state=failed', API_FIELDS, FIELDS)
+        resources = iter(ACTIONS)
+
+        filtered = compiled.filter(resources)
+
+        self.assertEqual(next(filtered).uuid, 'a1')
+        # Only the first chunk was read.
+        self.assertEqual(next(resources).uuid, 'a4')
+
+    def test_invalid(self):
+        for text in (
+            'state',
+            'state ~ FAILED',
+            'state = FAILED or state = PENDING',
+            'state in FAILED',
+            'state in (FAILED',
+            'state = "FAILED',
+            'action_plan != plan-1',
+            'host = compute-1',
+        ):
+            with self.subTest(text=text):
+                self.assertRaises(
+                    query.QueryError,
+                    query.compile_query,
+                    text,
+                    API_FIELDS,
+                    FIELDS,
+                )
@@ -0,0 +1,76 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from django.test import TestCase
+
+from watcher_dashboard.common import rows
+from watcher_dashboard.content.actions import tables as action_tables
+
+
+class Resource:
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+
+class RowsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.resources = [
+            Resource(uuid=f'uuid-{i}', state='PENDING', input_parameters={})
+            for i in range(3)
+        ]
+        self.loader = mock.Mock(side_effect=lambda uuid: self.resources[0])
+
+    def test_project(self):
+        projected = rows.project(
+            self.resources, ('state', 'action_plan_uuid'), self.loader
+        )
+
+        self.assertEqual(
+            [row.to_dict() for row in projected],
+            [
+                {
+                    'uuid': f'uuid-{i}',
+                    'state': 'PENDING',
+                    'action_plan_uuid': None,
+                }
+                for i in range(3)
+            ],
+        )
+        self.assertFalse(hasattr(projected[0], '__dict__'))
+        # Views may set the projected attributes.
+        projected[0].action_plan_uuid = 'plan'
+        self.loader.assert_not_called()
+
+    def test_lazy_attributes(self):
+        row = rows.project(self.resources, ('state',), self.loader)[0]
+
+        self.assertEqual(row.input_parameters, {})
+        self.assertEqual(row.input_parameters, {})
+        self.loader.assert_called_once_with('uuid-0')
+
+    def test_unknown_attribute(self):
+        row = rows.project(self.resources, ('state',), self.loader)[0]
+
+        self.assertIsNone(getattr(row, 'name', None))
+        self.loader.assert_not_called()
+
+    def test_get_table_fields(self):
+        self.assertEqual(
+            rows.get_table_fields(action_tables.RelatedActionsTable),
+            ('uuid', 'action_type', 'state', 'action_plan_uuid', 'updated_at'),
+        )
@@ -0,0 +1,86 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import types
+
+from django.test import SimpleTestCase
+
+from watcher_dashboard.common import trend
+
+
+def _plan(day, **values):
+    return types.SimpleNamespace(
+        created_at=f'2025-01-{day:02d}T00:00:00',
+        global_efficacy=[
+            {'name': name, 'unit': '%', 'value': value}
+            for name, value in values.items()
+        ],
+    )
+
+
+class TrendTests(SimpleTestCase):
+    def test_rolling_mean(self):
+        self.assertEqual(
+            trend.rolling_mean([1, 2, 3, 4, 5], 2), [1.0, 1.5, 2.5, 3.5, 4.5]
+        )
+
+    def test_build(self):
+        plans = [
+            _plan(3, released=30, unknown=None),
+            _plan(1, released=10),
+            _plan(2, released=20, migrations=4),
+        ]
+
+        result = trend.build(plans, window=2)
+
+        released, migrations = result['indicators']
+        self.assertEqual(
+            released,
+            {
+                'name': 'released',
+                'unit': '%',
+                'count': 3,
+                'min': 10.0,
+                'max': 30.0,
+                'first': 10.0,
+                'last': 30.0,
+                'delta': 20.0,
+                'points': [
+                    ['2025-01-01T00:00:00', 10.0, 10.0, 10.0, 10.0],
+                    ['2025-01-02T00:00:00', 20.0, 15.0, 20.0, 20.0],
+                    ['2025-01-03T00:00:00', 30.0, 25.0, 30.0, 30.0],
+                ],
+            },
+        )
+        self.assertEqual(migrations['count'], 1)
+        self.assertEqual(migrations['delta'], 0.0)
+
+    def test_downsampled(self):
+        plans = [
+            types.SimpleNamespace(
+                created_at=f'{i:04d}',
+                global_efficacy=[{'name': 'released', 'value': i}],
+            )
+            for i in range(1000)
+        ]
+
+        (released,) = trend.build(plans, max_points=100)['indicators']
+
+        self.assertEqual(released['count'], 1000)
+        self.assertEqual(len(released['points']), 100)
+        # The first bucket holds the values 0 to 9.
+        self.assertEqual(released['points'][0], ['0000', 4.5, 7.0, 0.0, 9.0])
+
+    def test_no_efficacy(self):
+        plans = [types.SimpleNamespace(created_at=None, global_efficacy=None)]
+
+        self.assertEqual(trend.build(plans), {'indicators': []})